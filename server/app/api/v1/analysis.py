@@ -1,5 +1,6 @@
 # app/api/v1/analysis.py
 
+import asyncio
 import logging
 from typing import List
 
@@ -7,8 +8,10 @@ from app.core.config import get_settings
 from app.core.dependencies import get_current_user
 from app.schemas.exercise import ExerciseList
 from app.schemas.user import User
-from app.services.body_type_service import BodyTypeService
+from app.services.body_type_batcher import body_type_batcher
+from app.services.body_type_service import body_type_service
 from app.services.exercise_service import ExerciseService
+from app.services.inference_batcher import InferenceQueueFull
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from pydantic import BaseModel
 
@@ -17,10 +20,6 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# 전역 서비스 인스턴스
-body_type_service = BodyTypeService()
-exercise_service = ExerciseService()
-
 
 class BodyTypeAnalysisResponse(BaseModel):
     """체형 분석 응답 모델"""
@@ -43,7 +42,8 @@ class BodyTypeAnalysisResponse(BaseModel):
     description="업로드된 전신 사진을 분석하여 체형을 예측하고 추천 운동을 제공합니다.",
 )
 async def analyze_body_type(
-    file: UploadFile = File(..., description="분석할 전신 사진"), current_user: User = Depends(get_current_user)
+    file: UploadFile = File(..., description="분석할 전신 사진"),
+    current_user: User = Depends(get_current_user),
 ):
     """체형 분석 API"""
 
@@ -60,9 +60,11 @@ async def analyze_body_type(
         # 이미지 파일 읽기
         image_bytes = await file.read()
 
-        # 체형 분석 수행
-        result = body_type_service.analyze_body_type(image_bytes)
+        # 체형 분석 수행 (동시 업로드와 함께 배치 추론, 디코딩/추론은 스레드에서 실행)
+        result = await body_type_batcher.analyze(image_bytes)
 
+        # 추천 운동은 카탈로그 캐시에서 조회
+        exercise_service = ExerciseService()
         recommended_exercises = []
         for exercise_id in [1, 2]:
             try:
@@ -86,6 +88,9 @@ async def analyze_body_type(
             body_type_image_url=body_type_image_url,
         )
 
+    except InferenceQueueFull:
+        logger.warning("Body type analysis queue is full")
+        raise HTTPException(status_code=503, detail="체형 분석 요청이 많습니다. 잠시 후 다시 시도해주세요.")
     except ValueError as e:
         logger.error(f"Body type analysis error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -102,8 +107,9 @@ async def analyze_body_type(
 async def get_supported_body_types():
     """지원하는 체형 유형 조회"""
     try:
-        # 모델의 라벨 정보 반환
-        supported_types = list(body_type_service.model.config.id2label.values())
+        # 모델의 라벨 정보 반환 (모델이 없으면 스레드에서 로드)
+        await asyncio.to_thread(body_type_service.ensure_loaded)
+        supported_types = list(body_type_service.config.id2label.values())
 
         return {
             "supported_body_types": supported_types,
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Body, Depends, HTTPException
 
 from app.core.auth import create_access_token
+from app.core.dependencies import get_user_service
 from app.schemas.user import (
     EmailCheck,
     TokenResponse,
@@ -16,10 +17,6 @@ from app.services.user_service import UserService
 router = APIRouter()
 
 
-def get_user_service() -> UserService:
-    return UserService()
-
-
 # 이메일 회원가입
 @router.post(
     "/signup/email",
@@ -2,11 +2,10 @@
 
 from typing import List
 
-from app.core.database import get_db
+from app.core.http_cache import not_modified_or_tag
 from app.schemas.exercise import ExerciseCategoryBase
 from app.services.category_service import CategoryService
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 router = APIRouter()
 
@@ -17,12 +16,18 @@ router = APIRouter()
     summary="운동 카테고리 목록 조회",
     description="모든 운동 카테고리를 조회합니다.",
 )
-async def get_categories(db: Session = Depends(get_db)):
-    """운동 카테고리 목록 조회"""
+async def get_categories(request: Request, response: Response):
+    """운동 카테고리 목록 조회 (카탈로그 캐시)"""
     category_service = CategoryService()
 
     try:
         categories = await category_service.get_all_categories()
+
+        # 카탈로그가 바뀌지 않았으면 304
+        not_modified = not_modified_or_tag(request, response, f'"{category_service.catalog_etag}"')
+        if not_modified:
+            return not_modified
+
         return categories
 
     except Exception as e:
@@ -2,13 +2,14 @@
 
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.dependencies import get_current_user  # get_optional_current_user 대신 사용
+from app.core.http_cache import not_modified_or_tag
 from app.schemas.exercise import ExerciseDetail, ExerciseLevelList, ExerciseList
 from app.schemas.user import User
 from app.services.exercise_service import ExerciseService
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
@@ -20,12 +21,13 @@ router = APIRouter()
     description="모든 운동의 목록을 조회합니다. 카테고리별 필터링이 가능합니다.",
 )
 async def get_exercises(
+    request: Request,
+    response: Response,
     category_id: int | None = Query(None, description="카테고리 ID로 필터링"),
     search: str | None = Query(None, min_length=1, max_length=50, description="운동명 검색"),
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """전체 운동 목록 조회"""
+    """전체 운동 목록 조회 (카탈로그 캐시)"""
     exercise_service = ExerciseService()
 
     try:
@@ -33,12 +35,48 @@ async def get_exercises(
             category_id=category_id, search=search, user_id=current_user.user_id
         )
 
+        # 카탈로그가 바뀌지 않았으면 304
+        not_modified = not_modified_or_tag(request, response, exercise_service.response_etag())
+        if not_modified:
+            return not_modified
+
         return exercises
 
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"운동 목록 조회 실패: {str(e)}")
 
 
+@router.get(
+    "/autocomplete",
+    response_model=List[ExerciseList],
+    summary="운동 검색 자동완성",
+    description="운동명/카테고리명 자동완성 결과를 관련도 순으로 조회합니다. "
+    "초성 검색(예: ㅅㅋㅌ)과 입력 중인 음절을 지원합니다.",
+)
+async def autocomplete_exercises(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=50, description="검색어"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수"),
+    current_user: User = Depends(get_current_user),
+):
+    """운동 검색 자동완성 (카탈로그 캐시의 검색 색인)"""
+    exercise_service = ExerciseService()
+
+    try:
+        exercises = await exercise_service.autocomplete(q, limit=limit)
+
+        # 카탈로그가 바뀌지 않았으면 304
+        not_modified = not_modified_or_tag(request, response, exercise_service.response_etag())
+        if not_modified:
+            return not_modified
+
+        return exercises
+
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"운동 자동완성 실패: {str(e)}")
+
+
 @router.get(
     "/{exercise_id}",
     response_model=ExerciseDetail,
@@ -46,10 +84,14 @@ async def get_exercises(
     description="특정 운동의 상세 정보와 모든 레벨 정보를 조회합니다.",
 )
 async def get_exercise_detail(
-    exercise_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    exercise_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
 ):
     """특정 운동 상세 정보 조회"""
-    exercise_service = ExerciseService()
+    exercise_service = ExerciseService(db)
 
     try:
         exercise = await exercise_service.get_exercise_detail(exercise_id=exercise_id, user_id=current_user.user_id)
@@ -57,6 +99,11 @@ async def get_exercise_detail(
         if not exercise:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="운동을 찾을 수 없습니다")
 
+        # 카탈로그와 사용자 진행도가 바뀌지 않았으면 304
+        not_modified = not_modified_or_tag(request, response, exercise_service.response_etag(exercise.levels))
+        if not_modified:
+            return not_modified
+
         return exercise
 
     except HTTPException:
@@ -74,10 +121,14 @@ async def get_exercise_detail(
     description="특정 운동의 모든 레벨 정보를 조회합니다.",
 )
 async def get_exercise_levels(
-    exercise_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    exercise_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
 ):
     """운동 레벨 목록 조회"""
-    exercise_service = ExerciseService()
+    exercise_service = ExerciseService(db)
 
     try:
         levels = await exercise_service.get_exercise_levels(exercise_id=exercise_id, user_id=current_user.user_id)
@@ -85,6 +136,11 @@ async def get_exercise_levels(
         if not levels:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="운동 레벨을 찾을 수 없습니다")
 
+        # 카탈로그와 사용자 진행도가 바뀌지 않았으면 304
+        not_modified = not_modified_or_tag(request, response, exercise_service.response_etag(levels))
+        if not_modified:
+            return not_modified
+
         return levels
 
     except HTTPException:
@@ -100,14 +156,19 @@ async def get_exercise_levels(
     description="특정 카테고리의 운동 목록을 조회합니다.",
 )
 async def get_exercises_by_category(
-    category_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    category_id: int, request: Request, response: Response, current_user: User = Depends(get_current_user)
 ):
-    """카테고리별 운동 목록 조회"""
+    """카테고리별 운동 목록 조회 (카탈로그 캐시)"""
     exercise_service = ExerciseService()
 
     try:
         exercises = await exercise_service.get_exercises(category_id=category_id, user_id=current_user.user_id)
 
+        # 카탈로그가 바뀌지 않았으면 304
+        not_modified = not_modified_or_tag(request, response, exercise_service.response_etag())
+        if not_modified:
+            return not_modified
+
         return exercises
 
     except Exception as e:
@@ -1,12 +1,13 @@
 # app/api/v1/home.py
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.dependencies import get_current_user
 from app.schemas.home import HomePageResponse
 from app.schemas.user import User
+from app.services.home_cache import home_cache
 from app.services.home_service import HomeService
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
@@ -17,12 +18,13 @@ router = APIRouter()
     summary="메인페이지 데이터 조회",
     description="최근 운동 3개와 인기 운동을 조회합니다.",
 )
-async def get_home_page_data(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """메인페이지 데이터 조회"""
-    home_service = HomeService()
+async def get_home_page_data(db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    """메인페이지 데이터 조회 (사용자별 캐시, 운동 완료 시 무효화)"""
+    home_service = HomeService(db)
+    user_id = current_user.user_id if current_user else None
 
     try:
-        home_data = await home_service.get_home_page_data(user_id=current_user.user_id if current_user else None)
+        home_data = await home_cache.get(user_id, lambda: home_service.get_home_page_data(user_id=user_id))
 
         return home_data
 
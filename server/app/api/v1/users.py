@@ -3,10 +3,8 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user, get_optional_current_user
+from app.core.dependencies import get_current_user, get_optional_current_user, get_user_service
 from app.schemas.user import User, UserDetail, UserProfileUpdateResponse
 from app.services.user_service import UserService
 
@@ -19,9 +17,10 @@ router = APIRouter()
     summary="내 프로필 조회",
     description="현재 로그인한 사용자의 프로필 정보를 조회합니다. 이메일 등 개인정보도 포함됩니다.",
 )
-async def get_my_profile(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_my_profile(
+    current_user: User = Depends(get_current_user), user_service: UserService = Depends(get_user_service)
+):
     """내 프로필 조회"""
-    user_service = UserService()
 
     try:
         user_detail = await user_service.get_user_detail(current_user.user_id, current_user)
@@ -43,9 +42,9 @@ async def update_my_profile(
     current_password: str | None = Form(None, description="현재 비밀번호 (비밀번호 변경 시 필수)"),
     profile_image_url: UploadFile | None = File(None, description="프로필 이미지 파일"),
     current_user: User = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service),
 ):
     """내 프로필 수정"""
-    user_service = UserService()
 
     try:
         # 비밀번호 변경 시 현재 비밀번호 확인
@@ -95,9 +94,8 @@ async def update_my_profile(
     summary="전체 사용자 조회",
     description="등록된 모든 사용자 목록을 조회합니다.",
 )
-async def get_all_users(db: Session = Depends(get_db)):
+async def get_all_users(user_service: UserService = Depends(get_user_service)):
     """전체 사용자 조회"""
-    user_service = UserService()
 
     try:
         users = await user_service.get_all_users()
@@ -116,9 +114,9 @@ async def get_all_users(db: Session = Depends(get_db)):
 async def get_user_detail(
     user_id: int,
     current_user: User | None = Depends(get_optional_current_user),
+    user_service: UserService = Depends(get_user_service),
 ):
     """사용자 상세 정보 조회"""
-    user_service = UserService()
 
     try:
         user_detail = await user_service.get_user_detail(user_id, current_user)
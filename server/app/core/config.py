@@ -17,6 +17,10 @@ class Settings(BaseSettings):
 
     # 데이터베이스 설정
     database_url: str = Field(description="PostgreSQL 데이터베이스 URL")
+    async_database_url: str | None = Field(
+        default=None, description="async 드라이버 DB URL (미설정 시 database_url을 asyncpg 드라이버로 변환)"
+    )
+    db_max_checkouts_per_request: int = Field(default=1, description="요청당 허용 DB 커넥션 체크아웃 수")
 
     # 인증 설정
     secret_key: str = Field(default="secret-jwt-key", description="JWT 토큰 암호화 키")
@@ -37,6 +41,83 @@ class Settings(BaseSettings):
     # Hugging Face 설정
     hf_token: str = Field(default="", description="Hugging Face 액세스 토큰")
 
+    # 모델 아티팩트 저장소 설정
+    model_store_dir: str = Field(
+        default="./models", description="모델 아티팩트 저장 디렉터리 (아티팩트별 하위 디렉터리 + manifest)"
+    )
+    model_store_verify_checksums: bool = Field(
+        default=True, description="모델 로드 전 manifest의 sha256 검증 여부 (False면 파일 크기만 확인)"
+    )
+    model_store_allow_download: bool = Field(
+        default=True, description="로컬 아티팩트가 없을 때 Hugging Face에서 내려받기 허용 여부"
+    )
+    body_type_model_repo: str = Field(default="glazzova/body_type", description="체형 분석 모델 Hugging Face 저장소")
+    body_type_model_revision: str = Field(
+        default="", description="체형 분석 모델 커밋 해시 (내려받을 때 필수, 브랜치/태그 이름은 허용하지 않음)"
+    )
+
+    # 체형 분석 전처리 설정
+    body_type_fast_preprocess: bool = Field(
+        default=True, description="JPEG 축소 디코딩 + 벡터화 정규화 전처리 사용 여부 (False면 기존 이미지 프로세서)"
+    )
+    body_type_max_image_pixels: int = Field(
+        default=50_000_000, description="체형 분석 업로드 이미지 최대 픽셀 수 (헤더 기준, 초과 시 디코딩하지 않고 거부)"
+    )
+
+    # 체형 분석 추론 모드 설정 (CPU)
+    body_type_inference_mode: str = Field(
+        default="fp32", description="체형 분석 추론 모드 (fp32 / channels_last / int8, GPU에서는 항상 fp32)"
+    )
+    body_type_torch_compile: bool = Field(default=False, description="channels_last 모드에서 torch.compile 사용 여부")
+    body_type_calibration_dir: str = Field(
+        default="./models/body_type_calibration", description="int8 양자화 보정 이미지 디렉터리"
+    )
+    body_type_calibration_images: int = Field(default=64, description="int8 양자화 보정에 사용할 최대 이미지 수")
+
+    # 체형 분석 배치 설정
+    body_type_batch_max_size: int = Field(default=8, description="체형 분석 배치 최대 이미지 수")
+    body_type_batch_max_wait_ms: float = Field(
+        default=20.0, description="체형 분석 배치를 채우기 위해 대기하는 최대 시간(ms)"
+    )
+    body_type_queue_size: int = Field(default=64, description="체형 분석 추론 대기 큐 크기 (초과 요청은 503)")
+
+    # 포즈 분류 모델 설정
+    tflite_pool_size: int = Field(
+        default=0, description="모델별 TFLite 인터프리터 풀 크기 (0이면 pose_batch_concurrency)"
+    )
+    pose_batch_concurrency: int = Field(default=2, description="모델별로 동시에 실행하는 포즈 분류 배치 수")
+    pose_batch_max_size: int = Field(default=32, description="세션 간 포즈 분류 배치 최대 크기")
+    pose_batch_max_wait_ms: float = Field(
+        default=3.0, description="여러 프레임이 몰렸을 때 배치를 채우기 위해 대기하는 최대 시간(ms)"
+    )
+    pose_inference_queue_size: int = Field(default=1024, description="모델별 추론 대기 큐 크기 (초과 프레임은 버림)")
+
+    # 반복 기록 write-behind 설정
+    rep_write_behind: bool = Field(default=True, description="반복 증가를 메모리에 먼저 반영하고 모아서 저장")
+    rep_flush_interval_seconds: float = Field(default=5.0, description="write-behind 주기 flush 간격(초)")
+    rep_flush_max_pending: int = Field(default=10, description="이 개수만큼 이벤트가 쌓이면 즉시 flush")
+
+    # 하트비트 설정
+    heartbeat_flush_interval_seconds: float = Field(default=30.0, description="하트비트 DB 저장 간격(초)")
+
+    # 운동 카탈로그 캐시 설정
+    catalog_version_check_seconds: float = Field(
+        default=30.0, description="카탈로그 버전(app_metadata) 확인 간격(초), 버전이 바뀌면 스냅샷 재적재"
+    )
+
+    # 인기 운동 집계 설정
+    popular_recent_window_days: int = Field(default=7, description="인기 운동 최근 활동 집계 구간(일)")
+
+    # 모델 워밍업 설정
+    model_warmup: str = Field(
+        default="pose",
+        description="시작 후 백그라운드에서 미리 로드할 모델 (쉼표 구분: pose, body_type / 빈 값이면 첫 사용 시 로드)",
+    )
+
+    # 홈 화면 응답 캐시 설정
+    home_cache_ttl_seconds: float = Field(default=60.0, description="사용자별 홈 화면 응답 캐시 유지 시간(초)")
+    home_cache_max_entries: int = Field(default=10000, description="홈 화면 응답 캐시 최대 사용자 수 (LRU 제거)")
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,20 +1,28 @@
 # app/database.py
 
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict
+
 from app.core.config import get_settings
-from sqlalchemy import create_engine
+from app.core.metrics import Histogram
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 # 설정에서 DATABASE_URL 가져오기
 settings = get_settings()
 
-# 엔진 생성
+# 동기 엔진 생성 - 테이블 생성과 초기 데이터 적재 등 시작 단계에서만 사용하므로 작은 풀 유지
 engine = create_engine(
     settings.database_url,
     echo=False,
     pool_pre_ping=True,  # 연결 상태 확인
-    pool_size=20,  # 기본 연결 풀 크기 증가
-    max_overflow=30,  # 추가 연결 수 증가
+    pool_size=5,
+    max_overflow=5,
     pool_timeout=30,  # 연결 대기 시간 증가 (기본 30초)
     pool_recycle=3600,  # 1시간마다 연결 재생성
 )
@@ -22,10 +30,142 @@ engine = create_engine(
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def to_async_database_url(url: str) -> str:
+    """동기 드라이버 URL을 async 드라이버 URL로 변환 (postgresql → postgresql+asyncpg)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    elif backend == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+
+    return parsed.render_as_string(hide_password=False)
+
+
+# async 엔진 생성 - 서비스 계층(운동/소켓/운동목록/홈/사용자)이 사용
+async_engine = create_async_engine(
+    settings.async_database_url or to_async_database_url(settings.database_url),
+    echo=False,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=30,
+    pool_timeout=30,
+    pool_recycle=3600,
+)
+
+# async 세션 팩토리 - 커밋 후 속성 접근 시 지연 로딩이 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base 클래스 생성
 Base = declarative_base()
 
 
+# 커넥션 풀 체크아웃 대기 시간(ms) 히스토그램 버킷
+POOL_CHECKOUT_WAIT_MS_BUCKETS = [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000]
+
+
+class PoolMonitor:
+    """커넥션 풀 사용량 모니터 - 사용 중 커넥션 수와 체크아웃 대기 시간 집계"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.checkout_wait_histogram = Histogram(POOL_CHECKOUT_WAIT_MS_BUCKETS)
+        self.in_use = 0
+        self.peak_in_use = 0
+        self._lock = threading.Lock()
+
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.in_use += 1
+            if self.in_use > self.peak_in_use:
+                self.peak_in_use = self.in_use
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.in_use -= 1
+
+    def observe_checkout_wait(self, seconds: float):
+        self.checkout_wait_histogram.observe(seconds * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        pool = self.engine.pool
+        return {
+            "pool_size": pool.size() if hasattr(pool, "size") else None,
+            "max_overflow": getattr(pool, "_max_overflow", None),
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "checkout_wait_ms": self.checkout_wait_histogram.snapshot(),
+        }
+
+
+# 글로벌 풀 모니터 인스턴스 (서비스 계층이 사용하는 async 엔진의 풀)
+pool_monitor = PoolMonitor(async_engine.sync_engine)
+
+
+class RequestCheckouts:
+    """요청 하나에서 일어난 커넥션 체크아웃 수"""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
+# 현재 요청의 체크아웃 카운터 (track_request_checkouts 블록 안에서만 설정됨)
+_request_checkouts: ContextVar[RequestCheckouts | None] = ContextVar("request_checkouts", default=None)
+
+
+def _on_request_checkout(dbapi_connection, connection_record, connection_proxy):
+    checkouts = _request_checkouts.get()
+    if checkouts is not None:
+        checkouts.count += 1
+
+
+# 동기/async 엔진 모두 집계
+for _engine in (engine, async_engine.sync_engine):
+    event.listen(_engine, "checkout", _on_request_checkout)
+
+
+@contextmanager
+def track_request_checkouts():
+    """블록 안(같은 컨텍스트에서 시작된 태스크 포함)에서 일어난 커넥션 체크아웃 수 집계"""
+    checkouts = RequestCheckouts()
+    token = _request_checkouts.set(checkouts)
+    try:
+        yield checkouts
+    finally:
+        _request_checkouts.reset(token)
+
+
+@asynccontextmanager
+async def session_scope():
+    """작업 단위 async DB 세션 - 블록에 들어갈 때 커넥션을 체크아웃하고 끝나면 즉시 풀에 반환
+
+    WebSocket처럼 오래 유지되는 연결에서는 세션을 연결 수명 동안 들고 있지 말고
+    메시지/이벤트 하나를 처리하는 동안만 이 스코프를 사용한다.
+    """
+    started = time.perf_counter()
+    async with async_engine.connect() as connection:
+        pool_monitor.observe_checkout_wait(time.perf_counter() - started)
+
+        db: AsyncSession
+        async with AsyncSessionLocal(bind=connection) as db:
+            yield db
+
+
+# async 의존성 주입용 함수 - 요청 단위 세션
+# FastAPI가 요청 안에서 의존성 결과를 캐시하므로 같은 요청의 서비스들은 모두 이 세션 하나를 공유하고,
+# 요청 처리가 끝나면 커넥션이 풀에 반환된다.
+async def get_async_db():
+    async with session_scope() as db:
+        yield db
+
+
 # 의존성 주입용 함수
 def get_db():
     db = SessionLocal()
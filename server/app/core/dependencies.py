@@ -3,16 +3,19 @@
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import verify_token
+from app.core.database import get_async_db
 from app.schemas.user import User
 from app.services.user_service import UserService
 
 security = HTTPBearer(auto_error=False)
 
 
-def get_user_service() -> UserService:
-    return UserService()
+def get_user_service(db: AsyncSession = Depends(get_async_db)) -> UserService:
+    """요청 세션을 공유하는 사용자 서비스 (인증과 라우트가 같은 인스턴스를 사용)"""
+    return UserService(db)
 
 
 async def get_current_user(
@@ -0,0 +1,27 @@
+# app/core/http_cache.py
+
+from fastapi import Request, Response, status
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교, 여러 값/* 지원)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified_or_tag(request: Request, response: Response, etag: str) -> Response | None:
+    """클라이언트 캐시가 최신이면 304 응답을, 아니면 응답에 ETag를 붙이고 None 반환"""
+    # 인증된 사용자별 응답이 섞일 수 있으므로 공유 캐시에는 저장하지 않고 매번 재검증
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -1,13 +1,23 @@
 # app/core/init_db.py
 
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import func, insert, text, update
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
 from app.core.database import Base, engine
+from app.models.app_metadata import CATALOG_VERSION_KEY, SEED_FINGERPRINT_KEY, AppMetadataModel
 from app.models.exercise import ExerciseModel
 from app.models.exercise_category import ExerciseCategoryModel
 from app.models.exercise_level import ExerciseLevelModel
+from app.models.exercise_popularity import ExerciseDailyActivityModel, ExercisePopularityModel
 from app.models.user import UserModel
+from app.models.user_exercise import UserExerciseModel
+from app.models.workout_session import WorkoutSessionModel
 
 settings = get_settings()
 
@@ -19,220 +29,346 @@ def init_db():
     print("Database tables created successfully!")
 
 
+def bump_catalog_version(db):
+    """카탈로그 버전 증가 - 실행 중인 워커들은 다음 버전 확인 때 카탈로그 스냅샷을 다시 적재"""
+    metadata = db.get(AppMetadataModel, CATALOG_VERSION_KEY)
+
+    if metadata:
+        metadata.value = str(int(metadata.value) + 1)
+    else:
+        metadata = AppMetadataModel(key=CATALOG_VERSION_KEY, value="1")
+        db.add(metadata)
+
+    db.commit()
+    print(f"Catalog version bumped to {metadata.value}")
+
+
+# 시드 적용 advisory lock 키 (임의의 고정 정수)
+SEED_LOCK_KEY = 731_020_001
+
+# 시드 카탈로그 카테고리
+SEED_CATEGORIES = ["가슴", "등", "어깨", "하체", "복근"]
+
+# 레벨 기본 설정: 3세트, 휴식 10초, 레벨 3까지 (레벨 1: 3회, 레벨 2: 4회, 레벨 3: 5회, 레벨당 10 경험치)
+SEED_LEVEL_COUNT = 3
+
+
+def seed_exercises() -> List[Dict[str, Any]]:
+    """시드 카탈로그 운동 목록"""
+    return [
+        {
+            "name": "푸시업",
+            "calorie": 4.5,
+            "category": "가슴",
+            "thumbnail_url": settings.static_url + "images/exercises/pushup/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/pushup/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/pushup/howto.png",
+        },
+        {
+            "name": "스쿼트",
+            "calorie": 6.0,
+            "category": "하체",
+            "thumbnail_url": settings.static_url + "images/exercises/squat/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/squat/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/squat/howto.png",
+        },
+        {
+            "name": "플랭크",
+            "calorie": 3.0,
+            "category": "복근",
+            "thumbnail_url": settings.static_url + "images/exercises/plank/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/plank/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/plank/howto.png",
+        },
+        {
+            "name": "풀업",
+            "calorie": 8.0,
+            "category": "등",
+            "thumbnail_url": settings.static_url + "images/exercises/pullup/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/pullup/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/pullup/howto.png",
+        },
+        {
+            "name": "런지",
+            "calorie": 5.5,
+            "category": "하체",
+            "thumbnail_url": settings.static_url + "images/exercises/lunge/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/lunge/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/lunge/howto.png",
+        },
+        {
+            "name": "딥스",
+            "calorie": 6.5,
+            "category": "가슴",
+            "thumbnail_url": settings.static_url + "images/exercises/dips/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/dips/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/dips/howto.png",
+        },
+        {
+            "name": "덤벨 로우",
+            "calorie": 4.0,
+            "category": "등",
+            "thumbnail_url": settings.static_url + "images/exercises/dumbbell-row/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/dumbbell-row/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/dumbbell-row/howto.png",
+        },
+        {
+            "name": "덤벨 숄더 프레스",
+            "calorie": 5.0,
+            "category": "어깨",
+            "thumbnail_url": settings.static_url + "images/exercises/dumbbell-shoulder-press/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/dumbbell-shoulder-press/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/dumbbell-shoulder-press/howto.png",
+        },
+        {
+            "name": "덤벨 래터럴 레이즈",
+            "calorie": 3.5,
+            "category": "어깨",
+            "thumbnail_url": settings.static_url + "images/exercises/dumbbell-lateral-raise/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/dumbbell-lateral-raise/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/dumbbell-lateral-raise/howto.png",
+        },
+        {
+            "name": "Ab 휠 롤아웃",
+            "calorie": 7.0,
+            "category": "복근",
+            "thumbnail_url": settings.static_url + "images/exercises/ab-wheel-rollout/thumbnail.png",
+            "target_image_url": settings.static_url + "images/exercises/ab-wheel-rollout/target.png",
+            "howto_image_url": settings.static_url + "images/exercises/ab-wheel-rollout/howto.png",
+        },
+    ]
+
+
+def seed_levels() -> List[Dict[str, Any]]:
+    """시드 카탈로그 운동별 레벨 목록 (모든 운동 공통)"""
+    return [
+        {
+            "level": level,
+            "target_sets": 3,
+            "target_reps": 3 + (level - 1),
+            "rest_seconds": 10,
+            "experience_points": 10 * level,
+        }
+        for level in range(1, SEED_LEVEL_COUNT + 1)
+    ]
+
+
+def seed_fingerprint() -> str:
+    """시드 카탈로그 내용 해시 - DB에 저장된 값과 같으면 시드 적용을 건너뜀"""
+    catalog = {
+        "categories": SEED_CATEGORIES,
+        "exercises": [
+            {**exercise, "levels": seed_levels()} for exercise in seed_exercises()
+        ],
+    }
+    encoded = json.dumps(catalog, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _upsert_rows(db, model, pk_column: str, rows: List[Dict[str, Any]], existing: Dict[Any, Any], key) -> int:
+    """자연 키 기준 bulk upsert - 없는 행은 executemany INSERT 한 번, 값이 다른 행은 PK 기준 bulk UPDATE 한 번"""
+    new_rows = [row for row in rows if key(row) not in existing]
+    changed_rows = [
+        {pk_column: getattr(existing[key(row)], pk_column), **row}
+        for row in rows
+        if key(row) in existing and any(getattr(existing[key(row)], column) != value for column, value in row.items())
+    ]
+
+    if new_rows:
+        db.execute(insert(model), new_rows)
+    if changed_rows:
+        db.execute(update(model), changed_rows)
+
+    return len(new_rows) + len(changed_rows)
+
+
 def init_sample_data():
-    """샘플 데이터 초기화"""
+    """샘플(시드) 데이터 초기화
+
+    시드 카탈로그 내용 해시를 app_metadata에 저장해 두고 같으면 바로 반환한다 (재시작 시 조회 1회).
+    다르면 카테고리/운동/레벨을 종류별로 한 번씩 조회한 뒤 bulk INSERT/UPDATE로 한 트랜잭션에 반영한다.
+    """
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     db = SessionLocal()
 
     try:
-        # 운동 카테고리
-        categories_data = [
-            {"name": "가슴"},
-            {"name": "등"},
-            {"name": "어깨"},
-            {"name": "하체"},
-            {"name": "복근"},
+        fingerprint = seed_fingerprint()
+
+        stored = db.get(AppMetadataModel, SEED_FINGERPRINT_KEY)
+        if stored and stored.value == fingerprint:
+            print("Seed catalog unchanged, skipping sample data")
+            return
+
+        # 여러 워커가 동시에 시작해도 한 곳에서만 시드 적용 (PostgreSQL 트랜잭션 advisory lock, 커밋 시 해제)
+        if engine.dialect.name == "postgresql":
+            db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SEED_LOCK_KEY})
+            db.expire_all()
+            stored = db.get(AppMetadataModel, SEED_FINGERPRINT_KEY)
+            if stored and stored.value == fingerprint:
+                db.commit()
+                print("Seed catalog applied by another worker, skipping sample data")
+                return
+
+        # 1. 카테고리 (이름 기준)
+        existing_categories = {category.name: category for category in db.query(ExerciseCategoryModel).all()}
+        changed = _upsert_rows(
+            db,
+            ExerciseCategoryModel,
+            "category_id",
+            [{"name": name} for name in SEED_CATEGORIES],
+            existing_categories,
+            key=lambda row: row["name"],
+        )
+        category_ids = dict(db.query(ExerciseCategoryModel.name, ExerciseCategoryModel.category_id).all())
+
+        # 2. 운동 (이름 기준)
+        exercise_rows = [
+            {
+                "name": exercise["name"],
+                "calorie": exercise["calorie"],
+                "category_id": category_ids[exercise["category"]],
+                "thumbnail_url": exercise["thumbnail_url"],
+                "target_image_url": exercise["target_image_url"],
+                "howto_image_url": exercise["howto_image_url"],
+            }
+            for exercise in seed_exercises()
+        ]
+        exercise_names = [row["name"] for row in exercise_rows]
+        existing_exercises = {
+            exercise.name: exercise
+            for exercise in db.query(ExerciseModel).filter(ExerciseModel.name.in_(exercise_names)).all()
+        }
+        changed += _upsert_rows(
+            db, ExerciseModel, "exercise_id", exercise_rows, existing_exercises, key=lambda row: row["name"]
+        )
+        exercise_ids = dict(
+            db.query(ExerciseModel.name, ExerciseModel.exercise_id).filter(ExerciseModel.name.in_(exercise_names)).all()
+        )
+
+        # 3. 레벨 ((운동, 레벨) 기준)
+        level_rows = [
+            {"exercise_id": exercise_ids[name], **level} for name in exercise_names for level in seed_levels()
         ]
+        existing_levels = {
+            (level.exercise_id, level.level): level
+            for level in db.query(ExerciseLevelModel)
+            .filter(ExerciseLevelModel.exercise_id.in_(list(exercise_ids.values())))
+            .all()
+        }
+        changed += _upsert_rows(
+            db,
+            ExerciseLevelModel,
+            "level_id",
+            level_rows,
+            existing_levels,
+            key=lambda row: (row["exercise_id"], row["level"]),
+        )
+
+        # 4. 시드 해시 저장 (카탈로그가 바뀌었으면 버전 증가와 함께 한 번에 커밋)
+        if stored:
+            stored.value = fingerprint
+        else:
+            db.add(AppMetadataModel(key=SEED_FINGERPRINT_KEY, value=fingerprint))
 
-        created_categories = {}
-        for category_data in categories_data:
-            # 중복 확인
-            existing = (
-                db.query(ExerciseCategoryModel).filter(ExerciseCategoryModel.name == category_data["name"]).first()
-            )
+        if changed:
+            bump_catalog_version(db)
+        else:
+            db.commit()
 
-            if not existing:
-                category = ExerciseCategoryModel(name=category_data["name"])
-                db.add(category)
-                db.flush()  # ID 생성을 위해 flush
-                created_categories[category_data["name"]] = category.category_id
-                print(f"Created category: {category_data['name']} (ID: {category.category_id})")
-            else:
-                created_categories[category_data["name"]] = existing.category_id
-                print(f"Category already exists: {category_data['name']} (ID: {existing.category_id})")
+        print(
+            f"Seed catalog applied: {len(SEED_CATEGORIES)} categories, {len(exercise_rows)} exercises, "
+            f"{len(level_rows)} levels ({changed} rows inserted/updated)"
+        )
 
-        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Error creating sample data: {e}")
+        raise e
+    finally:
+        db.close()
 
-        exercises_data = [
-            {
-                "name": "푸시업",
-                "calorie": 4.5,
-                "category": "가슴",
-                "thumbnail_url": settings.static_url + "images/exercises/pushup/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/pushup/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/pushup/howto.png",
-            },
-            {
-                "name": "스쿼트",
-                "calorie": 6.0,
-                "category": "하체",
-                "thumbnail_url": settings.static_url + "images/exercises/squat/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/squat/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/squat/howto.png",
-            },
-            {
-                "name": "플랭크",
-                "calorie": 3.0,
-                "category": "복근",
-                "thumbnail_url": settings.static_url + "images/exercises/plank/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/plank/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/plank/howto.png",
-            },
-            {
-                "name": "풀업",
-                "calorie": 8.0,
-                "category": "등",
-                "thumbnail_url": settings.static_url + "images/exercises/pullup/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/pullup/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/pullup/howto.png",
-            },
-            {
-                "name": "런지",
-                "calorie": 5.5,
-                "category": "하체",
-                "thumbnail_url": settings.static_url + "images/exercises/lunge/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/lunge/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/lunge/howto.png",
-            },
-            {
-                "name": "딥스",
-                "calorie": 6.5,
-                "category": "가슴",
-                "thumbnail_url": settings.static_url + "images/exercises/dips/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/dips/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/dips/howto.png",
-            },
-            {
-                "name": "덤벨 로우",
-                "calorie": 4.0,
-                "category": "등",
-                "thumbnail_url": settings.static_url + "images/exercises/dumbbell-row/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/dumbbell-row/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/dumbbell-row/howto.png",
-            },
-            {
-                "name": "덤벨 숄더 프레스",
-                "calorie": 5.0,
-                "category": "어깨",
-                "thumbnail_url": settings.static_url + "images/exercises/dumbbell-shoulder-press/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/dumbbell-shoulder-press/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/dumbbell-shoulder-press/howto.png",
-            },
-            {
-                "name": "덤벨 래터럴 레이즈",
-                "calorie": 3.5,
-                "category": "어깨",
-                "thumbnail_url": settings.static_url + "images/exercises/dumbbell-lateral-raise/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/dumbbell-lateral-raise/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/dumbbell-lateral-raise/howto.png",
-            },
-            {
-                "name": "Ab 휠 롤아웃",
-                "calorie": 7.0,
-                "category": "복근",
-                "thumbnail_url": settings.static_url + "images/exercises/ab-wheel-rollout/thumbnail.png",
-                "target_image_url": settings.static_url + "images/exercises/ab-wheel-rollout/target.png",
-                "howto_image_url": settings.static_url + "images/exercises/ab-wheel-rollout/howto.png",
-            },
+
+def init_exercise_popularity():
+    """운동 인기도 집계 초기화 - 집계 행이 없는 운동만 기존 기록에서 한 번 계산해 채우고 오래된 일별 집계 정리"""
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+
+    try:
+        since = datetime.utcnow().date() - timedelta(days=settings.popular_recent_window_days - 1)
+
+        missing_ids = [
+            row.exercise_id
+            for row in db.query(ExerciseModel.exercise_id)
+            .outerjoin(ExercisePopularityModel, ExercisePopularityModel.exercise_id == ExerciseModel.exercise_id)
+            .filter(ExercisePopularityModel.exercise_id.is_(None))
+            .all()
         ]
 
-        created_exercises = []
-        for i, exercise_data in enumerate(exercises_data, 1):
-            existing = db.query(ExerciseModel).filter(ExerciseModel.name == exercise_data["name"]).first()
-
-            if not existing:
-                category_id = created_categories[exercise_data["category"]]
-                exercise = ExerciseModel(
-                    name=exercise_data["name"],
-                    calorie=exercise_data["calorie"],
-                    category_id=category_id,
-                    thumbnail_url=exercise_data["thumbnail_url"],
-                    target_image_url=exercise_data["target_image_url"],
-                    howto_image_url=exercise_data["howto_image_url"],
+        if missing_ids:
+            # 누적 집계: 운동별 사용자 수 / 세션 수 / 마지막 수행 시각
+            totals = {
+                row.exercise_id: row
+                for row in db.query(
+                    UserExerciseModel.exercise_id,
+                    func.count(UserExerciseModel.user_exercise_id).label("user_count"),
+                    func.coalesce(func.sum(UserExerciseModel.total_sessions), 0).label("session_count"),
+                    func.max(UserExerciseModel.last_performed).label("last_performed"),
                 )
-                db.add(exercise)
-                db.flush()
-                created_exercises.append(exercise)
-                print(
-                    f"Created exercise: {exercise_data['name']} (ID: {exercise.exercise_id}) - Category: {exercise_data['category']}"
+                .filter(UserExerciseModel.exercise_id.in_(missing_ids))
+                .group_by(UserExerciseModel.exercise_id)
+                .all()
+            }
+
+            for exercise_id in missing_ids:
+                total = totals.get(exercise_id)
+                db.add(
+                    ExercisePopularityModel(
+                        exercise_id=exercise_id,
+                        user_count=total.user_count if total else 0,
+                        session_count=total.session_count if total else 0,
+                        last_performed=total.last_performed if total else None,
+                    )
                 )
-            else:
-                created_exercises.append(existing)
-                print(f"Exercise already exists: {exercise_data['name']} (ID: {existing.exercise_id})")
-
-        db.commit()
 
-        # 운동 레벨 데이터 - 기본 설정: 3회 3세트, 휴식 10초, 레벨 3까지
-        for exercise in created_exercises:
-            for level in range(1, 4):  # 레벨 1-3
-                # 중복 확인
-                existing_level = (
-                    db.query(ExerciseLevelModel)
-                    .filter(ExerciseLevelModel.exercise_id == exercise.exercise_id, ExerciseLevelModel.level == level)
-                    .first()
+            # 최근 구간 일별 집계: 완료된 운동 세션 기준
+            activity_date = func.date(WorkoutSessionModel.end_time)
+            daily_rows = (
+                db.query(
+                    WorkoutSessionModel.exercise_id,
+                    activity_date.label("activity_date"),
+                    func.count(WorkoutSessionModel.session_id).label("session_count"),
                 )
-
-                if not existing_level:
-                    # 기본 설정
-                    target_sets = 3
-                    target_reps = 3 + (level - 1)  # 레벨 1: 3회, 레벨 2: 4회, 레벨 3: 5회
-                    rest_seconds = 10
-                    experience_points = 10 * level  # 레벨당 10 경험치
-
-                    exercise_level = ExerciseLevelModel(
-                        exercise_id=exercise.exercise_id,
-                        level=level,
-                        target_sets=target_sets,
-                        target_reps=target_reps,
-                        rest_seconds=rest_seconds,
-                        experience_points=experience_points,
+                .filter(
+                    WorkoutSessionModel.exercise_id.in_(missing_ids),
+                    WorkoutSessionModel.status == "completed",
+                    WorkoutSessionModel.end_time >= datetime.combine(since, datetime.min.time()),
+                )
+                .group_by(WorkoutSessionModel.exercise_id, activity_date)
+                .all()
+            )
+            for row in daily_rows:
+                db.add(
+                    ExerciseDailyActivityModel(
+                        exercise_id=row.exercise_id,
+                        # SQLite의 date()는 문자열을 반환
+                        activity_date=(
+                            date.fromisoformat(row.activity_date)
+                            if isinstance(row.activity_date, str)
+                            else row.activity_date
+                        ),
+                        session_count=row.session_count,
                     )
+                )
 
-                    db.add(exercise_level)
-                    print(
-                        f"Created level {level} for {exercise.name}: {target_sets}세트 x {target_reps}회 (휴식: {rest_seconds}초)"
-                    )
+            print(f"Exercise popularity initialized for {len(missing_ids)} exercises")
 
+        # 집계 구간을 벗어난 일별 집계 삭제
+        db.query(ExerciseDailyActivityModel).filter(ExerciseDailyActivityModel.activity_date < since).delete()
         db.commit()
-        print("Sample data created successfully!")
-
-        # 생성된 데이터 요약 출력
-        print("\n=== 생성된 샘플 데이터 요약 ===")
-        categories_count = db.query(ExerciseCategoryModel).count()
-        exercises_count = db.query(ExerciseModel).count()
-        levels_count = db.query(ExerciseLevelModel).count()
-
-        print(f"카테고리: {categories_count}개")
-        print(f"운동: {exercises_count}개")
-        print(f"운동 레벨: {levels_count}개")
-
-        # 카테고리별 운동 분류 출력
-        print("\n=== 카테고리별 운동 분류 ===")
-        for category_name, category_id in created_categories.items():
-            category_exercises = [ex for ex in created_exercises if ex.category_id == category_id]
-            print(f"\n{category_name} ({len(category_exercises)}개):")
-            for exercise in category_exercises:
-                print(f"  - {exercise.name} (ID: {exercise.exercise_id})")
-
-        # 첫 3개 운동의 레벨 정보 출력
-        print("\n=== 주요 운동별 레벨 정보 ===")
-        for exercise in created_exercises[:3]:
-            levels = (
-                db.query(ExerciseLevelModel)
-                .filter(ExerciseLevelModel.exercise_id == exercise.exercise_id)
-                .order_by(ExerciseLevelModel.level)
-                .all()
-            )
-
-            print(f"\n{exercise.name} (ID: {exercise.exercise_id}, {exercise.calorie} cal/rep):")
-            for level in levels:
-                print(
-                    f"  레벨 {level.level}: {level.target_sets}세트 x {level.target_reps}회 (휴식: {level.rest_seconds}초, 경험치: {level.experience_points})"
-                )
 
     except Exception as e:
         db.rollback()
-        print(f"Error creating sample data: {e}")
+        print(f"Error initializing exercise popularity: {e}")
         raise e
     finally:
         db.close()
@@ -0,0 +1,84 @@
+# app/core/metrics.py
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+
+class Histogram:
+    """버킷 기반 히스토그램 (스레드 안전)
+
+    각 관측값은 자신보다 크거나 같은 첫 번째 버킷 상한에 집계되고,
+    모든 버킷보다 큰 값은 "+Inf" 버킷에 집계된다.
+    """
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """관측값 기록"""
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 집계 결과 반환"""
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total = self._sum
+            maximum = self._max
+
+        buckets = {f"le_{bound:g}": counts[i] for i, bound in enumerate(self.buckets)}
+        buckets["+Inf"] = counts[-1]
+
+        return {
+            "count": count,
+            "avg": round(total / count, 3) if count else 0.0,
+            "max": round(maximum, 3),
+            "buckets": buckets,
+        }
+
+    def reset(self):
+        """집계 초기화"""
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+
+
+class StartupTimings:
+    """앱 시작 단계별 소요 시간 기록 (부팅 시간이 어디에 쓰이는지 확인용)"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """with 블록의 소요 시간을 name 단계로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.phases[name] = round(elapsed_ms, 1)
+            print(f"[startup] {name}: {elapsed_ms:.1f} ms")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"phases_ms": dict(self.phases), "total_ms": round(sum(self.phases.values()), 1)}
+
+
+# 전역 시작 시간 기록 인스턴스
+startup_timings = StartupTimings()
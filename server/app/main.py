@@ -1,29 +1,71 @@
 # app/main.py
 
+import asyncio
+from contextlib import asynccontextmanager
 
 from app.api.v1 import api_router
 from app.core.config import get_settings
-from app.core.database import Base, engine
-from app.core.init_db import init_db, init_sample_data
+from app.core.database import pool_monitor, track_request_checkouts
+from app.core.init_db import init_db, init_exercise_popularity, init_sample_data
+from app.core.metrics import startup_timings
+from app.services.body_type_batcher import body_type_batcher
+from app.services.body_type_service import body_type_service
+from app.services.catalog_cache import catalog_cache
+from app.services.heartbeat_tracker import heartbeat_tracker
+from app.services.home_cache import home_cache
+from app.services.inference_batcher import pose_batcher
+from app.services.live_session import session_progress_writer
+from app.services.model_registry import model_registry
+from app.services.model_warmup import model_warmup
 from app.websockets import workout_socket
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 # 설정 로드
 settings = get_settings()
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
 
-# 데이터베이스 초기화
-init_db()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 훅"""
+    # 모델은 요청 처리를 막지 않도록 백그라운드에서 로드 (아래 DB 초기화와 함께 진행)
+    model_warmup.start()
+
+    # DB 초기화는 import 시점이 아니라 시작 단계에서 실행 (동기 엔진을 쓰므로 스레드에서)
+    # 데이터베이스 테이블 생성
+    with startup_timings.phase("create_tables"):
+        await asyncio.to_thread(init_db)
+
+    # 샘플 데이터 초기화 (시드 해시가 같으면 생략)
+    with startup_timings.phase("seed_catalog"):
+        await asyncio.to_thread(init_sample_data)
+
+    # 인기 운동 집계 초기화
+    with startup_timings.phase("exercise_popularity"):
+        await asyncio.to_thread(init_exercise_popularity)
+
+    # 운동 카탈로그 스냅샷 적재 및 버전 확인 타이머 시작
+    with startup_timings.phase("catalog_snapshot"):
+        await catalog_cache.refresh(force=True)
+    catalog_cache.start()
+    print(f"[startup] total: {startup_timings.get_stats()['total_ms']} ms")
+    yield
+    await model_warmup.stop()
+    await catalog_cache.stop()
+    # 포즈 분류 / 체형 분석 배치 워커 종료
+    await pose_batcher.stop()
+    await body_type_batcher.stop()
+    # write-behind로 남아 있는 반복 수 저장
+    await session_progress_writer.stop()
+    # 메모리에 남은 하트비트 저장
+    await heartbeat_tracker.stop()
 
-# 샘플 데이터 초기화
-init_sample_data()
 
 # FastAPI 앱 생성
 app = FastAPI(
+    lifespan=lifespan,
     title="ww",
     description="Workout Service",
     version="1.0.0",
@@ -45,6 +87,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def count_db_checkouts(request: Request, call_next):
+    """요청별 DB 커넥션 체크아웃 수를 응답 헤더로 노출 (요청당 세션 공유가 깨지면 바로 드러남)"""
+    with track_request_checkouts() as checkouts:
+        response = await call_next(request)
+
+    response.headers["X-DB-Checkouts"] = str(checkouts.count)
+    if checkouts.count > settings.db_max_checkouts_per_request:
+        print(f"DB checkouts per request exceeded: {request.method} {request.url.path} -> {checkouts.count}")
+
+    return response
+
+
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # API v1 라우터 등록
@@ -61,3 +117,49 @@ def read_root():
         "version": "1.0.0",
         "docs": "/docs",
     }
+
+
+@app.get("/models/stats")
+def get_model_stats():
+    """포즈 분류 모델별 인터프리터 풀/메모리/로드 시간 및 배치 통계, 체형 분석 배치 통계"""
+    return {
+        "pool_size": model_registry.pool_size,
+        "models": model_registry.get_stats(),
+        "batching": pose_batcher.get_stats(),
+        "body_type": {**body_type_service.get_status(), "batching": body_type_batcher.get_stats()},
+    }
+
+
+@app.get("/db/stats")
+def get_db_stats():
+    """DB 커넥션 풀 사용 중 커넥션 수 / 체크아웃 대기 시간 통계"""
+    return pool_monitor.get_stats()
+
+
+@app.get("/ready")
+def get_readiness():
+    """준비 상태 - 워밍업 대상 모델 로드 완료 여부와 모델별 로드 상태 (준비 전이면 503)"""
+    models = {name: "loaded" if model_registry.is_loaded(name) else "not_loaded" for name in model_registry.model_paths}
+    models["body_type"] = body_type_service.status
+
+    return JSONResponse(
+        {
+            "ready": model_warmup.is_ready,
+            "warmup": model_warmup.status,
+            "models": models,
+            "body_type_model": body_type_service.get_status(),
+        },
+        status_code=200 if model_warmup.is_ready else 503,
+    )
+
+
+@app.get("/startup/stats")
+def get_startup_stats():
+    """앱 시작 단계별 소요 시간(ms)"""
+    return startup_timings.get_stats()
+
+
+@app.get("/cache/stats")
+def get_cache_stats():
+    """홈 화면 응답 캐시 적중/미스/합류 통계"""
+    return {"home": home_cache.get_stats()}
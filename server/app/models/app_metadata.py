@@ -0,0 +1,23 @@
+# app/models/app_metadata.py
+
+from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+
+# 카탈로그 버전 키 (시드/관리 작업이 카테고리/운동/레벨을 바꾸면 증가)
+CATALOG_VERSION_KEY = "catalog_version"
+
+# 마지막으로 적용한 시드 카탈로그 내용 해시 키
+SEED_FINGERPRINT_KEY = "seed_fingerprint"
+
+
+class AppMetadataModel(Base):
+    """서버 전역 메타데이터 (키-값) - 카탈로그 버전 등"""
+
+    __tablename__ = "app_metadata"
+
+    key = Column(String(100), primary_key=True)
+    value = Column(Text, nullable=False)
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
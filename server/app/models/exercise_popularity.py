@@ -0,0 +1,29 @@
+# app/models/exercise_popularity.py
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+
+
+class ExercisePopularityModel(Base):
+    """운동별 인기도 누적 집계 (운동 완료 시 증분 갱신)"""
+
+    __tablename__ = "exercise_popularity"
+
+    exercise_id = Column(Integer, ForeignKey("exercises.exercise_id"), primary_key=True)
+    user_count = Column(Integer, nullable=False, default=0, comment="이 운동을 한 번 이상 완료한 사용자 수")
+    session_count = Column(Integer, nullable=False, default=0, comment="완료된 운동 세션 수")
+    last_performed = Column(DateTime, nullable=True)
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class ExerciseDailyActivityModel(Base):
+    """운동별 일별 완료 세션 수 (최근 활동 구간 집계용)"""
+
+    __tablename__ = "exercise_daily_activity"
+
+    exercise_id = Column(Integer, ForeignKey("exercises.exercise_id"), primary_key=True)
+    activity_date = Column(Date, primary_key=True, comment="UTC 기준 날짜")
+    session_count = Column(Integer, nullable=False, default=0)
@@ -96,6 +96,7 @@ class WorkoutStartResponse(BaseModel):
 
     message: str = Field(..., description="응답 메시지")
     session_id: int = Field(..., description="생성된 운동 세션 ID")
+    socket_session_id: str | None = Field(None, description="WebSocket 연결에 사용할 소켓 세션 ID")
 
 
 class WorkoutSessionResponse(BaseModel):
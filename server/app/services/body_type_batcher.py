@@ -0,0 +1,170 @@
+# app/services/body_type_batcher.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from app.core.config import get_settings
+from app.core.metrics import Histogram
+from app.services.body_type_service import BodyTypeService, body_type_service
+from app.services.inference_batcher import InferenceQueueFull, collect_batch
+
+settings = get_settings()
+
+# 배치 크기 / 큐 대기 시간(ms) / 배치 forward 시간(ms) / 요청 전체 지연(ms) 히스토그램 버킷
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32]
+QUEUE_WAIT_MS_BUCKETS = [1, 5, 10, 20, 50, 100, 250, 500, 1000]
+INFERENCE_MS_BUCKETS = [10, 25, 50, 100, 250, 500, 1000, 2500]
+LATENCY_MS_BUCKETS = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# (pixel_values, 원본 크기, 결과 future, 요청 시작 시각, enqueue 시각)
+_PendingImage = Tuple[Any, str, asyncio.Future, float, float]
+
+
+class BodyTypeInferenceBatcher:
+    """체형 분석 동적 배처
+
+    업로드 이미지는 요청마다 스레드에서 디코딩/전처리한 뒤 큐에 넣고, 배치 워커가 max_batch장까지 모아
+    전용 추론 스레드에서 한 번의 forward로 처리한다 (혼자 도착한 요청은 대기 없이 바로 처리).
+    forward는 한 번에 하나씩만 실행되므로 실행 중에 도착한 요청은 다음 배치로 모인다.
+    이벤트 루프는 디코딩/추론을 기다리기만 하므로 업로드가 몰려도 다른 요청 처리가 막히지 않는다.
+    """
+
+    def __init__(
+        self,
+        service: BodyTypeService | None = None,
+        max_batch: int | None = None,
+        max_wait_ms: float | None = None,
+        queue_size: int | None = None,
+    ):
+        self.service = service or body_type_service
+        self.max_batch = max_batch or settings.body_type_batch_max_size
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.body_type_batch_max_wait_ms) / 1000
+        self.queue_size = queue_size or settings.body_type_queue_size
+
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self.rejected_requests = 0
+
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_histogram = Histogram(QUEUE_WAIT_MS_BUCKETS)
+        self.inference_histogram = Histogram(INFERENCE_MS_BUCKETS)
+        self.latency_histogram = Histogram(LATENCY_MS_BUCKETS)
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """큐와 배치 워커 태스크 준비 (이벤트 루프에서 최초 호출 시 시작)"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+
+        if self._executor is None:
+            # torch가 연산 내부에서 여러 코어를 쓰므로 forward는 스레드 하나에서 순서대로 실행
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="body-type-infer")
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run_worker(self._queue))
+
+        return self._queue
+
+    async def analyze(self, image_bytes: bytes) -> Dict[str, Any]:
+        """이미지 한 장 체형 분석 - 다른 요청과 함께 배치 처리된 뒤 결과 반환
+
+        대기 큐가 가득 차 있으면 InferenceQueueFull을 발생시킨다.
+        """
+        start_time = time.perf_counter()
+        queue = self._ensure_worker()
+        if queue.full():
+            self.rejected_requests += 1
+            raise InferenceQueueFull("Body type inference queue is full")
+
+        if not self.service.is_loaded:
+            await asyncio.to_thread(self.service.ensure_loaded)
+
+        pixel_values, image_size = await asyncio.to_thread(self.service.preprocess, image_bytes)
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait((pixel_values, image_size, future, start_time, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.rejected_requests += 1
+            raise InferenceQueueFull("Body type inference queue is full")
+
+        result = await future
+        self.latency_histogram.observe((time.perf_counter() - start_time) * 1000)
+        return result
+
+    async def _run_worker(self, queue: asyncio.Queue):
+        """배치 워커 루프 - 배치를 모아 추론 스레드에서 실행하고 결과를 각 요청자에게 분배"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await collect_batch(queue, self.max_batch, self.max_wait)
+
+            now = time.perf_counter()
+            for *_, enqueued_at in batch:
+                self.queue_wait_histogram.observe((now - enqueued_at) * 1000)
+            self.batch_size_histogram.observe(len(batch))
+
+            try:
+                probabilities = await loop.run_in_executor(
+                    self._executor, self._predict_batch, [pixel_values for pixel_values, *_ in batch]
+                )
+            except Exception as e:
+                print(f"Body type batch inference error: {e}")
+                for _, _, future, _, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            finished_at = time.perf_counter()
+            for i, (_, image_size, future, start_time, _) in enumerate(batch):
+                # 연결이 끊겨 취소된 요청은 건너뜀
+                if not future.done():
+                    future.set_result(self.service.build_result(probabilities[i], image_size, finished_at - start_time))
+
+    def _predict_batch(self, pixel_values: List[Any]) -> Any:
+        """전처리된 이미지들을 묶어 한 번의 forward로 추론 - 추론 스레드에서 실행"""
+        import torch
+
+        start_time = time.perf_counter()
+        probabilities = self.service.predict(torch.cat(pixel_values))
+        self.inference_histogram.observe((time.perf_counter() - start_time) * 1000)
+        return probabilities
+
+    def get_stats(self) -> Dict[str, Any]:
+        """배치 크기 / 큐 대기 / forward 시간 / 요청 지연 히스토그램"""
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+            "queue_size": self.queue_size,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "rejected_requests": self.rejected_requests,
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "queue_wait_ms": self.queue_wait_histogram.snapshot(),
+            "inference_ms": self.inference_histogram.snapshot(),
+            "latency_ms": self.latency_histogram.snapshot(),
+        }
+
+    async def stop(self):
+        """배치 워커 종료 (대기 중인 요청은 취소)"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future, _, _ = self._queue.get_nowait()
+                future.cancel()
+
+
+# 전역 체형 분석 배처 인스턴스
+body_type_batcher = BodyTypeInferenceBatcher()
@@ -0,0 +1,144 @@
+# app/services/body_type_inference.py
+#
+# torch를 import하므로 BodyTypeService.load_model 안에서만 import한다.
+
+import bisect
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, List
+
+import torch
+
+from app.services.model_registry import batch_buckets
+
+# 체형 분석 추론 모드
+# - fp32: 기존 fp32 모델 그대로
+# - channels_last: 합성곱에 유리한 NHWC 메모리 배치 (설정에 따라 torch.compile)
+# - int8: 보정 이미지로 정적 int8 양자화(PT2E, x86 Inductor) 후 torch.compile
+INFERENCE_MODES = ("fp32", "channels_last", "int8")
+
+CALIBRATION_IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp")
+
+
+def list_images(directory: str, limit: int | None = None) -> List[Path]:
+    """보정/비교용 이미지 파일 목록 (하위 디렉터리 포함, 이름 순)"""
+    root = Path(directory)
+    if not root.is_dir():
+        return []
+
+    paths = sorted(path for path in root.rglob("*") if path.suffix.lower() in CALIBRATION_IMAGE_SUFFIXES)
+    return paths[:limit] if limit else paths
+
+
+class LogitsModule(torch.nn.Module):
+    """pixel_values -> logits 텐서만 반환하는 래퍼 (export 대상)"""
+
+    def __init__(self, model: Any):
+        super().__init__()
+        self.model = model
+
+    def forward(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        return self.model(pixel_values=pixel_values).logits
+
+
+class EagerRunner:
+    """fp32 / channels_last 추론 (pixel_values [N, C, H, W] -> logits [N, 클래스 수])"""
+
+    def __init__(self, model: Any, channels_last: bool = False, compile_model: bool = False):
+        self.channels_last = channels_last
+        if channels_last:
+            model = model.to(memory_format=torch.channels_last)
+        self.model = LogitsModule(model).eval()
+        self.forward: Callable = torch.compile(self.model) if compile_model else self.model
+
+    def __call__(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        if self.channels_last:
+            pixel_values = pixel_values.contiguous(memory_format=torch.channels_last)
+        return self.forward(pixel_values)
+
+
+class QuantizedRunner:
+    """정적 int8 양자화 추론 (PT2E + X86InductorQuantizer, torch.compile)
+
+    배치 차원을 동적으로 export해 한 번만 양자화하고, 배치 구간(1, 2, 4, ..., batch_size)마다
+    정적 형상으로 미리 컴파일한다.
+    입력은 batch_size 단위로 나누고 각 묶음은 행 수 이상인 가장 작은 구간까지만 0으로 채운다.
+    양자화가 끝나면 원본 fp32 모델을 참조하지 않으므로 호출자가 놓으면 fp32 가중치는 메모리에서 해제된다.
+    """
+
+    def __init__(self, model: Any, calibration_inputs: List[torch.Tensor], batch_size: int):
+        import torch._inductor.config as inductor_config
+        import torch.ao.quantization.quantizer.x86_inductor_quantizer as xiq
+        from torch.ao.quantization.quantize_pt2e import convert_pt2e, prepare_pt2e
+
+        if not calibration_inputs:
+            raise ValueError("int8 quantization needs calibration images")
+
+        self.batch_size = batch_size
+        self.bucket_sizes = batch_buckets(batch_size)
+        batches = self._calibration_batches(torch.cat(calibration_inputs))
+
+        # torch 2.9부터 export_for_training은 export로 통합됨
+        export = getattr(torch.export, "export_for_training", torch.export.export)
+        # 배치 차원만 동적 (batch_size가 1이면 고정 형상)
+        dynamic_shapes = ({0: torch.export.Dim("batch", max=batch_size)},) if batch_size > 1 else None
+
+        # 양자화된 가중치를 상수로 접어 int8 커널을 바로 쓰도록 함 (Inductor 양자화 권장 설정)
+        # 전역 설정을 바꾸지 않도록 export/컴파일하는 동안에만 켬 - 구간별 컴파일이 모두 이 안에서 끝남
+        with torch.no_grad(), inductor_config.patch(freezing=True):
+            exported = export(LogitsModule(model).eval(), (batches[0],), dynamic_shapes=dynamic_shapes).module()
+            quantizer = xiq.X86InductorQuantizer()
+            quantizer.set_global(xiq.get_default_x86_inductor_quantization_config())
+
+            # 보정: 관측기로 활성값 범위 수집
+            prepared = prepare_pt2e(exported, quantizer)
+            for batch in batches:
+                prepared(batch)
+
+            converted = convert_pt2e(prepared)
+            torch.ao.quantization.move_exported_model_to_eval(converted)
+            self.forward: Callable = torch.compile(converted, dynamic=False)
+
+            # 구간별로 한 번씩 실행해 컴파일 (첫 요청이 컴파일 시간을 부담하지 않음)
+            for bucket in self.bucket_sizes:
+                self.forward(batches[0][:bucket])
+
+    def _calibration_batches(self, inputs: torch.Tensor) -> List[torch.Tensor]:
+        """보정 입력을 batch_size 단위로 묶음 (모자란 묶음은 앞 이미지를 반복해 채움)"""
+        batches = []
+        for start in range(0, inputs.shape[0], self.batch_size):
+            batch = inputs[start : start + self.batch_size]
+            if batch.shape[0] < self.batch_size:
+                repeat = -(-self.batch_size // inputs.shape[0])
+                batch = torch.cat([batch, inputs.repeat(repeat, 1, 1, 1)])[: self.batch_size]
+            batches.append(batch)
+        return batches
+
+    def bucket_for(self, rows: int) -> int:
+        """rows 이상인 가장 작은 배치 구간"""
+        return self.bucket_sizes[bisect.bisect_left(self.bucket_sizes, rows)]
+
+    def __call__(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        outputs = []
+        for start in range(0, pixel_values.shape[0], self.batch_size):
+            chunk = pixel_values[start : start + self.batch_size]
+            rows = chunk.shape[0]
+            bucket = self.bucket_for(rows)
+            if rows < bucket:
+                chunk = torch.cat([chunk, chunk.new_zeros((bucket - rows, *chunk.shape[1:]))])
+            outputs.append(self.forward(chunk)[:rows])
+        return torch.cat(outputs)
+
+
+def build_runner(
+    model: Any, mode: str, calibration_inputs: Callable[[], List[torch.Tensor]], batch_size: int, compile_model: bool
+) -> Callable[[torch.Tensor], torch.Tensor]:
+    """추론 모드에 맞는 실행기 생성 (보정 이미지는 int8 모드에서만 읽음)"""
+    if mode == "fp32":
+        return EagerRunner(model)
+    if mode == "channels_last":
+        return EagerRunner(model, channels_last=True, compile_model=compile_model)
+    if mode == "int8":
+        return QuantizedRunner(model, calibration_inputs(), batch_size)
+
+    raise ValueError(f"Unknown body type inference mode: {mode} (expected one of {', '.join(INFERENCE_MODES)})")
@@ -1,77 +1,159 @@
 # app/services/body_type_service.py
 
-import io
-import os
+import threading
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
-import torch
-from huggingface_hub import login
-from PIL import Image
-from transformers import AutoImageProcessor, ResNetForImageClassification
+import numpy as np
 
 from app.core.config import get_settings
+from app.services.model_store import model_store
+from app.utils.image_processing import FastImagePreprocessor, open_image_checked
 
 settings = get_settings()
 
 
 class BodyTypeService:
-    """체형 분석 서비스"""
+    """체형 분석 서비스
 
-    def __init__(self):
+    torch/transformers는 무겁기 때문에 모듈 import 시점이 아니라 첫 모델 로드 때 import한다.
+    체형 분석 요청을 받지 않는 워커는 torch를 로드하지 않는다.
+    """
+
+    def __init__(self, inference_mode: str | None = None):
         self.processor = None
-        self.model = None
+        # 프로세서 설정으로 만든 빠른 전처리 (지원하지 않는 설정이거나 비활성화면 None)
+        self.fast_preprocessor: FastImagePreprocessor | None = None
+        # 모델 설정 (라벨 등) / pixel_values -> logits 실행기
+        self.config = None
+        self.runner = None
         self.hf_token = settings.hf_token
-        self.load_model()
+        # 요청한 추론 모드 / 실제 적용된 모드 (양자화 준비에 실패하면 fp32)
+        self.inference_mode = inference_mode or settings.body_type_inference_mode
+        self.active_inference_mode: str | None = None
+        # 로드 상태: not_loaded / loading / loaded / failed
+        self.status = "not_loaded"
+        self.error: str | None = None
+        self.load_time_seconds: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.runner is not None
+
+    def ensure_loaded(self):
+        """모델이 없으면 로드 (스레드 안전, 동시에 호출돼도 한 번만 로드)"""
+        if self.runner is not None:
+            return
+
+        with self._lock:
+            if self.runner is None:
+                self.load_model()
 
     def load_model(self):
-        """Hugging Face 토큰을 사용하여 모델 로드"""
-        try:
-            print("Loading body type classification model with HF token...")
-
-            # Hugging Face 토큰으로 로그인
-            login(token=self.hf_token)
-            print("Successfully logged in to Hugging Face")
-
-            model_name = "glazzova/body_type"
+        """로컬 아티팩트 저장소에서 모델 로드 (아티팩트가 없을 때만 내려받기)"""
+        self.status = "loading"
+        start_time = time.perf_counter()
 
-            # 로컬 경로가 있으면 로컬에서, 없으면 토큰으로 다운로드
-            local_model_path = "./models/body_type"
+        try:
+            print("Loading body type classification model...")
 
-            if os.path.exists(local_model_path):
-                print(f"Loading from local path: {local_model_path}")
+            import torch
+            from transformers import AutoImageProcessor, ResNetForImageClassification
 
-                self.processor = AutoImageProcessor.from_pretrained(
-                    local_model_path, local_files_only=True, use_fast=False
-                )
+            model_path = model_store.ensure("body_type", token=self.hf_token or None)
+            # safetensors 가중치는 메모리 매핑으로 읽음
+            has_safetensors = any(model_path.glob("*.safetensors"))
+            print(f"Loading from local path: {model_path}")
 
-                self.model = ResNetForImageClassification.from_pretrained(local_model_path, local_files_only=True)
-            else:
-                print(f"Downloading from Hugging Face: {model_name}")
+            processor = AutoImageProcessor.from_pretrained(model_path, local_files_only=True, use_fast=False)
 
-                self.processor = AutoImageProcessor.from_pretrained(model_name, token=self.hf_token, use_fast=False)
+            model = ResNetForImageClassification.from_pretrained(
+                model_path, local_files_only=True, use_safetensors=has_safetensors or None
+            )
 
-                self.model = ResNetForImageClassification.from_pretrained(model_name, token=self.hf_token)
+            # 보정 이미지 전처리에 필요하므로 실행기보다 먼저 설정
+            self.processor = processor
+            if settings.body_type_fast_preprocess:
+                self.fast_preprocessor = FastImagePreprocessor.from_processor(processor)
+            self.config = model.config
 
+            mode = self.inference_mode
             if torch.cuda.is_available():
-                self.model = self.model.cuda()
+                model = model.cuda()
+                # channels_last / int8은 CPU 전용 모드
+                mode = "fp32"
                 print("Model loaded on GPU")
             else:
                 print("Model loaded on CPU")
 
-            print("✅ Model loaded successfully")
-            print(f"Model classes: {self.model.config.id2label}")
+            # 실행기는 준비가 끝난 뒤에 공개 (다른 스레드가 반쯤 로드된 모델을 보지 않도록)
+            self.runner, self.active_inference_mode = self._build_runner(model, mode)
+            self.load_time_seconds = time.perf_counter() - start_time
+            self.status = "loaded"
+
+            print(f"✅ Model loaded successfully in {self.load_time_seconds:.2f}s ({self.active_inference_mode})")
+            print(f"Model classes: {self.config.id2label}")
 
         except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
             print(f"Failed to load model: {e}")
             raise
 
-    def analyze_body_type(self, image_bytes: bytes) -> Dict[str, Any]:
-        """체형 분석 수행"""
-        start_time = time.time()
+    def _build_runner(self, model: Any, mode: str) -> Tuple[Any, str]:
+        """추론 모드 실행기 생성 (fp32 외 모드 준비에 실패하면 fp32로 대체)"""
+        from app.services.body_type_inference import build_runner
+
+        def build(build_mode: str):
+            return build_runner(
+                model,
+                build_mode,
+                self._calibration_inputs,
+                batch_size=settings.body_type_batch_max_size,
+                compile_model=settings.body_type_torch_compile,
+            )
+
+        try:
+            return build(mode), mode
+        except Exception as e:
+            if mode == "fp32":
+                raise
+            print(f"Body type inference mode '{mode}' unavailable, falling back to fp32: {e}")
+            return build("fp32"), "fp32"
+
+    def _calibration_inputs(self) -> List[Any]:
+        """int8 양자화 보정용 이미지 전처리 결과"""
+        from app.services.body_type_inference import list_images
+
+        paths = list_images(settings.body_type_calibration_dir, settings.body_type_calibration_images)
+        print(f"Calibrating with {len(paths)} images from {settings.body_type_calibration_dir}")
+        return [self.preprocess(path.read_bytes())[0] for path in paths]
 
-        # 바이트를 PIL Image로 변환
-        image = Image.open(io.BytesIO(image_bytes))
+    def get_status(self) -> Dict[str, Any]:
+        """모델 로드 상태"""
+        return {
+            "status": self.status,
+            "inference_mode": self.inference_mode,
+            "active_inference_mode": self.active_inference_mode,
+            "load_time_ms": round(self.load_time_seconds * 1000, 2) if self.load_time_seconds is not None else None,
+            "error": self.error,
+        }
+
+    def preprocess(self, image_bytes: bytes) -> Tuple[Any, str]:
+        """이미지 디코딩 + 전처리 -> (pixel_values 텐서 [1, C, H, W], 원본 크기 문자열)"""
+        import torch
+
+        # 헤더만 읽어 해상도 확인 (디코딩 전)
+        image = open_image_checked(image_bytes, settings.body_type_max_image_pixels)
+        image_size = f"{image.width}x{image.height}"
+
+        if self.fast_preprocessor is not None:
+            # 축소 디코딩 후 미리 할당한 텐서에 바로 정규화
+            size = self.fast_preprocessor.size
+            pixel_values = torch.empty((1, 3, size, size), dtype=torch.float32)
+            self.fast_preprocessor(image, out=pixel_values.numpy()[0])
+            return pixel_values, image_size
 
         # RGB로 변환
         if image.mode != "RGB":
@@ -79,34 +161,46 @@ class BodyTypeService:
 
         # 이미지 전처리
         inputs = self.processor(image, return_tensors="pt")
+        return inputs["pixel_values"], image_size
+
+    def predict(self, pixel_values: Any) -> np.ndarray:
+        """전처리된 배치 [N, C, H, W] 한 번의 forward로 클래스별 확률 [N, 클래스 수] 계산"""
+        import torch
 
         # GPU로 이동 (사용 가능한 경우)
         if torch.cuda.is_available():
-            inputs = {k: v.cuda() for k, v in inputs.items()}
+            pixel_values = pixel_values.cuda()
 
         # 예측 수행
         with torch.no_grad():
-            logits = self.model(**inputs).logits
-
-        # 결과 처리
-        predicted_label = logits.argmax(-1).item()
-        body_type = self.model.config.id2label[predicted_label]
+            logits = self.runner(pixel_values)
 
         # 모든 클래스별 확률 계산
-        probabilities = torch.nn.functional.softmax(logits, dim=-1)
-
-        # 모든 클래스별 확률을 딕셔너리로 변환
-        all_predictions = {}
-        for idx, prob in enumerate(probabilities[0]):
-            class_name = self.model.config.id2label[idx]
-            all_predictions[class_name] = float(prob.cpu().item())
+        return torch.nn.functional.softmax(logits, dim=-1).cpu().numpy()
 
-        elapsed_time = time.time() - start_time
+    def build_result(self, probabilities: np.ndarray, image_size: str, elapsed_time: float) -> Dict[str, Any]:
+        """이미지 한 장의 클래스별 확률을 응답 형태로 변환"""
+        predicted_label = int(probabilities.argmax())
+        id2label = self.config.id2label
 
         return {
-            "predicted_body_type": body_type,
-            "confidence": float(probabilities[0][predicted_label].cpu().item()),
-            "all_predictions": all_predictions,
+            "predicted_body_type": id2label[predicted_label],
+            "confidence": float(probabilities[predicted_label]),
+            "all_predictions": {id2label[idx]: float(prob) for idx, prob in enumerate(probabilities)},
             "processing_time_seconds": round(elapsed_time, 3),
-            "image_size": f"{image.width}x{image.height}",
+            "image_size": image_size,
         }
+
+    def analyze_body_type(self, image_bytes: bytes) -> Dict[str, Any]:
+        """체형 분석 수행 (이미지 한 장, 모델이 없으면 먼저 로드)"""
+        self.ensure_loaded()
+
+        start_time = time.time()
+        pixel_values, image_size = self.preprocess(image_bytes)
+        probabilities = self.predict(pixel_values)
+
+        return self.build_result(probabilities[0], image_size, time.time() - start_time)
+
+
+# 전역 체형 분석 서비스 인스턴스 (모델은 첫 사용 또는 워밍업 때 로드)
+body_type_service = BodyTypeService()
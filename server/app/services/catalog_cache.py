@@ -0,0 +1,187 @@
+# app/services/catalog_cache.py
+
+import asyncio
+import hashlib
+import json
+from typing import Dict, List
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.core.config import get_settings
+from app.core.database import session_scope
+from app.models.app_metadata import CATALOG_VERSION_KEY, AppMetadataModel
+from app.models.exercise import ExerciseModel
+from app.models.exercise_category import ExerciseCategoryModel
+from app.models.exercise_level import ExerciseLevelModel
+from app.schemas.exercise import ExerciseCategoryBase, ExerciseDetail, ExerciseLevelList, ExerciseList
+from app.services.search_index import ExerciseSearchIndex
+
+settings = get_settings()
+
+
+class CatalogSnapshot:
+    """운동 카탈로그 스냅샷 (읽기 전용, 갱신 시 통째로 교체)"""
+
+    __slots__ = ("version", "etag", "categories", "exercises", "exercise_by_id", "details", "levels", "search_index")
+
+    def __init__(
+        self,
+        version: str,
+        categories: List[ExerciseCategoryBase],
+        exercises: List[ExerciseList],
+        details: Dict[int, ExerciseDetail],
+        levels: Dict[int, List[ExerciseLevelList]],
+    ):
+        self.version = version
+        self.categories = categories
+        self.exercises = exercises
+        self.exercise_by_id = {exercise.exercise_id: exercise for exercise in exercises}
+        self.details = details
+        self.levels = levels
+        # 운동명/카테고리명 검색 색인 (스냅샷과 함께 재생성)
+        self.search_index = ExerciseSearchIndex(exercises)
+        self.etag = self._content_hash()
+
+    def _content_hash(self) -> str:
+        """내용 기반 해시 - 워커 프로세스가 달라도 같은 카탈로그면 같은 ETag"""
+        payload = {
+            "categories": [category.model_dump() for category in self.categories],
+            "details": [self.details[exercise.exercise_id].model_dump() for exercise in self.exercises],
+            "levels": {
+                exercise_id: [level.model_dump() for level in levels] for exercise_id, levels in self.levels.items()
+            },
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode()
+        return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+class CatalogCache:
+    """프로세스 전역 운동 카탈로그 캐시
+
+    카테고리/운동/레벨은 시드 데이터라 거의 바뀌지 않으므로 한 번 적재한 스냅샷을 메모리에서 제공한다.
+    백그라운드 타이머가 check_seconds마다 app_metadata의 카탈로그 버전만 PK로 조회해 바뀌었으면 다시 적재하므로
+    요청 처리 중에는 카탈로그 때문에 DB에 접근하지 않는다.
+    """
+
+    def __init__(self, check_seconds: float | None = None):
+        self.check_seconds = check_seconds if check_seconds is not None else settings.catalog_version_check_seconds
+        self._snapshot: CatalogSnapshot | None = None
+        self._stale = False
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def get(self) -> CatalogSnapshot:
+        """현재 스냅샷 (아직 적재 전이거나 invalidate된 경우에만 요청 안에서 적재)"""
+        if self._snapshot is None or self._stale:
+            await self.refresh()
+        return self._snapshot
+
+    async def refresh(self, force: bool = False):
+        """카탈로그 버전을 확인하고 바뀌었으면 (또는 force면) 스냅샷 재적재"""
+        async with self._lock:
+            async with session_scope() as db:
+                version = await self._read_version(db)
+                if force or self._snapshot is None or self._snapshot.version != version:
+                    self._snapshot = await self._load(db, version)
+                    print(f"Catalog snapshot loaded: version {version}, etag {self._snapshot.etag}")
+
+            self._stale = False
+
+    def invalidate(self):
+        """다음 조회 때 버전을 다시 확인하도록 표시"""
+        self._stale = True
+
+    def start(self):
+        """버전 확인 타이머 시작 (앱 시작 시)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        """주기 버전 확인 타이머"""
+        while True:
+            await asyncio.sleep(self.check_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Catalog version check error: {e}")
+
+    async def stop(self):
+        """타이머 종료 (앱 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def bump_version(self, db: AsyncSession):
+        """카탈로그 버전 증가 (이 프로세스는 다음 조회 때, 다른 워커는 다음 확인 주기에 재적재)"""
+        version = int(await self._read_version(db)) + 1
+        result = await db.execute(
+            update(AppMetadataModel).where(AppMetadataModel.key == CATALOG_VERSION_KEY).values(value=str(version))
+        )
+        if result.rowcount == 0:
+            db.add(AppMetadataModel(key=CATALOG_VERSION_KEY, value=str(version)))
+        await db.commit()
+        self.invalidate()
+
+    async def _read_version(self, db: AsyncSession) -> str:
+        value = await db.scalar(select(AppMetadataModel.value).where(AppMetadataModel.key == CATALOG_VERSION_KEY))
+        return value or "0"
+
+    async def _load(self, db: AsyncSession, version: str) -> CatalogSnapshot:
+        """카테고리/운동/레벨 전체 조회 후 스냅샷 생성"""
+        categories = (
+            (await db.execute(select(ExerciseCategoryModel).order_by(ExerciseCategoryModel.name))).scalars().all()
+        )
+        exercises = (
+            (
+                await db.execute(
+                    select(ExerciseModel).options(joinedload(ExerciseModel.category)).order_by(ExerciseModel.name)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        levels = (
+            (
+                await db.execute(
+                    select(ExerciseLevelModel).order_by(ExerciseLevelModel.exercise_id, ExerciseLevelModel.level)
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        levels_by_exercise: Dict[int, List[ExerciseLevelList]] = {}
+        for level in levels:
+            levels_by_exercise.setdefault(level.exercise_id, []).append(ExerciseLevelList.model_validate(level))
+
+        # 상세의 levels는 사용자 진행도에 따라 요청마다 채움
+        details = {
+            exercise.exercise_id: ExerciseDetail(
+                exercise_id=exercise.exercise_id,
+                name=exercise.name,
+                calorie=exercise.calorie,
+                thumbnail_url=exercise.thumbnail_url,
+                target_image_url=exercise.target_image_url,
+                howto_image_url=exercise.howto_image_url,
+                category=ExerciseCategoryBase.model_validate(exercise.category),
+            )
+            for exercise in exercises
+        }
+
+        return CatalogSnapshot(
+            version=version,
+            categories=[ExerciseCategoryBase.model_validate(category) for category in categories],
+            exercises=[ExerciseList.model_validate(exercise) for exercise in exercises],
+            details=details,
+            levels=levels_by_exercise,
+        )
+
+
+# 전역 카탈로그 캐시 인스턴스
+catalog_cache = CatalogCache()
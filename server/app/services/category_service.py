@@ -2,20 +2,20 @@
 
 from typing import List
 
-from app.core.database import get_db
-from app.models.exercise_category import ExerciseCategoryModel
 from app.schemas.exercise import ExerciseCategoryBase
+from app.services.catalog_cache import catalog_cache
 
 
 class CategoryService:
-    """카테고리 관련 서비스"""
+    """카테고리 관련 서비스 - 카탈로그 메모리 스냅샷에서 조회"""
 
     def __init__(self):
-        self.db = next(get_db())
+        # 마지막으로 사용한 카탈로그 스냅샷의 ETag (응답 ETag 계산용)
+        self.catalog_etag: str | None = None
 
     async def get_all_categories(self) -> List[ExerciseCategoryBase]:
         """모든 카테고리 조회"""
+        snapshot = await catalog_cache.get()
+        self.catalog_etag = snapshot.etag
 
-        categories = self.db.query(ExerciseCategoryModel).order_by(ExerciseCategoryModel.name).all()
-
-        return [ExerciseCategoryBase.from_orm(category) for category in categories]
+        return list(snapshot.categories)
@@ -2,101 +2,78 @@
 
 from typing import Any, Dict, List
 
-from app.core.database import get_db
-from app.models.exercise import ExerciseModel
-from app.models.exercise_category import ExerciseCategoryModel
-from app.models.exercise_level import ExerciseLevelModel
 from app.models.user_exercise import UserExerciseModel
 from app.schemas.exercise import ExerciseDetail, ExerciseLevelList, ExerciseList
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import joinedload
+from app.services.catalog_cache import CatalogSnapshot, catalog_cache
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class ExerciseService:
-    """운동 관련 서비스"""
+    """운동 관련 서비스 - 카탈로그는 메모리 스냅샷에서, 사용자 진행도만 DB에서 조회"""
 
-    def __init__(self):
-        self.db = next(get_db())
+    def __init__(self, db: AsyncSession | None = None):
+        # 카탈로그만 조회하는 경우 DB 세션 없이 생성 가능
+        self.db = db
+        # 마지막으로 사용한 카탈로그 스냅샷의 ETag (응답 ETag 계산용)
+        self.catalog_etag: str | None = None
+
+    async def _get_catalog(self) -> CatalogSnapshot:
+        snapshot = await catalog_cache.get()
+        self.catalog_etag = snapshot.etag
+        return snapshot
+
+    def response_etag(self, levels: List[ExerciseLevelList] | None = None) -> str:
+        """응답 ETag - 카탈로그 해시 + (레벨 포함 응답이면) 잠금/완료 레벨 수로 사용자 진행도 반영"""
+        if levels is None:
+            return f'"{self.catalog_etag}"'
+
+        locked = sum(1 for level in levels if level.is_locked)
+        completed = sum(1 for level in levels if level.is_completed)
+        return f'"{self.catalog_etag}-{locked}-{completed}"'
 
     async def get_exercises(
         self, category_id: int | None = None, search: str | None = None, user_id: int | None = None
     ) -> List[ExerciseList]:
         """운동 목록 조회"""
+        snapshot = await self._get_catalog()
 
-        query = self.db.query(ExerciseModel).options(joinedload(ExerciseModel.category))
-
-        filters = []
+        # 검색어가 있으면 검색 색인의 순위 순, 없으면 이름 순
+        exercises = snapshot.search_index.search(search) if search else snapshot.exercises
 
         if category_id:
-            filters.append(ExerciseModel.category_id == category_id)
-
-        if search:
-            filters.append(
-                or_(
-                    ExerciseModel.name.ilike(f"%{search}%"),
-                    ExerciseModel.category.has(ExerciseCategoryModel.name.ilike(f"%{search}%")),
-                )
-            )
-
-        if filters:
-            query = query.filter(and_(*filters))
+            exercises = [exercise for exercise in exercises if exercise.category.category_id == category_id]
 
-        exercises = query.order_by(ExerciseModel.name).all()
+        return list(exercises)
 
-        exercises_list = []
-        for exercise in exercises:
-            exercise_data = ExerciseList.from_orm(exercise)
-            exercises_list.append(exercise_data)
+    async def autocomplete(self, query: str, limit: int = 10) -> List[ExerciseList]:
+        """운동명/카테고리명 자동완성 (초성, 입력 중인 음절 포함)"""
+        snapshot = await self._get_catalog()
 
-        return exercises_list
+        return snapshot.search_index.search(query, limit=limit)
 
     async def get_exercise_detail(self, exercise_id: int, user_id: int) -> ExerciseDetail | None:
         """운동 상세 정보 조회"""
+        snapshot = await self._get_catalog()
 
-        exercise = (
-            self.db.query(ExerciseModel)
-            .options(joinedload(ExerciseModel.category), joinedload(ExerciseModel.levels))
-            .filter(ExerciseModel.exercise_id == exercise_id)
-            .first()
-        )
+        exercise_detail = snapshot.details.get(exercise_id)
 
-        if not exercise:
+        if not exercise_detail:
             return None
 
-        exercise_detail = ExerciseDetail.from_orm(exercise)
-
-        # 레벨 정보 정렬 및 잠금/완료 상태 설정
-        sorted_levels = sorted(exercise.levels, key=lambda x: x.level)
-
         # 사용자 진행도 조회
         user_progress = await self._get_user_exercise_progress(user_id, exercise_id)
 
-        # 각 레벨의 잠금/완료 상태 설정
-        levels_with_status = []
-        for level in sorted_levels:
-            level_data = ExerciseLevelList.from_orm(level)
-
-            current_level = user_progress.get("current_level", 1)
-            highest_completed = user_progress.get("highest_completed_level", 0)
-
-            level_data.is_locked = level.level > current_level
-            level_data.is_completed = level.level <= highest_completed
-
-            levels_with_status.append(level_data)
+        # 레벨별 잠금/완료 상태 설정 (스냅샷은 공유되므로 복사본에 설정)
+        levels_with_status = self._levels_with_status(snapshot.levels.get(exercise_id, []), user_progress)
 
-        exercise_detail.levels = levels_with_status
-
-        return exercise_detail
+        return exercise_detail.model_copy(update={"levels": levels_with_status})
 
     async def get_exercise_levels(self, exercise_id: int, user_id: int) -> List[ExerciseLevelList]:
         """운동 레벨 목록 조회"""
+        snapshot = await self._get_catalog()
 
-        levels = (
-            self.db.query(ExerciseLevelModel)
-            .filter(ExerciseLevelModel.exercise_id == exercise_id)
-            .order_by(ExerciseLevelModel.level)
-            .all()
-        )
+        levels = snapshot.levels.get(exercise_id)
 
         if not levels:
             return []
@@ -104,29 +81,34 @@ class ExerciseService:
         # 사용자 진행도 조회
         user_progress = await self._get_user_exercise_progress(user_id, exercise_id)
 
-        # 레벨별 잠금/완료 상태 설정
-        levels_with_status = []
-        for level in levels:
-            level_data = ExerciseLevelList.from_orm(level)
-
-            current_level = user_progress.get("current_level", 1)
-            highest_completed = user_progress.get("highest_completed_level", 0)
-
-            level_data.is_locked = level.level > current_level
-            level_data.is_completed = level.level <= highest_completed
-
-            levels_with_status.append(level_data)
-
-        return levels_with_status
+        return self._levels_with_status(levels, user_progress)
+
+    def _levels_with_status(
+        self, levels: List[ExerciseLevelList], user_progress: Dict[str, Any]
+    ) -> List[ExerciseLevelList]:
+        """레벨별 잠금/완료 상태를 설정한 복사본 목록"""
+        current_level = user_progress.get("current_level", 1)
+        highest_completed = user_progress.get("highest_completed_level", 0)
+
+        return [
+            level.model_copy(
+                update={
+                    "is_locked": level.level > current_level,
+                    "is_completed": level.level <= highest_completed,
+                }
+            )
+            for level in levels
+        ]
 
     async def _get_user_exercise_progress(self, user_id: int, exercise_id: int) -> Dict[str, Any]:
         """사용자의 운동 진행도 조회"""
 
-        user_exercise = (
-            self.db.query(UserExerciseModel)
-            .filter(and_(UserExerciseModel.user_id == user_id, UserExerciseModel.exercise_id == exercise_id))
-            .first()
+        result = await self.db.execute(
+            select(UserExerciseModel).where(
+                and_(UserExerciseModel.user_id == user_id, UserExerciseModel.exercise_id == exercise_id)
+            )
         )
+        user_exercise = result.scalars().first()
 
         if not user_exercise:
             return {
@@ -151,15 +133,6 @@ class ExerciseService:
 
     async def get_exercise_by_id(self, exercise_id: int) -> ExerciseList | None:
         """운동 ID로 운동 정보 조회"""
+        snapshot = await self._get_catalog()
 
-        exercise = (
-            self.db.query(ExerciseModel)
-            .options(joinedload(ExerciseModel.category))
-            .filter(ExerciseModel.exercise_id == exercise_id)
-            .first()
-        )
-
-        if not exercise:
-            return None
-
-        return ExerciseList.model_validate(exercise)
+        return snapshot.exercise_by_id.get(exercise_id)
@@ -0,0 +1,85 @@
+# app/services/heartbeat_tracker.py
+
+import asyncio
+from datetime import datetime
+from typing import Dict
+
+from app.core.config import get_settings
+from app.core.database import session_scope
+from app.services.socket_service import SocketService
+
+settings = get_settings()
+
+
+class HeartbeatTracker:
+    """소켓 세션 하트비트 메모리 추적기
+
+    하트비트(및 수신 메시지)마다 DB를 갱신하지 않고 socket_session_id별 마지막 수신 시각만 기록해 두었다가,
+    flush 주기마다 바뀐 세션들의 last_heartbeat를 한 번의 bulk UPDATE로 저장한다.
+    연결 생존 여부는 uvicorn의 WebSocket ping/pong(--ws-ping-interval / --ws-ping-timeout)이 판단한다.
+    """
+
+    def __init__(self, interval_seconds: float | None = None):
+        self.interval_seconds = interval_seconds or settings.heartbeat_flush_interval_seconds
+        # 마지막 수신 시각 / 아직 저장되지 않은 하트비트
+        self._last_seen: Dict[str, datetime] = {}
+        self._pending: Dict[str, datetime] = {}
+        self._task: asyncio.Task | None = None
+
+    def beat(self, socket_session_id: str):
+        """하트비트 기록 (DB 접근 없음, 최초 호출 시 flush 타이머 시작)"""
+        now = datetime.utcnow()
+        self._last_seen[socket_session_id] = now
+        self._pending[socket_session_id] = now
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def last_seen(self, socket_session_id: str) -> datetime | None:
+        return self._last_seen.get(socket_session_id)
+
+    def forget(self, socket_session_id: str):
+        """연결 종료 시 추적 대상에서 제거 (종료 시각은 연결 상태 업데이트가 기록)"""
+        self._last_seen.pop(socket_session_id, None)
+        self._pending.pop(socket_session_id, None)
+
+    async def flush(self):
+        """저장되지 않은 하트비트를 한 번의 bulk UPDATE로 저장"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+
+        try:
+            async with session_scope() as db:
+                await SocketService(db).update_heartbeats(pending)
+        except Exception:
+            # 저장 실패 시 그 사이 들어온 더 최신 하트비트를 유지하며 다시 대기
+            for socket_session_id, beat_time in pending.items():
+                self._pending.setdefault(socket_session_id, beat_time)
+            raise
+
+    async def _run(self):
+        """주기 flush 타이머"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Heartbeat flush error: {e}")
+
+    async def stop(self):
+        """타이머 종료 후 남은 하트비트 저장 (앱 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+
+# 글로벌 하트비트 추적기 인스턴스
+heartbeat_tracker = HeartbeatTracker()
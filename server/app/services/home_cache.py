@@ -0,0 +1,113 @@
+# app/services/home_cache.py
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Dict, Set, Tuple
+
+from app.core.config import get_settings
+from app.schemas.home import HomePageResponse
+
+settings = get_settings()
+
+
+class HomeResponseCache:
+    """사용자별 홈 화면 응답 캐시 (TTL + LRU 제거, 사용자별 single-flight)
+
+    최근 운동은 운동 완료 때만 바뀌므로 complete_workout이 해당 사용자 항목을 무효화한다.
+    인기 운동은 다른 사용자의 완료로도 바뀌지만 TTL 동안의 지연은 허용한다.
+    무효화는 프로세스 안에서만 전파되므로 다른 워커는 TTL이 지나야 갱신된다.
+    """
+
+    def __init__(self, max_entries: int | None = None, ttl_seconds: float | None = None):
+        self.max_entries = max_entries or settings.home_cache_max_entries
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.home_cache_ttl_seconds
+        # user_id -> (만료 시각, 응답), 오래 안 쓴 순서
+        self._entries: OrderedDict[int, Tuple[float, HomePageResponse]] = OrderedDict()
+        # 계산 중인 사용자 -> 결과 Future (같은 사용자의 동시 요청은 이 결과를 기다림)
+        self._inflight: Dict[int, asyncio.Future] = {}
+        # 계산 도중 무효화된 사용자 (그 결과는 저장하지 않음)
+        self._stale_inflight: Set[int] = set()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _lookup(self, user_id: int) -> HomePageResponse | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return response
+
+    def _store(self, user_id: int, response: HomePageResponse):
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(user_id)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, user_id: int, compute: Callable[[], Awaitable[HomePageResponse]]) -> HomePageResponse:
+        """캐시된 응답 반환, 없으면 계산 (동시 요청은 먼저 계산하는 요청의 결과를 공유)"""
+        while True:
+            cached = self._lookup(user_id)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+            inflight = self._inflight.get(user_id)
+            if inflight is None:
+                break
+
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except Exception:
+                # 먼저 계산하던 요청이 실패/취소되면 다시 확인 후 직접 계산
+                continue
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[user_id] = future
+
+        try:
+            response = await compute()
+        except BaseException as e:
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError("home page computation cancelled"))
+            # 기다리는 요청이 없어도 경고가 남지 않도록 예외를 조회 처리
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            if user_id not in self._stale_inflight:
+                self._store(user_id, response)
+            return response
+        finally:
+            self._inflight.pop(user_id, None)
+            self._stale_inflight.discard(user_id)
+
+    def invalidate(self, user_id: int):
+        """사용자 항목 무효화 (계산 중이면 그 결과도 저장하지 않음)"""
+        self._entries.pop(user_id, None)
+        if user_id in self._inflight:
+            self._stale_inflight.add(user_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+# 전역 홈 화면 캐시 인스턴스
+home_cache = HomeResponseCache()
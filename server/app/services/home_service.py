@@ -2,19 +2,22 @@
 
 from typing import List
 
-from app.core.database import get_db
 from app.models.exercise import ExerciseModel
 from app.models.user_exercise import UserExerciseModel
 from app.schemas.exercise import ExerciseList
 from app.schemas.home import HomePageResponse
-from sqlalchemy import desc, func
+from app.services.catalog_cache import catalog_cache
+from app.services.popularity_service import PopularityService
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 
 
 class HomeService:
     """메인페이지 관련 서비스"""
 
-    def __init__(self):
-        self.db = next(get_db())
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
     async def get_home_page_data(self, user_id: int) -> HomePageResponse:
         """메인페이지 데이터 조회"""
@@ -28,13 +31,13 @@ class HomeService:
         """최근 운동 3개 조회"""
 
         # N+1 문제를 피하기 위해 두 단계로 분리
-        recent_user_exercises = (
-            self.db.query(UserExerciseModel)
-            .filter(UserExerciseModel.user_id == user_id, UserExerciseModel.last_performed.is_not(None))
+        result = await self.db.execute(
+            select(UserExerciseModel)
+            .where(UserExerciseModel.user_id == user_id, UserExerciseModel.last_performed.is_not(None))
             .order_by(desc(UserExerciseModel.last_performed))
             .limit(3)
-            .all()
         )
+        recent_user_exercises = result.scalars().all()
 
         if not recent_user_exercises:
             return []
@@ -42,13 +45,14 @@ class HomeService:
         # 운동 ID 리스트 추출
         exercise_ids = [ue.exercise_id for ue in recent_user_exercises]
 
-        # 운동 정보와 카테고리를 한번에 로드
-        exercises_data = (
-            self.db.query(ExerciseModel)
-            .join(ExerciseModel.category)  # 일반 join 사용
-            .filter(ExerciseModel.exercise_id.in_(exercise_ids))
-            .all()
+        # 운동 정보와 카테고리를 한번에 로드 (join 결과로 category를 채워 지연 로딩 방지)
+        result = await self.db.execute(
+            select(ExerciseModel)
+            .join(ExerciseModel.category)
+            .options(contains_eager(ExerciseModel.category))
+            .where(ExerciseModel.exercise_id.in_(exercise_ids))
         )
+        exercises_data = result.scalars().all()
 
         # 순서 유지를 위한 딕셔너리
         exercise_dict = {ex.exercise_id: ex for ex in exercises_data}
@@ -63,45 +67,15 @@ class HomeService:
         return recent_exercises
 
     async def _get_hot_exercises(self) -> List[ExerciseList]:
-        """인기 운동 조회"""
-
-        # 서브쿼리로 운동별 사용자 수 계산
-        user_count_subquery = (
-            self.db.query(
-                UserExerciseModel.exercise_id, func.count(UserExerciseModel.user_exercise_id).label("user_count")
-            )
-            .group_by(UserExerciseModel.exercise_id)
-            .subquery()
-        )
-
-        # 인기 운동 ID 조회 (정렬된 순서)
-        hot_exercise_ids = (
-            self.db.query(ExerciseModel.exercise_id)
-            .outerjoin(user_count_subquery, ExerciseModel.exercise_id == user_count_subquery.c.exercise_id)
-            .order_by(desc(func.coalesce(user_count_subquery.c.user_count, 0)), ExerciseModel.name)
-            .limit(6)
-            .all()
-        )
+        """인기 운동 조회 - 인기도 집계 테이블과 카탈로그 캐시만 사용 (user_exercises 집계 없음)"""
 
-        if not hot_exercise_ids:
-            return []
-
-        exercise_ids = [row.exercise_id for row in hot_exercise_ids]
+        snapshot = await catalog_cache.get()
+        scores = await PopularityService(self.db).get_scores()
 
-        # 운동 정보와 카테고리 로드
-        hot_exercises_data = (
-            self.db.query(ExerciseModel)
-            .join(ExerciseModel.category)
-            .filter(ExerciseModel.exercise_id.in_(exercise_ids))
-            .all()
+        # 사용자 수 > 최근 활동 수 순, 동점이면 이름 순 (스냅샷이 이름 순이므로 안정 정렬 유지)
+        ranked = sorted(
+            snapshot.exercises,
+            key=lambda exercise: tuple(-score for score in scores.get(exercise.exercise_id, (0, 0))),
         )
 
-        # 정렬 순서 유지
-        exercise_dict = {ex.exercise_id: ex for ex in hot_exercises_data}
-        hot_exercises = []
-        for exercise_id in exercise_ids:
-            if exercise_id in exercise_dict:
-                exercise_list = ExerciseList.from_orm(exercise_dict[exercise_id])
-                hot_exercises.append(exercise_list)
-
-        return hot_exercises
+        return ranked[:6]
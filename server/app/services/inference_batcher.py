@@ -0,0 +1,243 @@
+# app/services/inference_batcher.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.core.metrics import Histogram
+from app.services.model_registry import ModelRegistry, model_registry
+
+settings = get_settings()
+
+# 배치 크기 / 큐 대기 시간(ms) 히스토그램 버킷
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64]
+QUEUE_WAIT_MS_BUCKETS = [0.5, 1, 2, 5, 10, 20, 50, 100]
+
+# (입력 벡터, 결과 future, enqueue 시각)
+_PendingFrame = Tuple[np.ndarray, asyncio.Future, float]
+
+
+class InferenceQueueFull(Exception):
+    """추론 대기 큐 포화 - 해당 프레임은 처리되지 않음"""
+
+
+async def collect_batch(queue: asyncio.Queue, max_batch: int, max_wait: float) -> List[Any]:
+    """첫 항목 도착 후 max_batch개까지 항목 수집
+
+    이미 도착해 있는 항목은 대기 없이 가져가고, 첫 항목 외에 대기 중인 항목이 없으면 바로 반환한다.
+    여러 항목이 몰려 있을 때만 max_wait(초) 동안 더 기다려 배치를 채운다.
+    """
+    batch = [await queue.get()]
+    while len(batch) < max_batch and not queue.empty():
+        batch.append(queue.get_nowait())
+
+    # 혼자 도착한 항목은 대기 구간을 기다리지 않고 바로 처리
+    if len(batch) == 1:
+        return batch
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+
+    while len(batch) < max_batch:
+        if not queue.empty():
+            batch.append(queue.get_nowait())
+            continue
+
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except TimeoutError:
+            break
+
+    return batch
+
+
+class PoseInferenceBatcher:
+    """세션 간 포즈 분류 마이크로 배처
+
+    모든 WebSocket 세션의 프레임을 모델별 큐에 모아 한 번의 배치 추론으로 처리하고, 결과 확률을 각 요청자에게 돌려준다.
+    대기 중인 프레임이 하나뿐이면 바로 추론하고, 여러 프레임이 몰려 있을 때만 max_wait_ms 동안
+    max_batch개까지 더 모은다.
+    인터프리터가 모두 사용 중인 동안 도착한 프레임은 다음 배치로 모인다.
+
+    추론은 이벤트 루프가 아닌 전용 스레드 풀에서 실행된다. 모델별 동시 실행 배치 수는 인터프리터 풀 크기로
+    제한되며, 큐가 가득 차면 새 프레임은 버려진다 (InferenceQueueFull).
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry | None = None,
+        max_batch: int | None = None,
+        max_wait_ms: float | None = None,
+        queue_size: int | None = None,
+    ):
+        self.registry = registry or model_registry
+        # 인터프리터 입력 텐서가 registry.batch_size로 고정되어 있으므로 그 이상은 모을 수 없음
+        self.max_batch = min(max_batch or self.registry.batch_size, self.registry.batch_size)
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.pose_batch_max_wait_ms) / 1000
+        self.queue_size = queue_size or settings.pose_inference_queue_size
+
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: set = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self.dropped_frames: Dict[str, int] = {}
+
+        self.batch_size_histogram: Dict[str, Histogram] = {}
+        self.queue_wait_histogram: Dict[str, Histogram] = {}
+
+    def _ensure_worker(self, model_name: str) -> asyncio.Queue:
+        """모델별 큐와 배치 워커 태스크 준비 (이벤트 루프에서 최초 호출 시 시작)"""
+        queue = self._queues.get(model_name)
+        worker = self._workers.get(model_name)
+
+        if queue is None:
+            queue = asyncio.Queue(maxsize=self.queue_size)
+            self._queues[model_name] = queue
+            # 인터프리터 수만큼만 동시에 배치를 실행
+            self._semaphores[model_name] = asyncio.Semaphore(self.registry.pool_size)
+            self.dropped_frames[model_name] = 0
+            self.batch_size_histogram[model_name] = Histogram(BATCH_SIZE_BUCKETS)
+            self.queue_wait_histogram[model_name] = Histogram(QUEUE_WAIT_MS_BUCKETS)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.registry.pool_size * len(self.registry.model_paths), thread_name_prefix="pose-infer"
+            )
+
+        if worker is None or worker.done():
+            self._workers[model_name] = asyncio.get_running_loop().create_task(self._run_worker(model_name, queue))
+
+        return queue
+
+    async def infer(self, model_name: str, input_row: np.ndarray) -> np.ndarray:
+        """단일 프레임 추론 요청 - 배치 처리된 뒤 해당 프레임의 출력 벡터 반환
+
+        대기 큐가 가득 차 있으면 InferenceQueueFull을 발생시킨다.
+        """
+        queue = self._ensure_worker(model_name)
+        future = asyncio.get_running_loop().create_future()
+
+        try:
+            # 호출자가 버퍼를 재사용할 수 있도록 복사본을 큐에 넣음
+            queue.put_nowait((np.array(input_row, dtype=np.float32).reshape(-1), future, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.dropped_frames[model_name] += 1
+            raise InferenceQueueFull(f"Inference queue for '{model_name}' is full")
+
+        return await future
+
+    async def _run_worker(self, model_name: str, queue: asyncio.Queue):
+        """모델별 배치 워커 루프 - 배치가 스레드 풀에서 실행되는 동안 다음 배치를 계속 수집"""
+        semaphore = self._semaphores[model_name]
+
+        while True:
+            # 인터프리터가 모두 사용 중이면 그동안 도착한 프레임이 다음 배치로 모임
+            await semaphore.acquire()
+            try:
+                batch = await collect_batch(queue, self.max_batch, self.max_wait)
+            except BaseException:
+                semaphore.release()
+                raise
+
+            now = time.perf_counter()
+            wait_histogram = self.queue_wait_histogram[model_name]
+            for _, _, enqueued_at in batch:
+                wait_histogram.observe((now - enqueued_at) * 1000)
+            self.batch_size_histogram[model_name].observe(len(batch))
+
+            task = asyncio.get_running_loop().create_task(self._execute_batch(model_name, batch, semaphore))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _execute_batch(self, model_name: str, batch: List[_PendingFrame], semaphore: asyncio.Semaphore):
+        """스레드 풀에서 배치 추론 후 결과를 각 요청자에게 분배"""
+        loop = asyncio.get_running_loop()
+
+        try:
+            outputs = await loop.run_in_executor(
+                self._executor, self._invoke_batch, model_name, [row for row, _, _ in batch]
+            )
+        except Exception as e:
+            print(f"Batch inference error ({model_name}): {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            semaphore.release()
+
+        for i, (_, future, _) in enumerate(batch):
+            # 연결이 끊겨 취소된 요청은 건너뜀
+            if not future.done():
+                future.set_result(outputs[i])
+
+    def _invoke_batch(self, model_name: str, rows: List[np.ndarray]) -> np.ndarray:
+        """행 수 이상인 가장 작은 배치 구간 인터프리터로 한 번에 추론 (남는 행은 0으로 채움) - 워커 스레드에서 실행"""
+        pool = self.registry.get_pool(model_name)
+        input_detail = pool.input_details[0]
+        bucket = pool.bucket_for(len(rows))
+
+        batch_input = np.stack(rows)
+        if bucket > len(rows):
+            padding = np.zeros((bucket - len(rows), *batch_input.shape[1:]), dtype=np.float32)
+            batch_input = np.concatenate([batch_input, padding])
+
+        with pool.acquire(len(rows)) as interpreter:
+            interpreter.set_tensor(input_detail["index"], batch_input.reshape([bucket, *input_detail["shape"][1:]]))
+            interpreter.invoke()
+            output = interpreter.get_tensor(pool.output_details[0]["index"])
+
+        return output[: len(rows)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """모델별 배치 크기 / 큐 대기 시간 히스토그램"""
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+            "queue_size": self.queue_size,
+            "models": {
+                name: {
+                    "queued": queue.qsize(),
+                    "dropped_frames": self.dropped_frames[name],
+                    "batch_size": self.batch_size_histogram[name].snapshot(),
+                    "queue_wait_ms": self.queue_wait_histogram[name].snapshot(),
+                }
+                for name, queue in self._queues.items()
+            },
+        }
+
+    async def stop(self):
+        """배치 워커 종료 (실행 중인 배치는 마무리, 대기 중인 요청은 취소)"""
+        for task in self._workers.values():
+            task.cancel()
+        for task in self._workers.values():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._workers.clear()
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, future, _ = queue.get_nowait()
+                future.cancel()
+
+
+# 글로벌 배처 인스턴스
+pose_batcher = PoseInferenceBatcher()
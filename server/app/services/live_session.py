@@ -0,0 +1,256 @@
+# app/services/live_session.py
+
+import asyncio
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import Any, Dict
+
+from app.core.config import get_settings
+from app.core.database import session_scope
+from app.schemas.workout import ExerciseDetail, ExerciseLevelDetail, WorkoutSessionDetail
+from app.services.workout_service import SESSION_PROGRESS_COUNTERS, WorkoutService
+
+settings = get_settings()
+
+
+class LiveSessionState:
+    """WebSocket 연결별 실시간 운동 세션 상태
+
+    연결 시 한 번 로드하고 반복/일시정지/재개 처리 결과로 갱신한다.
+    랜드마크 프레임 처리 경로는 이 객체만 참조하므로 프레임마다 DB를 조회하지 않는다.
+    write-behind 모드에서는 반복 증가를 여기에 먼저 반영하고(dirty), SessionProgressWriter가
+    마지막 저장 값(saved_counters)과의 차이만 모아서 저장한다.
+    """
+
+    __slots__ = (
+        "socket_session_id",
+        "session_id",
+        "user_id",
+        "exercise_id",
+        "level_id",
+        "status",
+        "current_set",
+        "current_set_reps",
+        "total_reps_completed",
+        "total_reps_failed",
+        "total_calories_burned",
+        "duration_seconds",
+        "start_time",
+        "end_time",
+        "last_pause_time",
+        "total_pause_duration",
+        "exercise",
+        "level",
+        "dirty",
+        "pending_events",
+        "saved_counters",
+        "flush_lock",
+    )
+
+    def __init__(self, socket_session_id: str, detail: WorkoutSessionDetail):
+        self.socket_session_id = socket_session_id
+        # 아직 DB에 저장되지 않은 변경 여부 / 누적 이벤트 수
+        self.dirty = False
+        self.pending_events = 0
+        # flush 중에 같은 세션의 다른 flush나 DB 조회가 끼어들지 않도록 직렬화
+        self.flush_lock = asyncio.Lock()
+        self.update_from(detail)
+
+    def update_from(self, detail: WorkoutSessionDetail):
+        """DB에서 읽은 세션 상세 정보로 상태 갱신"""
+        self.session_id: int = detail.session_id
+        self.user_id: int = detail.user_id
+        self.exercise_id: int = detail.exercise_id
+        self.level_id: int = detail.level_id
+        self.status: str = detail.status
+        self.current_set: int = detail.current_set
+        self.current_set_reps: int = detail.current_set_reps
+        self.total_reps_completed: int = detail.total_reps_completed
+        self.total_reps_failed: int = detail.total_reps_failed
+        self.total_calories_burned: float = detail.total_calories_burned
+        self.duration_seconds: float = detail.duration_seconds
+        self.start_time: datetime | None = detail.start_time
+        self.end_time: datetime | None = detail.end_time
+        self.last_pause_time: datetime | None = detail.last_pause_time
+        self.total_pause_duration: float = detail.total_pause_duration
+        self.exercise: ExerciseDetail | None = detail.exercise
+        self.level: ExerciseLevelDetail | None = detail.level
+        # DB에 저장된 카운터 값 (write-behind flush는 이 값과의 차이만 저장)
+        self.saved_counters: Dict[str, int] = self.counters()
+
+    def counters(self) -> Dict[str, int]:
+        """증가분으로 저장하는 카운터 현재 값"""
+        return {column: getattr(self, column) for column in SESSION_PROGRESS_COUNTERS}
+
+    @property
+    def exercise_name(self) -> str | None:
+        return self.exercise.name if self.exercise else None
+
+    def get_current_duration(self) -> float:
+        """현재까지의 실제 운동 시간 계산 (WorkoutSessionModel.get_current_duration과 동일)"""
+        if self.status == "completed" and self.end_time:
+            return self.duration_seconds
+
+        if self.start_time is None:
+            return self.duration_seconds
+
+        current_time = datetime.utcnow()
+        total_elapsed = (current_time - self.start_time).total_seconds()
+
+        current_pause_time = 0.0
+        if self.status == "paused" and self.last_pause_time:
+            current_pause_time = (current_time - self.last_pause_time).total_seconds()
+
+        return max(0.0, total_elapsed - self.total_pause_duration - current_pause_time)
+
+    def apply_rep(self, reps: int = 1) -> bool:
+        """반복 완료를 메모리에 반영 (목표 반복수 달성 시 세트 증가) - 세트 완료 여부 반환"""
+        self.current_set_reps += reps
+        self.total_reps_completed += reps
+
+        set_completed = False
+        if self.level and self.current_set_reps >= self.level.target_reps:
+            self.current_set += 1
+            self.current_set_reps = 0
+            set_completed = True
+
+        self._mark_dirty()
+        return set_completed
+
+    def apply_failed_rep(self, failed_reps: int = 1):
+        """실패한 반복을 메모리에 반영"""
+        self.total_reps_failed += failed_reps
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        self.duration_seconds = self.get_current_duration()
+        self.dirty = True
+        self.pending_events += 1
+
+    def take_progress_row(self) -> Dict[str, Any]:
+        """write-behind flush용 진행 상황 - 카운터는 마지막 저장 이후 증가분, 운동 시간은 현재 값
+
+        반환한 증가분은 저장된 것으로 보고 saved_counters를 앞당긴다 (저장 실패 시 restore_progress_row).
+        """
+        counters = self.counters()
+        row = {column: counters[column] - self.saved_counters[column] for column in SESSION_PROGRESS_COUNTERS}
+        row["session_id"] = self.session_id
+        row["duration_seconds"] = self.get_current_duration()
+
+        self.saved_counters = counters
+        self.dirty = False
+        self.pending_events = 0
+        return row
+
+    def restore_progress_row(self, row: Dict[str, Any]):
+        """저장에 실패한 증가분을 되돌려 다음 flush에 다시 포함"""
+        for column in SESSION_PROGRESS_COUNTERS:
+            self.saved_counters[column] -= row[column]
+        self.dirty = True
+
+    def to_detail(self) -> WorkoutSessionDetail:
+        """현재 상태를 세션 상세 스키마로 변환 (DB 조회 없음)"""
+        return WorkoutSessionDetail(
+            session_id=self.session_id,
+            user_id=self.user_id,
+            exercise_id=self.exercise_id,
+            level_id=self.level_id,
+            status=self.status,
+            current_set=self.current_set,
+            current_set_reps=self.current_set_reps,
+            total_reps_completed=self.total_reps_completed,
+            total_reps_failed=self.total_reps_failed,
+            total_calories_burned=self.total_calories_burned,
+            duration_seconds=self.duration_seconds,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            last_pause_time=self.last_pause_time,
+            total_pause_duration=self.total_pause_duration,
+            exercise=self.exercise,
+            level=self.level,
+        )
+
+
+class SessionProgressWriter:
+    """실시간 세션 진행 상황 write-behind 저장기
+
+    메모리에 반영된 반복/실패 증가분을 세트 완료, 일시정지, 종료, N개 이벤트 누적 시점이나
+    주기 타이머에서 한 번의 UPDATE(x = x + :delta)로 workout_sessions에 더한다.
+    연결 종료와 앱 종료 시에도 남은 변경을 반드시 저장한다.
+    """
+
+    def __init__(self, interval_seconds: float | None = None, max_pending: int | None = None):
+        self.interval_seconds = interval_seconds or settings.rep_flush_interval_seconds
+        self.max_pending = max_pending or settings.rep_flush_max_pending
+        self._states: Dict[int, LiveSessionState] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return settings.rep_write_behind
+
+    def register(self, state: LiveSessionState):
+        """주기 flush 대상에 등록 (최초 등록 시 타이머 시작)"""
+        self._states[state.session_id] = state
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def unregister(self, state: LiveSessionState):
+        self._states.pop(state.session_id, None)
+
+    def should_flush(self, state: LiveSessionState) -> bool:
+        """누적 이벤트 수 기준 flush 필요 여부"""
+        return state.pending_events >= self.max_pending
+
+    async def flush(self, *states: LiveSessionState):
+        """dirty 상태들의 카운터 증가분을 한 번의 UPDATE로 저장
+
+        같은 세션의 flush는 순서대로 실행되므로 이 호출이 끝나면 이전에 반영된 반복은 모두 DB에 저장되어 있다.
+        """
+        async with AsyncExitStack() as stack:
+            # 세션 id 순서로 잠가 여러 세션을 함께 flush해도 교착되지 않게 함
+            for state in sorted(states, key=lambda state: state.session_id):
+                await stack.enter_async_context(state.flush_lock)
+
+            dirty_states = [state for state in states if state.dirty]
+            if not dirty_states:
+                return
+
+            rows = [state.take_progress_row() for state in dirty_states]
+            try:
+                async with session_scope() as db:
+                    await WorkoutService(db).save_sessions_progress(rows)
+            except Exception:
+                # 저장 실패 시 다음 flush에서 다시 시도
+                for state, row in zip(dirty_states, rows):
+                    state.restore_progress_row(row)
+                raise
+
+    async def flush_all(self):
+        """등록된 모든 세션의 남은 변경 저장"""
+        await self.flush(*self._states.values())
+
+    async def _run(self):
+        """주기 flush 타이머"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.flush_all()
+            except Exception as e:
+                print(f"Session progress flush error: {e}")
+
+    async def stop(self):
+        """타이머 종료 후 남은 변경 저장 (앱 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush_all()
+
+
+# 글로벌 write-behind 저장기 인스턴스
+session_progress_writer = SessionProgressWriter()
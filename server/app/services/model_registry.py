@@ -0,0 +1,204 @@
+# app/services/model_registry.py
+
+import bisect
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# TFLite 인터프리터 클래스 (첫 모델 로드 때 import, API 프로세스 시작 시 TensorFlow를 import하지 않음)
+_interpreter_class = None
+
+
+def get_interpreter_class():
+    """TFLite 인터프리터 클래스 - tflite_runtime이 설치돼 있으면 TensorFlow 전체 대신 사용"""
+    global _interpreter_class
+
+    if _interpreter_class is None:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+
+            Interpreter = tf.lite.Interpreter
+        _interpreter_class = Interpreter
+
+    return _interpreter_class
+
+
+# 모델 이름 → TFLite 파일 경로
+POSE_MODEL_PATHS: Dict[str, str] = {
+    "pushup": "models/tf_lite_model/pushup_classifier.tflite",
+    "squat": "models/tf_lite_model/squat_classifier_v2.tflite",
+}
+
+
+def batch_buckets(batch_size: int) -> List[int]:
+    """배치 크기 구간 (1, 2, 4, ... 와 batch_size)"""
+    buckets = []
+    bucket = 1
+    while bucket < batch_size:
+        buckets.append(bucket)
+        bucket *= 2
+    buckets.append(max(batch_size, 1))
+    return buckets
+
+
+class InterpreterPool:
+    """단일 TFLite 모델의 인터프리터 풀
+
+    모델 파일은 한 번만 읽고, 같은 모델 바이트로 만든 인터프리터들을 스레드 간에 빌려준다.
+    TFLite 인터프리터는 스레드 안전하지 않으므로 한 번에 한 스레드만 하나의 슬롯을 사용한다.
+    슬롯 수는 배처가 동시에 실행하는 배치 수와 같다. 각 슬롯은 배치 크기 구간(1, 2, 4, ... batch_size)별
+    인터프리터를 처음 쓰일 때 만들며, 배치 추론은 행 수 이상인 가장 작은 구간의 인터프리터를 사용한다.
+    """
+
+    def __init__(self, name: str, model_path: str, size: int, batch_size: int = 1):
+        self.name = name
+        self.model_path = model_path
+        self.size = size
+        self.batch_size = batch_size
+        self.bucket_sizes = batch_buckets(batch_size)
+
+        start_time = time.perf_counter()
+
+        # 모델 바이트는 모든 인터프리터가 공유
+        self.model_content = Path(model_path).read_bytes()
+
+        self._available: queue.Queue = queue.Queue(maxsize=size)
+        self._in_use = 0
+        self._lock = threading.Lock()
+        # 구간별로 만들어진 인터프리터 수 / 할당된 텐서 메모리 추정치 합계
+        self.interpreter_counts: Dict[int, int] = dict.fromkeys(self.bucket_sizes, 0)
+        self.tensor_bytes = 0
+
+        # 혼자 도착한 프레임용 가장 작은 구간만 미리 생성
+        for _ in range(size):
+            self._available.put({self.bucket_sizes[0]: self._create_interpreter(self.bucket_sizes[0])})
+
+        self.load_time_seconds = time.perf_counter() - start_time
+
+        # 입출력 텐서 인덱스는 모든 인터프리터가 동일 (배치 차원만 구간별로 다름)
+        interpreter = self._available.queue[0][self.bucket_sizes[0]]
+        self.input_details = interpreter.get_input_details()
+        self.output_details = interpreter.get_output_details()
+
+    def _create_interpreter(self, batch_size: int) -> Any:
+        interpreter = get_interpreter_class()(model_content=self.model_content)
+        input_detail = interpreter.get_input_details()[0]
+        if input_detail["shape"][0] != batch_size:
+            interpreter.resize_tensor_input(input_detail["index"], [batch_size, *input_detail["shape"][1:]])
+        interpreter.allocate_tensors()
+
+        with self._lock:
+            self.interpreter_counts[batch_size] += 1
+            self.tensor_bytes += self._estimate_tensor_bytes(interpreter)
+        return interpreter
+
+    def bucket_for(self, rows: int) -> int:
+        """rows 이상인 가장 작은 배치 구간"""
+        return self.bucket_sizes[bisect.bisect_left(self.bucket_sizes, rows)]
+
+    def _estimate_tensor_bytes(self, interpreter: Any) -> int:
+        """인터프리터 하나가 할당한 텐서 메모리 추정치 (bytes)"""
+        total = 0
+        for detail in interpreter.get_tensor_details():
+            shape = detail.get("shape")
+            if shape is None or len(shape) == 0:
+                continue
+            total += int(np.prod(shape)) * np.dtype(detail["dtype"]).itemsize
+        return total
+
+    @contextmanager
+    def acquire(self, rows: int = 1, timeout: float | None = None) -> Iterator[Any]:
+        """rows행 배치를 처리할 인터프리터 대여 (입력 배치 크기는 bucket_for(rows), 반납은 자동)"""
+        slot = self._available.get(timeout=timeout)
+        with self._lock:
+            self._in_use += 1
+        try:
+            bucket = self.bucket_for(rows)
+            interpreter = slot.get(bucket)
+            if interpreter is None:
+                # 슬롯을 빌린 스레드만 접근하므로 잠금 없이 생성
+                interpreter = slot[bucket] = self._create_interpreter(bucket)
+            yield interpreter
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._available.put(slot)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """모델별 메모리/로드 시간 통계 (인터프리터 수는 실제로 만들어진 수)"""
+        return {
+            "model_path": self.model_path,
+            "pool_size": self.size,
+            "batch_size": self.batch_size,
+            "bucket_sizes": self.bucket_sizes,
+            "in_use": self._in_use,
+            "interpreters": sum(self.interpreter_counts.values()),
+            "interpreters_per_bucket": dict(self.interpreter_counts),
+            "model_bytes": len(self.model_content),
+            "tensor_bytes": self.tensor_bytes,
+            "estimated_total_bytes": len(self.model_content) + self.tensor_bytes,
+            "load_time_ms": round(self.load_time_seconds * 1000, 2),
+        }
+
+
+class ModelRegistry:
+    """프로세스 전역 TFLite 모델 레지스트리
+
+    WebSocket 연결마다 모델을 새로 로드하지 않도록 모델별 인터프리터 풀을 한 번만 만든다.
+    풀 크기는 배처의 모델별 동시 배치 수(pose_batch_concurrency)로, CPU 코어 수와 무관하다.
+    """
+
+    def __init__(
+        self, model_paths: Dict[str, str] | None = None, pool_size: int | None = None, batch_size: int | None = None
+    ):
+        self.model_paths = model_paths or POSE_MODEL_PATHS
+        self.pool_size = pool_size or settings.tflite_pool_size or settings.pose_batch_concurrency
+        self.batch_size = batch_size or settings.pose_batch_max_size
+        self._pools: Dict[str, InterpreterPool] = {}
+        self._lock = threading.Lock()
+
+    def get_pool(self, name: str) -> InterpreterPool:
+        """모델 풀 조회 (최초 호출 시 로드)"""
+        pool = self._pools.get(name)
+        if pool is not None:
+            return pool
+
+        with self._lock:
+            if name not in self._pools:
+                if name not in self.model_paths:
+                    raise ValueError(f"Unknown model: {name}")
+                self._pools[name] = InterpreterPool(name, self.model_paths[name], self.pool_size, self.batch_size)
+                print(f"Loaded TFLite model '{name}' x{self.pool_size} in {self._pools[name].load_time_seconds:.3f}s")
+            return self._pools[name]
+
+    def load_all(self):
+        """등록된 모든 모델 로드"""
+        for name in self.model_paths:
+            self.get_pool(name)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._pools
+
+    @property
+    def all_loaded(self) -> bool:
+        return all(name in self._pools for name in self.model_paths)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """로드된 모델 통계"""
+        return {name: pool.get_stats() for name, pool in self._pools.items()}
+
+
+# 글로벌 모델 레지스트리 인스턴스
+model_registry = ModelRegistry()
@@ -0,0 +1,237 @@
+# app/services/model_store.py
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+MANIFEST_FILE = "manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 아티팩트 이름 -> Hugging Face 저장소
+MODEL_ARTIFACTS: Dict[str, str] = {
+    "body_type": settings.body_type_model_repo,
+}
+
+# 내려받을 리비전은 브랜치/태그가 아닌 전체 커밋 해시로 고정
+COMMIT_SHA_PATTERN = re.compile(r"[0-9a-f]{40}")
+
+# 모델 로드에 필요한 부가 파일 (가중치 외)
+METADATA_SUFFIXES = (".json", ".txt")
+
+
+class ModelArtifactError(Exception):
+    """모델 아티팩트가 없거나 검증에 실패한 경우"""
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def select_repo_files(files: List[str]) -> List[str]:
+    """내려받을 파일 선택 - 설정 파일 + 가중치 (safetensors가 있으면 safetensors만, 없으면 pytorch bin)"""
+    metadata = [name for name in files if name.endswith(METADATA_SUFFIXES) and not name.startswith(".")]
+    weights = [name for name in files if name.endswith(".safetensors")]
+    if not weights:
+        weights = [name for name in files if name.endswith(".bin")]
+    return sorted(metadata + weights)
+
+
+class ModelArtifactStore:
+    """로컬 모델 아티팩트 저장소 (manifest + sha256 체크섬)
+
+    아티팩트는 <root>/<이름>/ 아래에 저장하고 manifest.json에 저장소/리비전과 파일별 크기, sha256을 기록한다.
+    manifest가 있고 검증을 통과하면 네트워크에 접근하지 않고 그 디렉터리에서 로드한다.
+    내려받기는 임시 디렉터리에 받은 뒤 manifest를 쓰고 이름을 바꿔 교체하므로
+    중간에 실패해도 반쯤 받은 아티팩트가 남지 않는다.
+    """
+
+    def __init__(self, root: str | None = None, verify_checksums: bool | None = None):
+        self.root = Path(root or settings.model_store_dir)
+        self.verify_checksums = (
+            verify_checksums if verify_checksums is not None else settings.model_store_verify_checksums
+        )
+
+    def artifact_dir(self, name: str) -> Path:
+        return self.root / name
+
+    def read_manifest(self, name: str) -> Dict[str, Any] | None:
+        manifest_path = self.artifact_dir(name) / MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def verify(self, name: str, checksums: bool | None = None) -> Dict[str, Any]:
+        """manifest 기준으로 파일 존재/크기/sha256 확인 후 manifest 반환 (실패 시 ModelArtifactError)"""
+        checksums = self.verify_checksums if checksums is None else checksums
+        manifest = self.read_manifest(name)
+        if manifest is None:
+            raise ModelArtifactError(f"No manifest for model artifact '{name}' in {self.artifact_dir(name)}")
+
+        for filename, entry in manifest["files"].items():
+            path = self.artifact_dir(name) / filename
+            if not path.is_file():
+                raise ModelArtifactError(f"Missing file in model artifact '{name}': {filename}")
+            if path.stat().st_size != entry["size"]:
+                raise ModelArtifactError(f"Size mismatch in model artifact '{name}': {filename}")
+            if checksums and file_sha256(path) != entry["sha256"]:
+                raise ModelArtifactError(f"Checksum mismatch in model artifact '{name}': {filename}")
+
+        return manifest
+
+    def resolve(self, name: str) -> Path | None:
+        """검증된 아티팩트 디렉터리 (없거나 검증 실패면 None)"""
+        try:
+            start_time = time.perf_counter()
+            manifest = self.verify(name)
+        except ModelArtifactError as e:
+            print(f"Model artifact '{name}' not usable: {e}")
+            return None
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        revision = manifest["revision"][:12]
+        print(f"Model artifact '{name}' verified ({manifest['repo_id']}@{revision}, {elapsed_ms:.0f} ms)")
+        return self.artifact_dir(name)
+
+    def write_manifest(self, directory: Path, repo_id: str, revision: str) -> Dict[str, Any]:
+        """디렉터리의 파일로 manifest 생성"""
+        files = {}
+        for path in sorted(directory.rglob("*")):
+            if not path.is_file() or path.name == MANIFEST_FILE or ".cache" in path.relative_to(directory).parts:
+                continue
+            files[path.relative_to(directory).as_posix()] = {"size": path.stat().st_size, "sha256": file_sha256(path)}
+
+        if not files:
+            raise ModelArtifactError(f"No files to record in {directory}")
+
+        manifest = {
+            "repo_id": repo_id,
+            "revision": revision,
+            "created_at": datetime.now(UTC).isoformat(),
+            "files": files,
+        }
+        with open(directory / MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+    def _replace(self, name: str, staging: Path):
+        """임시 디렉터리를 아티팩트 디렉터리로 교체"""
+        target = self.artifact_dir(name)
+        backup = target.with_name(f".{name}.old")
+        shutil.rmtree(backup, ignore_errors=True)
+        if target.exists():
+            target.rename(backup)
+        staging.rename(target)
+        shutil.rmtree(backup, ignore_errors=True)
+
+    def fetch(self, name: str, revision: str | None = None, token: str | None = None, force: bool = False) -> Path:
+        """Hugging Face에서 아티팩트 내려받기 (이미 검증된 아티팩트가 있으면 그대로 사용)"""
+        if name not in MODEL_ARTIFACTS:
+            raise ModelArtifactError(f"Unknown model artifact: {name}")
+
+        if not force and self.resolve(name) is not None:
+            return self.artifact_dir(name)
+
+        # 브랜치/태그는 저장소가 갱신되면 다른 가중치를 가리키므로 커밋 해시만 허용
+        revision = revision or settings.body_type_model_revision
+        if not COMMIT_SHA_PATTERN.fullmatch(revision):
+            raise ModelArtifactError(
+                f"Model revision must be a full commit hash, got {revision!r} "
+                "(set BODY_TYPE_MODEL_REVISION or pass --revision)"
+            )
+
+        from huggingface_hub import HfApi, snapshot_download
+
+        repo_id = MODEL_ARTIFACTS[name]
+        token = token or settings.hf_token or None
+
+        api = HfApi(token=token)
+        info = api.model_info(repo_id, revision=revision)
+        files = select_repo_files([sibling.rfilename for sibling in info.siblings])
+        print(f"Downloading {repo_id}@{info.sha[:12]}: {', '.join(files)}")
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".{name}.download"
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            snapshot_download(repo_id, revision=info.sha, allow_patterns=files, local_dir=staging, token=token)
+            shutil.rmtree(staging / ".cache", ignore_errors=True)
+            self.write_manifest(staging, repo_id, info.sha)
+            self._replace(name, staging)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        return self.artifact_dir(name)
+
+    def adopt(self, name: str, source: str, repo_id: str | None = None, revision: str = "local") -> Path:
+        """이미 가지고 있는 모델 디렉터리를 아티팩트로 등록 (manifest 생성)"""
+        source_dir = Path(source)
+        if not source_dir.is_dir():
+            raise ModelArtifactError(f"Not a directory: {source}")
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".{name}.adopt"
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            shutil.copytree(source_dir, staging, ignore=shutil.ignore_patterns(MANIFEST_FILE, ".cache"))
+            self.write_manifest(staging, repo_id or MODEL_ARTIFACTS.get(name, name), revision)
+            self._replace(name, staging)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        return self.artifact_dir(name)
+
+    def ensure(self, name: str, token: str | None = None) -> Path:
+        """로드할 아티팩트 디렉터리 확보 - 검증된 로컬 아티팩트 > manifest 없는 기존 디렉터리 등록 > 내려받기"""
+        path = self.resolve(name)
+        if path is not None:
+            return path
+
+        artifact_dir = self.artifact_dir(name)
+        if self.read_manifest(name) is None and artifact_dir.is_dir() and any(artifact_dir.iterdir()):
+            # manifest 도입 전에 받아 둔 디렉터리는 네트워크 없이 그대로 등록
+            print(f"Adopting existing model directory: {artifact_dir}")
+            return self.adopt(name, str(artifact_dir))
+
+        if not settings.model_store_allow_download:
+            raise ModelArtifactError(
+                f"Model artifact '{name}' is not available in {self.root} and downloads are disabled "
+                f"(run: python -m scripts.model_store fetch {name})"
+            )
+
+        return self.fetch(name, token=token, force=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """아티팩트별 manifest 요약 (검증은 하지 않음)"""
+        stats = {}
+        for name in MODEL_ARTIFACTS:
+            manifest = self.read_manifest(name)
+            if manifest is None:
+                stats[name] = {"present": os.path.isdir(self.artifact_dir(name)), "manifest": False}
+            else:
+                stats[name] = {
+                    "present": True,
+                    "manifest": True,
+                    "repo_id": manifest["repo_id"],
+                    "revision": manifest["revision"],
+                    "bytes": sum(entry["size"] for entry in manifest["files"].values()),
+                }
+        return stats
+
+
+# 전역 모델 아티팩트 저장소 인스턴스
+model_store = ModelArtifactStore()
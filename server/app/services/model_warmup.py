@@ -0,0 +1,74 @@
+# app/services/model_warmup.py
+
+import asyncio
+from collections.abc import Callable
+from typing import Any, Dict
+
+from app.core.config import get_settings
+from app.core.metrics import startup_timings
+from app.services.body_type_service import body_type_service
+from app.services.model_registry import model_registry
+
+settings = get_settings()
+
+# 워밍업 대상 이름 -> 로드 함수 (스레드에서 실행)
+WARMUP_LOADERS: Dict[str, Callable[[], Any]] = {
+    "pose": model_registry.load_all,
+    "body_type": body_type_service.ensure_loaded,
+}
+
+
+class ModelWarmup:
+    """앱 시작 후 백그라운드 모델 워밍업
+
+    요청 처리를 막지 않도록 모델 로드는 스레드에서 순서대로 실행한다.
+    워밍업 대상에 없는 모델은 첫 사용 때 로드되므로, 체형 분석을 받지 않는 워커는 torch를 import하지 않는다.
+    """
+
+    def __init__(self, targets: str | None = None):
+        targets = settings.model_warmup if targets is None else targets
+        self.targets = [target.strip() for target in targets.split(",") if target.strip()]
+        # 대상별 상태: pending / loading / loaded / failed
+        self.status: Dict[str, str] = dict.fromkeys(self.targets, "pending")
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """모든 워밍업 대상이 로드되었는지"""
+        return all(status == "loaded" for status in self.status.values())
+
+    def start(self):
+        """워밍업 시작 (앱 시작 시)"""
+        if self.targets and (self._task is None or self._task.done()):
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        for target in self.targets:
+            loader = WARMUP_LOADERS.get(target)
+            if loader is None:
+                self.status[target] = "failed"
+                print(f"Unknown warmup target: {target}")
+                continue
+
+            self.status[target] = "loading"
+            try:
+                with startup_timings.phase(f"warmup_{target}"):
+                    await asyncio.to_thread(loader)
+                self.status[target] = "loaded"
+            except Exception as e:
+                self.status[target] = "failed"
+                print(f"Model warmup failed for {target}: {e}")
+
+    async def stop(self):
+        """워밍업 중단 (앱 종료 시, 이미 시작된 스레드 로드는 끝까지 실행됨)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 전역 모델 워밍업 인스턴스
+model_warmup = ModelWarmup()
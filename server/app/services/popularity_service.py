@@ -0,0 +1,83 @@
+# app/services/popularity_service.py
+
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.exercise_popularity import ExerciseDailyActivityModel, ExercisePopularityModel
+
+settings = get_settings()
+
+
+class PopularityService:
+    """운동 인기도 집계 서비스 - 완료 시 카운터를 증분 갱신하고 홈 화면은 집계 테이블만 조회"""
+
+    def __init__(self, db: AsyncSession):
+        # 운동 완료 트랜잭션과 같은 세션을 사용 (커밋은 호출자가 수행)
+        self.db = db
+
+    def _insert(self, model):
+        """DB별 INSERT ... ON CONFLICT 구문 (동시에 같은 행을 처음 만들어도 충돌하지 않도록)"""
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        return dialect.insert(model)
+
+    async def record_session(self, exercise_id: int, new_user: bool, performed_at: datetime):
+        """운동 완료 1회 반영 - 누적 집계와 당일 활동 수를 각각 원자적 upsert"""
+        user_increment = 1 if new_user else 0
+
+        stmt = self._insert(ExercisePopularityModel).values(
+            exercise_id=exercise_id,
+            user_count=user_increment,
+            session_count=1,
+            last_performed=performed_at,
+            updated_at=performed_at,
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ExercisePopularityModel.exercise_id],
+                set_={
+                    "user_count": ExercisePopularityModel.user_count + user_increment,
+                    "session_count": ExercisePopularityModel.session_count + 1,
+                    "last_performed": performed_at,
+                    "updated_at": performed_at,
+                },
+            )
+        )
+
+        stmt = self._insert(ExerciseDailyActivityModel).values(
+            exercise_id=exercise_id,
+            activity_date=performed_at.date(),
+            session_count=1,
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ExerciseDailyActivityModel.exercise_id, ExerciseDailyActivityModel.activity_date],
+                set_={"session_count": ExerciseDailyActivityModel.session_count + 1},
+            )
+        )
+
+    async def get_scores(self) -> Dict[int, Tuple[int, int]]:
+        """운동별 (사용자 수, 최근 구간 완료 세션 수) - 행 수는 운동 수 x 구간 일수로 사용자 수와 무관"""
+        since = datetime.utcnow().date() - timedelta(days=settings.popular_recent_window_days - 1)
+
+        result = await self.db.execute(
+            select(
+                ExercisePopularityModel.exercise_id,
+                ExercisePopularityModel.user_count,
+                func.coalesce(func.sum(ExerciseDailyActivityModel.session_count), 0).label("recent_sessions"),
+            )
+            .outerjoin(
+                ExerciseDailyActivityModel,
+                and_(
+                    ExerciseDailyActivityModel.exercise_id == ExercisePopularityModel.exercise_id,
+                    ExerciseDailyActivityModel.activity_date >= since,
+                ),
+            )
+            .group_by(ExercisePopularityModel.exercise_id, ExercisePopularityModel.user_count)
+        )
+
+        return {row.exercise_id: (row.user_count, row.recent_sessions) for row in result}
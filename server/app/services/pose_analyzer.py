@@ -1,14 +1,18 @@
 # app/services/pose_analyzer.py
 
 import asyncio
-import threading
-from pathlib import Path
+from collections.abc import Awaitable, Callable
 from typing import Any, Dict, List
 
 import numpy as np
-import tensorflow as tf
 
-from app.utils import PushupCounter, SquatCounter, preprocess_pushup, preprocess_squat
+from app.core.database import session_scope
+from app.services.inference_batcher import InferenceQueueFull, pose_batcher
+from app.services.live_session import LiveSessionState, session_progress_writer
+from app.services.model_registry import model_registry
+from app.services.socket_service import SocketService
+from app.services.workout_service import WorkoutService
+from app.utils import PushupCounter, SquatCounter, new_pose_input_buffer, preprocess_landmarks
 
 
 class SessionCounter:
@@ -19,11 +23,17 @@ class SessionCounter:
         self.exercise_type = exercise_type
         self.counter = None
 
+        # 프레임마다 재사용하는 (1, 63) 모델 입력 버퍼
+        self.input_buffer = new_pose_input_buffer()
+
         # 서비스 객체들
         self.websocket = None
-        self.workout_service = None
-        self.socket_service = None
-        self.socket_session_id = None
+        self.state = None
+
+        # 카운터 이벤트 채널 - 연결의 이벤트 루프에서 하나의 디스패처 태스크가 순서대로 처리
+        # (일시정지/재개/수동 반복 등 세션 상태를 바꾸는 메시지도 run_in_order로 같은 채널을 거침)
+        self._events: asyncio.Queue = asyncio.Queue()
+        self._dispatch_task: asyncio.Task | None = None
 
         # 운동 타입에 따른 카운터 생성
         if exercise_type == "푸쉬업":
@@ -31,41 +41,67 @@ class SessionCounter:
         elif exercise_type == "스쿼트":
             self.counter = SquatCounter(threshold=0.7, callback=self._handle_counter_message)
 
-        self.counter.start()
-
-    def set_services(self, websocket, workout_service, socket_service, socket_session_id):
-        """서비스 객체들 설정"""
+    def set_services(self, websocket, state: LiveSessionState):
+        """WebSocket과 연결의 실시간 세션 상태 설정 (DB 세션은 이벤트 처리 단위로 체크아웃)"""
         self.websocket = websocket
-        self.workout_service = workout_service
-        self.socket_service = socket_service
-        self.socket_session_id = socket_session_id
+        self.state = state
+
+        # 서비스가 준비되면 이벤트 디스패처 시작 (그 전에 쌓인 이벤트도 순서대로 처리됨)
+        if self._dispatch_task is None:
+            self._dispatch_task = asyncio.get_running_loop().create_task(self._dispatch_events())
 
     def _handle_counter_message(self, message_data: Dict[str, Any]):
-        """카운터에서 생성된 메시지 처리"""
+        """카운터에서 생성된 메시지를 이벤트 채널에 적재 (스레드/이벤트 루프 생성 없음)"""
         if message_data:
+            self._events.put_nowait(message_data)
+
+    async def run_in_order(self, job: Callable[[], Awaitable[Any]]) -> Any:
+        """앞서 쌓인 반복 이벤트를 모두 처리한 뒤 디스패처에서 job을 실행하고 결과 반환
+
+        job이 끝날 때까지 다음 반복 이벤트는 처리되지 않으므로 DB 조회 결과로 상태를 덮어써도 반복이 유실되지 않는다.
+        """
+        if self._dispatch_task is None or self._dispatch_task.done():
+            return await job()
+
+        future = asyncio.get_running_loop().create_future()
+        self._events.put_nowait((job, future))
+        return await future
 
-            def process_message():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self._process_message_async(message_data))
-                loop.close()
+    async def _dispatch_events(self):
+        """이벤트 채널 소비 - 반복 저장, WebSocket 전송, 상태 변경 메시지를 발생 순서대로 처리"""
+        while True:
+            message_data = await self._events.get()
 
-            thread = threading.Thread(target=process_message, daemon=True)
-            thread.start()
+            # 종료 신호
+            if message_data is None:
+                return
+
+            # run_in_order로 들어온 작업
+            if isinstance(message_data, tuple):
+                job, future = message_data
+                try:
+                    result = await job()
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+                continue
+
+            try:
+                await self._process_message_async(message_data)
+            except Exception as e:
+                print(f"Counter event dispatch error: {e}")
 
     async def _process_message_async(self, message_data: Dict[str, Any]):
         """WebSocket 전송"""
 
         if message_data.get("type") == "pushup_feedback":
             data = message_data.get("data", {})
-            socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
 
             if data.get("rep_detected", False):
-                await self.workout_service.complete_rep(socket_session.session_id, 1)
-
-                updated_session = await self.workout_service.get_workout_session(
-                    socket_session.session_id, socket_session.user_id
-                )
+                updated_session = await self._record_rep()
 
                 set_completed = self._check_set_completed(updated_session)
 
@@ -73,7 +109,7 @@ class SessionCounter:
 
                 if workout_completed:
                     # 전체 운동 완료 - 세션 종료
-                    await self._handle_workout_completion(socket_session)
+                    await self._handle_workout_completion()
                     return
 
                 response_data = {
@@ -91,11 +127,7 @@ class SessionCounter:
                 }
 
             elif data.get("failed_detected", False):
-                await self.workout_service.complete_failed_rep(socket_session.session_id, 1)
-
-                updated_session = await self.workout_service.get_workout_session(
-                    socket_session.session_id, socket_session.user_id
-                )
+                updated_session = await self._record_failed_rep()
 
                 response_data = {
                     "type": "rep_success",
@@ -113,20 +145,15 @@ class SessionCounter:
 
         elif message_data.get("type") == "squat_feedback":
             data = message_data.get("data", {})
-            socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
 
             if data.get("rep_detected", False):
-                await self.workout_service.complete_rep(socket_session.session_id, 1)
-
-                updated_session = await self.workout_service.get_workout_session(
-                    socket_session.session_id, socket_session.user_id
-                )
+                updated_session = await self._record_rep()
 
                 set_completed = self._check_set_completed(updated_session)
                 workout_completed = self._check_workout_completed(updated_session)
 
                 if workout_completed:
-                    await self._handle_workout_completion(socket_session)
+                    await self._handle_workout_completion()
                     return
 
                 response_data = {
@@ -150,6 +177,38 @@ class SessionCounter:
 
         await self.websocket.send_json(response_data)
 
+    async def _record_rep(self):
+        """반복 완료 기록 - write-behind 모드에서는 메모리에 반영하고 세트 완료/N개 누적 시에만 저장"""
+        if not session_progress_writer.enabled:
+            async with session_scope() as db:
+                workout_service = WorkoutService(db)
+                await workout_service.complete_rep(self.state.session_id, 1)
+                updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
+            self.state.update_from(updated_session)
+            return updated_session
+
+        set_completed = self.state.apply_rep(1)
+        if set_completed or session_progress_writer.should_flush(self.state):
+            await session_progress_writer.flush(self.state)
+
+        return self.state.to_detail()
+
+    async def _record_failed_rep(self):
+        """실패한 반복 기록 - write-behind 모드에서는 메모리에 반영하고 N개 누적 시에만 저장"""
+        if not session_progress_writer.enabled:
+            async with session_scope() as db:
+                workout_service = WorkoutService(db)
+                await workout_service.complete_failed_rep(self.state.session_id, 1)
+                updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
+            self.state.update_from(updated_session)
+            return updated_session
+
+        self.state.apply_failed_rep(1)
+        if session_progress_writer.should_flush(self.state):
+            await session_progress_writer.flush(self.state)
+
+        return self.state.to_detail()
+
     def _check_set_completed(self, session) -> bool:
         """세트 완료 여부 확인 - current_set_reps가 0이고 이전에 반복이 있었다면 세트 완료"""
         return session.current_set_reps == 0 and session.total_reps_completed > 0
@@ -160,26 +219,32 @@ class SessionCounter:
             return session.current_set > session.level.target_sets
         return False
 
-    async def _handle_workout_completion(self, socket_session):
+    async def _handle_workout_completion(self):
         """운동 완료"""
         try:
-            # 총 칼로리 계산 및 저장
-            updated_session = await self.workout_service.get_workout_session(
-                socket_session.session_id, socket_session.user_id
-            )
+            # 메모리에만 반영된 반복 수를 먼저 저장
+            await session_progress_writer.flush(self.state)
+
+            async with session_scope() as db:
+                workout_service = WorkoutService(db)
 
-            total_calories = updated_session.total_reps_completed * updated_session.exercise.calorie
-            await self.workout_service.update_total_calories(socket_session.session_id, total_calories)
+                # 총 칼로리 계산 및 저장
+                updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
 
-            # 운동 세션 완료 처리
-            result = await self.workout_service.complete_workout(socket_session.session_id)
+                total_calories = updated_session.total_reps_completed * updated_session.exercise.calorie
+                await workout_service.update_total_calories(self.state.session_id, total_calories)
+
+                # 운동 세션 완료 처리
+                result = await workout_service.complete_workout(self.state.session_id)
+                self.state.status = "completed"
 
             completion_message = {"type": "workout_completed", "data": {}}
 
             await self.websocket.send_json(completion_message)
 
             # 연결 상태 업데이트 후 종료
-            await self.socket_service.update_connection_status(socket_session.socket_session_id, "disconnected")
+            async with session_scope() as db:
+                await SocketService(db).update_connection_status(self.state.socket_session_id, "disconnected")
             await self.websocket.close()
 
         except Exception as e:
@@ -190,17 +255,32 @@ class SessionCounter:
                 pass
 
     def update_position(self, *args):
-        """카운터에 포지션 정보 전달"""
+        """카운터 상태 머신을 현재 프레임으로 한 단계 진행 (이벤트 루프에서 바로 실행)"""
         if self.exercise_type == "푸쉬업":
             position, down, up, mid = args[:4]
-            self.counter.position.put((position, down, up, mid))
+            self.counter.step(position, down, up, mid)
         elif self.exercise_type == "스쿼트":
             position, confidence = args[:2]
-            self.counter.position.put((position, confidence))
+            self.counter.step(position, confidence)
+
+    async def cleanup(self):
+        """세션 카운터 정리 - 이미 발생한 이벤트는 모두 처리한 뒤 디스패처 종료"""
+        self.counter.message_callback = None
 
-    def cleanup(self):
-        """카운터 스레드 정리"""
-        self.counter.stop()
+        if self._dispatch_task is None:
+            return
+
+        self._events.put_nowait(None)
+        try:
+            await asyncio.wait_for(self._dispatch_task, timeout=5)
+        except (TimeoutError, asyncio.CancelledError):
+            pass
+
+        # 종료 신호 뒤에 들어온 작업은 실행하지 않고 취소
+        while not self._events.empty():
+            message_data = self._events.get_nowait()
+            if isinstance(message_data, tuple):
+                message_data[1].cancel()
 
 
 class PoseAnalyzer:
@@ -212,16 +292,13 @@ class PoseAnalyzer:
         self.load_models()
 
     def load_models(self):
-        """TFLite 모델들 로드"""
-        # 푸쉬업 모델 로드
-        pushup_model_path = Path("models/tf_lite_model/pushup_classifier.tflite")
-        self.models["pushup"] = tf.lite.Interpreter(model_path=str(pushup_model_path))
-        self.models["pushup"].allocate_tensors()
+        """공유 모델 레지스트리에서 TFLite 인터프리터 풀 참조 (프로세스당 1회 로드)"""
+        self.models["pushup"] = model_registry.get_pool("pushup")
+        self.models["squat"] = model_registry.get_pool("squat")
 
-        # 스쿼트 모델 로드
-        squat_model_path = Path("models/tf_lite_model/squat_classifier_v2.tflite")
-        self.models["squat"] = tf.lite.Interpreter(model_path=str(squat_model_path))
-        self.models["squat"].allocate_tensors()
+    async def _invoke(self, model_name: str, input_data: np.ndarray) -> np.ndarray:
+        """세션 간 배처를 통해 추론 (추론 스레드에서 실행되어 이벤트 루프를 막지 않음)"""
+        return await pose_batcher.infer(model_name, input_data)
 
     def _safe_float_conversion(self, value) -> float:
         """안전한 float 변환"""
@@ -248,17 +325,17 @@ class PoseAnalyzer:
 
         counter = self.session_counters[session_id]
 
-        # MediaPipe 랜드마크 → (1,63) float32 벡터 변환
-        input_data = preprocess_pushup(landmarks)
+        # MediaPipe 랜드마크 → (1,63) float32 벡터 변환 (세션 버퍼 재사용)
+        input_data = preprocess_landmarks(landmarks, counter.input_buffer)
+        if input_data is None:
+            return None
 
         # TFLite 추론
-        interpreter = self.models["pushup"]
-        input_details = interpreter.get_input_details()
-        output_details = interpreter.get_output_details()
-
-        interpreter.set_tensor(input_details[0]["index"], input_data)
-        interpreter.invoke()
-        output_data = interpreter.get_tensor(output_details[0]["index"])
+        try:
+            output_data = await self._invoke("pushup", input_data)
+        except InferenceQueueFull:
+            # 추론 대기열 포화 - 이번 프레임은 건너뜀
+            return None
 
         # 확률 추출
         probs = output_data[0] if len(output_data.shape) > 1 else output_data
@@ -295,15 +372,14 @@ class PoseAnalyzer:
         counter = self.session_counters[session_id]
 
         # 스쿼트 모델 추론
-        input_data = preprocess_squat(landmarks)
-
-        interpreter = self.models["squat"]
-        input_details = interpreter.get_input_details()
-        output_details = interpreter.get_output_details()
-
-        interpreter.set_tensor(input_details[0]["index"], input_data)
-        interpreter.invoke()
-        output_data = interpreter.get_tensor(output_details[0]["index"])
+        input_data = preprocess_landmarks(landmarks, counter.input_buffer)
+        if input_data is None:
+            return None
+        try:
+            output_data = await self._invoke("squat", input_data)
+        except InferenceQueueFull:
+            # 추론 대기열 포화 - 이번 프레임은 건너뜀
+            return None
 
         # 확률 추출
         probs = output_data[0] if len(output_data.shape) > 1 else output_data
@@ -322,8 +398,8 @@ class PoseAnalyzer:
             "confidence": round(confidence, 3),
         }
 
-    def cleanup_session(self, session_id: int):
+    async def cleanup_session(self, session_id: int):
         """세션 종료 시 카운터 정리"""
-        if session_id in self.session_counters:
-            self.session_counters[session_id].cleanup()
-            del self.session_counters[session_id]
+        counter = self.session_counters.pop(session_id, None)
+        if counter is not None:
+            await counter.cleanup()
@@ -0,0 +1,154 @@
+# app/services/search_index.py
+
+from typing import Dict, List, Set, Tuple
+
+from app.schemas.exercise import ExerciseList
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 초성/중성/종성 (호환용 자모)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+# 종성은 받침 없음("")을 포함한 28개
+JONGSEONG = [""] + list("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 겹자모는 입력 중에 두 글자로 나뉘어 들어오므로 분해해서 비교
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}  # fmt: skip
+
+# 필드 / 일치 방식별 순위 (작을수록 앞)
+FIELD_RANK = {"name": 0, "category": 1}
+FORM_RANK = {"text": 0, "jamo": 1, "choseong": 2}
+
+
+def normalize(text: str) -> str:
+    """소문자 + 공백 제거"""
+    return "".join(text.lower().split())
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모 단위로 분해 (예: 스쿼트 -> ㅅㅡㅋㅜㅓㅌㅡ), 그 외 문자는 그대로"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            chars.append(CHOSEONG[offset // 588])
+            chars.append(JUNGSEONG[(offset % 588) // 28])
+            chars.append(JONGSEONG[offset % 28])
+        else:
+            chars.append(char)
+
+    return "".join(COMPOUND_JAMO.get(char, char) for char in "".join(chars))
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (예: 스쿼트 -> ㅅㅋㅌ), 그 외 문자는 그대로"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성(자음)만으로 이루어진 검색어인지"""
+    return bool(text) and all(char in CHOSEONG for char in text)
+
+
+def ngrams(text: str) -> Set[str]:
+    """2-gram 집합 (한 글자면 그 글자)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+class ExerciseSearchIndex:
+    """운동 카탈로그 메모리 검색 색인 (운동명/카테고리명, n-gram + 자모/초성 분해)
+
+    각 필드를 정규화 문자열, 자모 분해 문자열, 초성 문자열 세 가지 형태로 보관하고 형태별 1/2-gram 역색인으로
+    후보를 좁힌 뒤 부분 문자열 일치를 확인한다. 자모 분해 덕분에 아직 입력 중인 음절(예: '스쿠' -> 스쿼트,
+    '푸싱' -> 푸시업)과 초성 검색(예: 'ㅅㅋㅌ')도 일치한다.
+    """
+
+    def __init__(self, exercises: List[ExerciseList]):
+        self.exercises = exercises
+        # (필드, 형태) -> 문서별 문자열
+        self._texts: Dict[Tuple[str, str], List[str]] = {}
+        # (필드, 형태) -> 2-gram -> 문서 번호 집합
+        self._postings: Dict[Tuple[str, str], Dict[str, Set[int]]] = {}
+
+        fields = {
+            "name": [normalize(exercise.name) for exercise in exercises],
+            "category": [normalize(exercise.category.name) for exercise in exercises],
+        }
+        for field, texts in fields.items():
+            forms = {"text": texts, "jamo": [to_jamo(t) for t in texts], "choseong": [to_choseong(t) for t in texts]}
+            for form, values in forms.items():
+                postings: Dict[str, Set[int]] = {}
+                for doc_id, value in enumerate(values):
+                    # 한 글자 검색어도 색인으로 찾도록 1-gram도 함께 색인
+                    for gram in ngrams(value) | set(value):
+                        postings.setdefault(gram, set()).add(doc_id)
+                self._texts[(field, form)] = values
+                self._postings[(field, form)] = postings
+
+    def _candidates(self, key: Tuple[str, str], query: str) -> Set[int]:
+        """query의 모든 2-gram을 포함하는 문서 (부분 문자열 일치의 필요조건)"""
+        postings = self._postings[key]
+        candidates: Set[int] | None = None
+
+        for gram in ngrams(query):
+            docs = postings.get(gram)
+            if not docs:
+                return set()
+            candidates = set(docs) if candidates is None else candidates & docs
+            if not candidates:
+                return set()
+
+        return candidates or set()
+
+    def search(self, query: str, limit: int | None = None) -> List[ExerciseList]:
+        """검색어와 일치하는 운동을 순위 순으로 반환
+
+        순위: 운동명 > 카테고리명, 원문 > 자모 > 초성 일치, 앞부분 일치 > 중간 일치, 짧은 이름 우선
+        """
+        normalized = normalize(query)
+        if not normalized:
+            return []
+
+        # 초성만 입력했으면 초성 문자열과, 아니면 자모 분해 문자열과 비교 (초성을 자모에 비교하면 받침까지 일치)
+        queries = {"text": normalized}
+        if is_choseong_query(normalized):
+            queries["choseong"] = normalized
+        else:
+            queries["jamo"] = to_jamo(normalized)
+
+        best: Dict[int, Tuple[int, int, int, int]] = {}
+        for (field, form), texts in self._texts.items():
+            form_query = queries.get(form)
+            if form_query is None:
+                continue
+
+            for doc_id in self._candidates((field, form), form_query):
+                position = texts[doc_id].find(form_query)
+                if position < 0:
+                    continue
+
+                rank = (FIELD_RANK[field], FORM_RANK[form], position, len(self._texts[("name", "text")][doc_id]))
+                if doc_id not in best or rank < best[doc_id]:
+                    best[doc_id] = rank
+
+        # 동순위면 카탈로그(이름) 순
+        ranked = sorted(best, key=lambda doc_id: (best[doc_id], doc_id))
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        return [self.exercises[doc_id] for doc_id in ranked]
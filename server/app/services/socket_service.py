@@ -1,74 +1,60 @@
 # app/services/socket_service.py
 
 # finalize_workout 메서드 제거하고 기본 기능만 유지
-import uuid
 from datetime import datetime
+from typing import Dict
 
-from sqlalchemy import update
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
 from app.models.socket_session import SocketSessionModel
 
 
 class SocketService:
     """소켓 세션 관리 서비스"""
 
-    def __init__(self):
-        self.db = next(get_db())
-
-    async def create_socket_session(self, session_id: int, user_id: int) -> SocketSessionModel:
-        """새로운 소켓 세션 생성"""
-
-        socket_session_id = str(uuid.uuid4())
-
-        socket_session = SocketSessionModel(
-            session_id=session_id,
-            socket_session_id=socket_session_id,
-            user_id=user_id,
-            connection_status="pending",
-            last_heartbeat=datetime.utcnow(),
-        )
-
-        self.db.add(socket_session)
-        self.db.commit()
-        self.db.refresh(socket_session)
-
-        return socket_session
+    def __init__(self, db: AsyncSession):
+        # 호출자의 작업 단위(요청 의존성 또는 session_scope) async 세션을 사용
+        self.db = db
 
     async def get_socket_session(self, socket_session_id: str) -> SocketSessionModel | None:
         """소켓 세션 조회"""
-        return (
-            self.db.query(SocketSessionModel).filter(SocketSessionModel.socket_session_id == socket_session_id).first()
-        )
+        return await self.db.get(SocketSessionModel, socket_session_id)
 
     async def update_connection_status(self, socket_session_id: str, status: str) -> bool:
         """연결 상태 업데이트"""
         try:
-            result = self.db.execute(
+            result = await self.db.execute(
                 update(SocketSessionModel)
                 .where(SocketSessionModel.socket_session_id == socket_session_id)
                 .values(connection_status=status, last_heartbeat=datetime.utcnow())
             )
-            self.db.commit()
+            await self.db.commit()
             return result.rowcount > 0
         except Exception:
-            self.db.rollback()
+            await self.db.rollback()
             return False
 
-    async def update_heartbeat(self, socket_session_id: str) -> bool:
-        """하트비트 업데이트"""
+    async def update_heartbeats(self, heartbeats: Dict[str, datetime]) -> int:
+        """여러 소켓 세션의 마지막 하트비트를 기본키 기준 bulk UPDATE 한 번으로 저장"""
+        if not heartbeats:
+            return 0
+
         try:
-            result = self.db.execute(
-                update(SocketSessionModel)
-                .where(SocketSessionModel.socket_session_id == socket_session_id)
-                .values(last_heartbeat=datetime.utcnow())
+            await self.db.execute(
+                update(SocketSessionModel),
+                [
+                    {"socket_session_id": socket_session_id, "last_heartbeat": beat_time}
+                    for socket_session_id, beat_time in heartbeats.items()
+                ],
             )
-            self.db.commit()
-            return result.rowcount > 0
+            await self.db.commit()
+            return len(heartbeats)
         except Exception:
-            self.db.rollback()
-            return False
+            await self.db.rollback()
+            raise
 
     async def get_socket_session_by_workout(self, session_id: int) -> SocketSessionModel | None:
         """운동 세션 ID로 소켓 세션 조회"""
-        return self.db.query(SocketSessionModel).filter(SocketSessionModel.session_id == session_id).first()
+        result = await self.db.execute(select(SocketSessionModel).where(SocketSessionModel.session_id == session_id))
+        return result.scalars().first()
@@ -5,21 +5,27 @@ from pathlib import Path
 from typing import List
 
 from app.core.auth import get_password_hash, verify_password
-from app.core.database import SessionLocal
+from app.core.database import AsyncSessionLocal
 from app.models.user import UserModel
 from app.schemas.user import User, UserCreateEmail, UserCreateGoogle, UserDetail
 from fastapi import UploadFile
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class UserService:
-    def __init__(self):
-        pass
+    def __init__(self, db: AsyncSession | None = None):
+        # 요청 세션을 주입받으면 공유하고, 없으면 메서드마다 세션을 열고 닫음
+        self.db = db
 
-    def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
-        return SessionLocal()
+    def _get_db(self) -> AsyncSession:
+        """데이터베이스 async 세션 (주입받은 요청 세션 또는 새 세션)"""
+        return self.db if self.db is not None else AsyncSessionLocal()
+
+    async def _release_db(self, db: AsyncSession):
+        """직접 연 세션만 닫음 (요청 세션은 요청 종료 시 반환)"""
+        if db is not self.db:
+            await db.close()
 
     async def get_user_detail(self, user_id: int, current_user: User | None = None) -> UserDetail | None:
         """사용자 상세 정보 조회"""
@@ -27,7 +33,7 @@ class UserService:
         try:
             # 1. 기본 사용자 정보 조회
             stmt = select(UserModel).where(UserModel.user_id == user_id)
-            user_model = db.execute(stmt).scalar_one_or_none()
+            user_model = (await db.execute(stmt)).scalar_one_or_none()
 
             if not user_model:
                 return None
@@ -56,13 +62,13 @@ class UserService:
         except Exception as e:
             raise Exception(f"사용자 상세 정보 조회 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
 
     async def get_user_by_email(self, email: str) -> User | None:
         db = self._get_db()
         try:
             stmt = select(UserModel).where(UserModel.email == email)
-            result = db.execute(stmt)
+            result = await db.execute(stmt)
             user_model = result.scalar_one_or_none()
 
             return User.from_orm(user_model) if user_model else None
@@ -70,7 +76,7 @@ class UserService:
         except Exception as e:
             raise Exception(f"사용자 조회 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
 
     async def create_user_email(self, user_data: UserCreateEmail) -> User:
         db = self._get_db()
@@ -93,16 +99,16 @@ class UserService:
             )
 
             db.add(user_model)
-            db.commit()
-            db.refresh(user_model)
+            await db.commit()
+            await db.refresh(user_model)
 
             return User.from_orm(user_model)
 
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"이메일 회원가입 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
 
     async def create_user_google(self, user_data: UserCreateGoogle) -> User:
         db = self._get_db()
@@ -128,22 +134,22 @@ class UserService:
             )
 
             db.add(user_model)
-            db.commit()
-            db.refresh(user_model)
+            await db.commit()
+            await db.refresh(user_model)
 
             return User.from_orm(user_model)
 
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"Google 회원가입 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
 
     async def authenticate_user_email(self, email: str, password: str) -> User | None:
         db = self._get_db()
         try:
             stmt = select(UserModel).where(UserModel.email == email)
-            user_model = db.execute(stmt).scalar_one_or_none()
+            user_model = (await db.execute(stmt)).scalar_one_or_none()
 
             if not user_model or user_model.google_id or not verify_password(password, user_model.password_hash):
                 return None
@@ -152,28 +158,28 @@ class UserService:
             from datetime import datetime
 
             user_model.updated_at = datetime.utcnow()
-            db.commit()
+            await db.commit()
 
             return User.from_orm(user_model)
 
         except Exception as e:
             raise Exception(f"이메일 로그인 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
 
     async def authenticate_user_google(self, email: str, google_id: str) -> User | None:
         db = self._get_db()
         try:
             # Google ID로 사용자 조회
             stmt = select(UserModel).where(UserModel.google_id == google_id)
-            user_model = db.execute(stmt).scalar_one_or_none()
+            user_model = (await db.execute(stmt)).scalar_one_or_none()
 
             if user_model and user_model.email == email:
                 # 마지막 로그인 시간 업데이트
                 from datetime import datetime
 
                 user_model.updated_at = datetime.utcnow()
-                db.commit()
+                await db.commit()
 
                 return User.from_orm(user_model)
 
@@ -182,7 +188,7 @@ class UserService:
         except Exception as e:
             raise Exception(f"Google 로그인 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
 
     async def check_email_exists(self, email: str) -> bool:
         user = await self.get_user_by_email(email)
@@ -196,7 +202,7 @@ class UserService:
         try:
             # 사용자 조회
             stmt = select(UserModel).where(UserModel.user_id == user_id)
-            user_model = db.execute(stmt).scalar_one_or_none()
+            user_model = (await db.execute(stmt)).scalar_one_or_none()
 
             if not user_model:
                 raise Exception("사용자를 찾을 수 없습니다")
@@ -247,23 +253,23 @@ class UserService:
 
             user_model.updated_at = datetime.utcnow()
 
-            db.commit()
-            db.refresh(user_model)
+            await db.commit()
+            await db.refresh(user_model)
 
             return User.from_orm(user_model), updated_fields
 
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"프로필 업데이트 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
 
     async def verify_current_password(self, user_id: int, password: str) -> bool:
         """현재 비밀번호 확인"""
         db = self._get_db()
         try:
             stmt = select(UserModel).where(UserModel.user_id == user_id)
-            user_model = db.execute(stmt).scalar_one_or_none()
+            user_model = (await db.execute(stmt)).scalar_one_or_none()
 
             if not user_model or user_model.google_id:
                 return False
@@ -273,18 +279,18 @@ class UserService:
         except Exception:
             return False
         finally:
-            db.close()
+            await self._release_db(db)
 
-    async def _check_user_by_email(self, email: str, db: Session) -> bool:
+    async def _check_user_by_email(self, email: str, db: AsyncSession) -> bool:
         """이메일 중복 체크"""
         stmt = select(UserModel).where(UserModel.email == email)
-        result = db.execute(stmt).scalar_one_or_none()
+        result = (await db.execute(stmt)).scalar_one_or_none()
         return result is not None
 
-    async def _check_user_by_google_id(self, google_id: str, db: Session) -> bool:
+    async def _check_user_by_google_id(self, google_id: str, db: AsyncSession) -> bool:
         """Google ID 중복 체크"""
         stmt = select(UserModel).where(UserModel.google_id == google_id)
-        result = db.execute(stmt).scalar_one_or_none()
+        result = (await db.execute(stmt)).scalar_one_or_none()
         return result is not None
 
     async def _save_profile_image(self, user_id: int, image_file: UploadFile) -> str:
@@ -324,10 +330,10 @@ class UserService:
         db = self._get_db()
         try:
             stmt = select(UserModel)
-            result = db.execute(stmt)
+            result = await db.execute(stmt)
             return [User.from_orm(user_model) for user_model in result.scalars()]
 
         except Exception as e:
             raise Exception(f"전체 사용자 조회 실패: {str(e)}")
         finally:
-            db.close()
+            await self._release_db(db)
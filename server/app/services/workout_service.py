@@ -1,69 +1,182 @@
 # app/services/workout_service.py
 
+import uuid
 from datetime import datetime
+from typing import Any, Dict, List
 
-from app.core.database import get_db
 from app.models.exercise_level import ExerciseLevelModel
+from app.models.socket_session import SocketSessionModel
+from app.models.user import UserModel
 from app.models.user_exercise import UserExerciseModel
 from app.models.workout_session import WorkoutSessionModel
 from app.schemas.workout import WorkoutSessionDetail
-from sqlalchemy import and_
+from app.services.home_cache import home_cache
+from app.services.popularity_service import PopularityService
+from sqlalchemy import DateTime, and_, bindparam, case, func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+# write-behind flush가 증가분으로 저장하는 운동 세션 카운터 컬럼
+SESSION_PROGRESS_COUNTERS = ("current_set", "current_set_reps", "total_reps_completed", "total_reps_failed")
+
+
+def _current_duration_expr(current_time: datetime):
+    """WorkoutSessionModel.get_current_duration과 같은 계산을 UPDATE 안에서 쓰는 SQL 식으로 표현 (갱신 전 행 값 기준)"""
+    now_epoch = func.extract("epoch", literal(current_time, DateTime))
+    total_elapsed = now_epoch - func.extract("epoch", WorkoutSessionModel.start_time)
+    current_pause_time = case(
+        (
+            and_(WorkoutSessionModel.status == "paused", WorkoutSessionModel.last_pause_time.is_not(None)),
+            now_epoch - func.extract("epoch", WorkoutSessionModel.last_pause_time),
+        ),
+        else_=0.0,
+    )
+    actual_duration = total_elapsed - WorkoutSessionModel.total_pause_duration - current_pause_time
+
+    return case(
+        (
+            and_(WorkoutSessionModel.status == "completed", WorkoutSessionModel.end_time.is_not(None)),
+            WorkoutSessionModel.duration_seconds,
+        ),
+        (actual_duration < 0, 0.0),
+        else_=actual_duration,
+    )
+
 
 class WorkoutService:
     """운동 세션 관리 서비스"""
 
-    def __init__(self):
-        self.db = next(get_db())
+    def __init__(self, db: AsyncSession):
+        # 호출자의 작업 단위(요청 의존성 또는 session_scope) async 세션을 사용
+        self.db = db
+
+    async def _get_session(self, session_id: int, *options) -> WorkoutSessionModel | None:
+        """세션 ID로 운동 세션 조회 (async 세션에서는 지연 로딩이 불가하므로 필요한 관계는 options로 함께 로드)"""
+        result = await self.db.execute(
+            select(WorkoutSessionModel).options(*options).where(WorkoutSessionModel.session_id == session_id)
+        )
+        return result.scalars().first()
+
+    async def _update_session_counters(self, session_id: int, **values) -> WorkoutSessionModel:
+        """운동 세션 카운터 원자적 갱신 - UPDATE ... SET x = x + :n ... RETURNING 한 번의 왕복
+
+        값은 모두 갱신 전 행 기준 SQL 식으로 계산되므로 동시에 들어온 증가분이 유실되지 않는다.
+        """
+        current_time = datetime.utcnow()
+        result = await self.db.execute(
+            update(WorkoutSessionModel)
+            .where(WorkoutSessionModel.session_id == session_id)
+            .values(**values, duration_seconds=_current_duration_expr(current_time), updated_at=current_time)
+            .returning(WorkoutSessionModel)
+        )
+        session = result.scalars().first()
+
+        if not session:
+            raise ValueError("Session not found")
+
+        await self.db.commit()
+        return session
 
     async def get_exercise_level(self, exercise_id: int, level: int) -> ExerciseLevelModel | None:
         """운동 레벨 정보 조회"""
-        return (
-            self.db.query(ExerciseLevelModel)
+        result = await self.db.execute(
+            select(ExerciseLevelModel)
             .options(joinedload(ExerciseLevelModel.exercise))
-            .filter(
+            .where(
                 and_(
                     ExerciseLevelModel.exercise_id == exercise_id,
                     ExerciseLevelModel.level == level,
                 )
             )
-            .first()
         )
+        return result.scalars().first()
 
     async def get_user_exercise(self, user_id: int, exercise_id: int) -> UserExerciseModel | None:
         """사용자 운동 정보 조회"""
-        return (
-            self.db.query(UserExerciseModel)
-            .filter(
+        result = await self.db.execute(
+            select(UserExerciseModel).where(
                 and_(
                     UserExerciseModel.user_id == user_id,
                     UserExerciseModel.exercise_id == exercise_id,
                 )
             )
-            .first()
         )
+        return result.scalars().first()
+
+    async def lock_start_context(self, user_id: int, exercise_id: int, level: int) -> Dict[str, Any]:
+        """운동 시작 검증 정보를 한 번의 조회로 가져오면서 사용자 행을 잠금
 
-    async def get_active_session(self, user_id: int) -> WorkoutSessionModel | None:
-        """사용자의 활성 운동 세션 조회"""
-        return (
-            self.db.query(WorkoutSessionModel)
-            .filter(
+        같은 사용자의 시작 요청은 트랜잭션이 끝날 때까지 직렬화되므로 재시도가 몰려도
+        두 번째 요청부터는 앞 요청이 만든 활성 세션을 보게 된다. (SQLite는 잠금 없이 동작)
+        """
+        active_filter = and_(
+            WorkoutSessionModel.user_id == user_id,
+            WorkoutSessionModel.status.in_(["active", "paused"]),
+        )
+        active_session_id = (
+            select(WorkoutSessionModel.session_id)
+            .where(active_filter)
+            .order_by(WorkoutSessionModel.session_id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        active_socket_session_id = (
+            select(SocketSessionModel.socket_session_id)
+            .join(WorkoutSessionModel, WorkoutSessionModel.session_id == SocketSessionModel.session_id)
+            .where(active_filter)
+            .order_by(WorkoutSessionModel.session_id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        level_id = (
+            select(ExerciseLevelModel.level_id)
+            .where(
                 and_(
-                    WorkoutSessionModel.user_id == user_id,
-                    WorkoutSessionModel.status.in_(["active", "paused"]),
+                    ExerciseLevelModel.exercise_id == exercise_id,
+                    ExerciseLevelModel.level == level,
                 )
             )
-            .first()
+            .scalar_subquery()
         )
+        current_level = (
+            select(UserExerciseModel.current_level)
+            .where(
+                and_(
+                    UserExerciseModel.user_id == user_id,
+                    UserExerciseModel.exercise_id == exercise_id,
+                )
+            )
+            .scalar_subquery()
+        )
+
+        result = await self.db.execute(
+            select(
+                active_session_id.label("active_session_id"),
+                active_socket_session_id.label("active_socket_session_id"),
+                level_id.label("level_id"),
+                current_level.label("current_level"),
+            )
+            .select_from(UserModel)
+            .where(UserModel.user_id == user_id)
+            .with_for_update(of=UserModel)
+        )
+        row = result.first()
 
-    async def create_workout_session(self, user_id: int, exercise_id: int, level_id: int) -> WorkoutSessionModel:
-        """새로운 운동 세션 생성"""
-        exercise_level = self.db.query(ExerciseLevelModel).filter(ExerciseLevelModel.level_id == level_id).first()
+        if not row:
+            raise ValueError("User not found")
 
-        if not exercise_level:
-            raise ValueError("Invalid exercise level")
+        return {
+            "active_session_id": row.active_session_id,
+            "active_socket_session_id": row.active_socket_session_id,
+            "level_id": row.level_id,
+            # 사용자 운동 기록이 없으면 레벨 1만 도전 가능
+            "max_available_level": row.current_level or 1,
+        }
 
+    async def create_session_with_socket(
+        self, user_id: int, exercise_id: int, level_id: int
+    ) -> tuple[WorkoutSessionModel, SocketSessionModel]:
+        """운동 세션과 소켓 세션을 한 번의 flush/commit으로 함께 생성"""
         current_time = datetime.utcnow()
 
         workout_session = WorkoutSessionModel(
@@ -80,29 +193,35 @@ class WorkoutService:
             total_pause_duration=0.0,
             duration_seconds=0.0,
         )
+        # 관계로 연결하면 flush 시 운동 세션 INSERT 후 생성된 session_id로 소켓 세션이 INSERT 됨
+        workout_session.socket_session = SocketSessionModel(
+            socket_session_id=str(uuid.uuid4()),
+            user_id=user_id,
+            connection_status="pending",
+            last_heartbeat=current_time,
+        )
 
         self.db.add(workout_session)
-        self.db.commit()
-        self.db.refresh(workout_session)
+        await self.db.commit()
 
-        return workout_session
+        return workout_session, workout_session.socket_session
 
     async def get_workout_session(self, session_id: int, user_id: int) -> WorkoutSessionDetail | None:
         """운동 세션 상세 조회"""
-        session = (
-            self.db.query(WorkoutSessionModel)
+        result = await self.db.execute(
+            select(WorkoutSessionModel)
             .options(
                 joinedload(WorkoutSessionModel.exercise),
                 joinedload(WorkoutSessionModel.level),
             )
-            .filter(
+            .where(
                 and_(
                     WorkoutSessionModel.session_id == session_id,
                     WorkoutSessionModel.user_id == user_id,
                 )
             )
-            .first()
         )
+        session = result.scalars().first()
 
         if not session:
             return None
@@ -111,7 +230,7 @@ class WorkoutService:
 
     async def get_session_status(self, session_id: int) -> dict:
         """세션 상태 및 실시간 정보 조회"""
-        session = self.db.query(WorkoutSessionModel).filter(WorkoutSessionModel.session_id == session_id).first()
+        session = await self._get_session(session_id)
 
         if not session:
             raise ValueError("Session not found")
@@ -133,59 +252,66 @@ class WorkoutService:
 
     async def complete_failed_rep(self, session_id: int, failed_reps: int = 1) -> WorkoutSessionModel:
         """실패한 반복 처리"""
-        session = (
-            self.db.query(WorkoutSessionModel)
-            .options(joinedload(WorkoutSessionModel.exercise), joinedload(WorkoutSessionModel.level))
-            .filter(WorkoutSessionModel.session_id == session_id)
-            .first()
-        )
-
-        if not session:
-            raise ValueError("Session not found")
-
         # 실패 카운트만 증가
-        session.total_reps_failed += failed_reps
-        session.duration_seconds = session.get_current_duration()
-        session.updated_at = datetime.utcnow()
-
-        self.db.commit()
-        self.db.refresh(session)
-
-        return session
+        return await self._update_session_counters(
+            session_id, total_reps_failed=WorkoutSessionModel.total_reps_failed + failed_reps
+        )
 
     async def complete_rep(self, session_id: int, reps: int = 1) -> WorkoutSessionModel:
         """반복 완료 처리"""
-        session = (
-            self.db.query(WorkoutSessionModel)
-            .options(joinedload(WorkoutSessionModel.exercise), joinedload(WorkoutSessionModel.level))
-            .filter(WorkoutSessionModel.session_id == session_id)
-            .first()
+        # 세션 레벨의 목표 반복수 (UPDATE 안의 상관 서브쿼리)
+        target_reps = (
+            select(ExerciseLevelModel.target_reps)
+            .where(ExerciseLevelModel.level_id == WorkoutSessionModel.level_id)
+            .scalar_subquery()
+        )
+        set_completed = WorkoutSessionModel.current_set_reps + reps >= target_reps
+
+        # 현재 세트 반복수 및 총 반복수 증가, 목표 반복수 달성 시 자동 세트 증가 및 현재 세트 반복수 초기화
+        session = await self._update_session_counters(
+            session_id,
+            current_set=WorkoutSessionModel.current_set + case((set_completed, 1), else_=0),
+            current_set_reps=case((set_completed, 0), else_=WorkoutSessionModel.current_set_reps + reps),
+            total_reps_completed=WorkoutSessionModel.total_reps_completed + reps,
         )
 
-        if not session:
-            raise ValueError("Session not found")
-
-        prev_set = session.current_set
-
-        # 현재 세트 반복수 및 총 반복수 증가
-        session.current_set_reps += reps
-        session.total_reps_completed += reps
-
-        # 목표 반복수 달성 시 자동 세트 증가
-        target_reps = session.level.target_reps
-        if session.current_set_reps >= target_reps:
-            session.current_set += 1
-            session.current_set_reps = 0  # 현재 세트 반복수 초기화
-            print(f"Set {prev_set} completed! Moving to set {session.current_set}")
+        if session.current_set_reps == 0:
+            print(f"Set {session.current_set - 1} completed! Moving to set {session.current_set}")
 
-        # 실시간 운동 시간 업데이트
-        session.duration_seconds = session.get_current_duration()
-        session.updated_at = datetime.utcnow()
+        return session
 
-        self.db.commit()
-        self.db.refresh(session)
+    async def save_sessions_progress(self, rows: List[Dict[str, Any]]):
+        """write-behind 진행 상황 저장 - 여러 세션의 카운터 증가분을 UPDATE ... SET x = x + :delta 한 번으로 반영
+
+        rows의 카운터 값은 마지막 저장 이후 증가분이고 운동 시간은 현재 값이다.
+        증가분만 더하므로 수동 추가/차감 등 다른 경로에서 먼저 반영된 값을 덮어쓰지 않는다 (SELECT 없음).
+        """
+        if not rows:
+            return
+
+        table = WorkoutSessionModel.__table__
+        statement = (
+            update(table)
+            .where(table.c.session_id == bindparam("row_session_id"))
+            .values(
+                **{column: table.c[column] + bindparam(f"delta_{column}") for column in SESSION_PROGRESS_COUNTERS},
+                duration_seconds=bindparam("row_duration_seconds"),
+                updated_at=bindparam("row_updated_at"),
+            )
+        )
 
-        return session
+        current_time = datetime.utcnow()
+        params = [
+            {
+                "row_session_id": row["session_id"],
+                "row_duration_seconds": row["duration_seconds"],
+                "row_updated_at": current_time,
+                **{f"delta_{column}": row[column] for column in SESSION_PROGRESS_COUNTERS},
+            }
+            for row in rows
+        ]
+        await self.db.execute(statement, params)
+        await self.db.commit()
 
     async def manual_add_rep(self, session_id: int, reps: int = 1) -> WorkoutSessionModel:
         """수동 반복 추가"""
@@ -193,34 +319,21 @@ class WorkoutService:
 
     async def manual_subtract_rep(self, session_id: int, reps: int = 1) -> WorkoutSessionModel:
         """수동 반복 차감"""
-        session = (
-            self.db.query(WorkoutSessionModel)
-            .options(
-                joinedload(WorkoutSessionModel.exercise),
-                joinedload(WorkoutSessionModel.level),
-            )
-            .filter(WorkoutSessionModel.session_id == session_id)
-            .first()
-        )
-
-        if not session:
-            raise ValueError("Session not found")
-
         # 반복수 차감 (0 이하로는 내려가지 않음)
-        session.current_set_reps = max(0, session.current_set_reps - reps)
-        session.total_reps_completed = max(0, session.total_reps_completed - reps)
-
-        session.duration_seconds = session.get_current_duration()
-        session.updated_at = datetime.utcnow()
-
-        self.db.commit()
-        self.db.refresh(session)
-
-        return session
+        return await self._update_session_counters(
+            session_id,
+            current_set_reps=case(
+                (WorkoutSessionModel.current_set_reps > reps, WorkoutSessionModel.current_set_reps - reps), else_=0
+            ),
+            total_reps_completed=case(
+                (WorkoutSessionModel.total_reps_completed > reps, WorkoutSessionModel.total_reps_completed - reps),
+                else_=0,
+            ),
+        )
 
     async def pause_workout(self, session_id: int) -> WorkoutSessionModel:
         """운동 일시정지"""
-        session = self.db.query(WorkoutSessionModel).filter(WorkoutSessionModel.session_id == session_id).first()
+        session = await self._get_session(session_id)
 
         if not session:
             raise ValueError("Session not found")
@@ -236,14 +349,14 @@ class WorkoutService:
         session.duration_seconds = session.get_current_duration()  # 현재까지의 운동 시간 저장
         session.updated_at = current_time
 
-        self.db.commit()
-        self.db.refresh(session)
+        await self.db.commit()
+        await self.db.refresh(session)
 
         return session
 
     async def resume_workout(self, session_id: int) -> WorkoutSessionModel:
         """운동 재개"""
-        session = self.db.query(WorkoutSessionModel).filter(WorkoutSessionModel.session_id == session_id).first()
+        session = await self._get_session(session_id)
 
         if not session:
             raise ValueError("Session not found")
@@ -263,14 +376,14 @@ class WorkoutService:
         session.last_pause_time = None
         session.updated_at = current_time
 
-        self.db.commit()
-        self.db.refresh(session)
+        await self.db.commit()
+        await self.db.refresh(session)
 
         return session
 
     async def update_total_calories(self, session_id: int, total_calories: float) -> WorkoutSessionModel:
         """총 칼로리 업데이트"""
-        session = self.db.query(WorkoutSessionModel).filter(WorkoutSessionModel.session_id == session_id).first()
+        session = await self._get_session(session_id)
 
         if not session:
             raise ValueError("Session not found")
@@ -278,19 +391,14 @@ class WorkoutService:
         session.total_calories_burned = total_calories
         session.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(session)
+        await self.db.commit()
+        await self.db.refresh(session)
 
         return session
 
     async def complete_workout(self, session_id: int) -> dict:
         """운동 완료 처리"""
-        session = (
-            self.db.query(WorkoutSessionModel)
-            .options(joinedload(WorkoutSessionModel.level))
-            .filter(WorkoutSessionModel.session_id == session_id)
-            .first()
-        )
+        session = await self._get_session(session_id, joinedload(WorkoutSessionModel.level))
 
         if not session:
             raise ValueError("Session not found")
@@ -325,7 +433,10 @@ class WorkoutService:
             experience_gained,
         )
 
-        self.db.commit()
+        await self.db.commit()
+
+        # 최근 운동이 바뀌었으므로 홈 화면 캐시 무효화
+        home_cache.invalidate(session.user_id)
 
         return {
             "total_reps_completed": session.total_reps_completed,
@@ -344,23 +455,38 @@ class WorkoutService:
         duration_seconds: float,
         experience_points: int,
     ):
-        """사용자 운동 통계 업데이트"""
-        user_exercise = await self.get_user_exercise(user_id, exercise_id)
-
-        if user_exercise:
-            user_exercise.total_sessions += 1
-            user_exercise.total_reps_completed += total_reps
-            user_exercise.total_time_exercised += int(duration_seconds)
-            user_exercise.total_experience_points += experience_points
-            user_exercise.last_performed = datetime.utcnow()
-
-            if completed_level > user_exercise.highest_completed_level:
-                user_exercise.highest_completed_level = completed_level
-                if user_exercise.current_level <= completed_level:
-                    user_exercise.current_level = completed_level + 1
-
-            user_exercise.updated_at = datetime.utcnow()
-        else:
+        """사용자 운동 통계 업데이트 - 기존 행은 원자적 UPDATE 한 번, 없으면 새로 추가"""
+        current_time = datetime.utcnow()
+        level_up = UserExerciseModel.highest_completed_level < completed_level
+
+        result = await self.db.execute(
+            update(UserExerciseModel)
+            .where(
+                and_(
+                    UserExerciseModel.user_id == user_id,
+                    UserExerciseModel.exercise_id == exercise_id,
+                )
+            )
+            .values(
+                total_sessions=UserExerciseModel.total_sessions + 1,
+                total_reps_completed=UserExerciseModel.total_reps_completed + total_reps,
+                total_time_exercised=UserExerciseModel.total_time_exercised + int(duration_seconds),
+                total_experience_points=UserExerciseModel.total_experience_points + experience_points,
+                last_performed=current_time,
+                highest_completed_level=case(
+                    (level_up, completed_level), else_=UserExerciseModel.highest_completed_level
+                ),
+                current_level=case(
+                    (and_(level_up, UserExerciseModel.current_level <= completed_level), completed_level + 1),
+                    else_=UserExerciseModel.current_level,
+                ),
+                updated_at=current_time,
+            )
+            .returning(UserExerciseModel.user_exercise_id)
+        )
+
+        new_user = result.first() is None
+        if new_user:
             user_exercise = UserExerciseModel(
                 user_id=user_id,
                 exercise_id=exercise_id,
@@ -370,6 +496,9 @@ class WorkoutService:
                 total_reps_completed=total_reps,
                 total_time_exercised=int(duration_seconds),
                 total_experience_points=experience_points,
-                last_performed=datetime.utcnow(),
+                last_performed=current_time,
             )
             self.db.add(user_exercise)
+
+        # 운동별 인기도 집계 증분 갱신 (같은 트랜잭션에서 커밋)
+        await PopularityService(self.db).record_session(exercise_id, new_user=new_user, performed_at=current_time)
@@ -1,7 +1,28 @@
 # utils/__init__.py
 
-from .processing import preprocess, preprocess_pushup, preprocess_situp, preprocess_squat
+from .image_processing import FastImagePreprocessor, open_image_checked
+from .processing import (
+    landmarks_to_array,
+    new_pose_input_buffer,
+    preprocess,
+    preprocess_landmarks,
+    preprocess_pushup,
+    preprocess_situp,
+    preprocess_squat,
+)
 from .pushup_counter import PushupCounter
 from .squat_counter import SquatCounter
 
-__all__ = ["preprocess", "preprocess_pushup", "preprocess_squat", "preprocess_situp", "PushupCounter", "SquatCounter"]
+__all__ = [
+    "FastImagePreprocessor",
+    "open_image_checked",
+    "landmarks_to_array",
+    "new_pose_input_buffer",
+    "preprocess",
+    "preprocess_landmarks",
+    "preprocess_pushup",
+    "preprocess_squat",
+    "preprocess_situp",
+    "PushupCounter",
+    "SquatCounter",
+]
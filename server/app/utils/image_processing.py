@@ -0,0 +1,107 @@
+# utils/image_processing.py
+
+import io
+from typing import Any, Tuple
+
+import numpy as np
+from PIL import Image
+
+# 큰 축소는 정수 배율로 먼저 줄인 뒤 리샘플링 (PIL 문서 기준 3 이상이면 정확한 리샘플링과 거의 구분되지 않음)
+REDUCING_GAP = 3.0
+
+
+def open_image_checked(image_bytes: bytes, max_pixels: int) -> Image.Image:
+    """헤더만 읽어 크기를 확인한 뒤 이미지 반환 (픽셀 디코딩 전에 지나치게 큰 이미지는 ValueError)"""
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+    except Exception as e:
+        raise ValueError(f"이미지를 읽을 수 없습니다: {e}")
+
+    if image.width * image.height > max_pixels:
+        raise ValueError(f"이미지 해상도가 너무 큽니다 ({image.width}x{image.height}, 최대 {max_pixels} 픽셀)")
+
+    return image
+
+
+class FastImagePreprocessor:
+    """AutoImageProcessor(ConvNext 계열, use_fast=False)와 같은 설정으로 동작하는 빠른 전처리
+
+    - JPEG는 draft 모드로 모델 입력 크기 이상인 가장 작은 1/2^n 배율로 디코딩 (12MP 원본 전체를 디코딩하지 않음)
+    - 리사이즈/크롭은 기존과 같은 크기 계산의 PIL 연산 (reducing_gap으로 큰 축소를 빠르게)
+    - 정규화는 (x * scale + offset)을 CHW float32 배열에 한 번에 계산
+
+    축소 디코딩/reducing_gap 때문에 기존 프로세서와 값이 조금 다를 수 있다 (benchmark_image_preprocessing로 확인).
+    지원하지 않는 설정이면 from_processor가 None을 반환한다.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        crop_pct: float | None,
+        resample: int,
+        rescale_factor: float,
+        image_mean: Tuple[float, ...],
+        image_std: Tuple[float, ...],
+    ):
+        self.size = size
+        self.resample = resample
+        # ConvNext 프로세서: 384 미만이면 size / crop_pct로 짧은 변을 맞춘 뒤 중앙 크롭, 이상이면 정사각형으로 리사이즈
+        self.resize_shortest_edge = int(size / crop_pct) if crop_pct and size < 384 else None
+        std = np.asarray(image_std, dtype=np.float32)
+        self.scale = (rescale_factor / std).reshape(3, 1, 1)
+        self.offset = (-np.asarray(image_mean, dtype=np.float32) / std).reshape(3, 1, 1)
+
+    @classmethod
+    def from_processor(cls, processor: Any) -> "FastImagePreprocessor | None":
+        """Hugging Face 이미지 프로세서 설정으로 생성 (지원하지 않는 설정이면 None)"""
+        size = getattr(processor, "size", None) or {}
+        supported = (
+            "shortest_edge" in size
+            and getattr(processor, "do_resize", False)
+            and getattr(processor, "do_rescale", False)
+            and getattr(processor, "do_normalize", False)
+            and len(processor.image_mean) == 3
+            and len(processor.image_std) == 3
+        )
+        if not supported:
+            return None
+
+        return cls(
+            size=size["shortest_edge"],
+            crop_pct=getattr(processor, "crop_pct", None),
+            resample=int(processor.resample),
+            rescale_factor=processor.rescale_factor,
+            image_mean=tuple(processor.image_mean),
+            image_std=tuple(processor.image_std),
+        )
+
+    def _resize(self, image: Image.Image) -> Image.Image:
+        """기존 프로세서와 같은 크기 계산으로 리사이즈 + 중앙 크롭"""
+        if self.resize_shortest_edge is None:
+            return image.resize((self.size, self.size), resample=self.resample, reducing_gap=REDUCING_GAP)
+
+        short, long = sorted(image.size)
+        new_short, new_long = self.resize_shortest_edge, int(self.resize_shortest_edge * long / short)
+        width, height = (new_short, new_long) if image.width <= image.height else (new_long, new_short)
+        image = image.resize((width, height), resample=self.resample, reducing_gap=REDUCING_GAP)
+
+        top = (height - self.size) // 2
+        left = (width - self.size) // 2
+        return image.crop((left, top, left + self.size, top + self.size))
+
+    def __call__(self, image: Image.Image, out: np.ndarray | None = None) -> np.ndarray:
+        """PIL 이미지 -> 정규화된 float32 배열 [3, size, size] (out이 있으면 그 배열에 기록)"""
+        # 디코딩 전에 호출해야 효과가 있음 (JPEG 외 형식은 무시됨)
+        target = self.resize_shortest_edge or self.size
+        image.draft("RGB", (target, target))
+
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        pixels = np.asarray(self._resize(image)).transpose(2, 0, 1)
+        if out is None:
+            out = np.empty((3, self.size, self.size), dtype=np.float32)
+
+        np.multiply(pixels, self.scale, out=out)
+        out += self.offset
+        return out
@@ -1,7 +1,92 @@
 # utils/processing.py
 
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+
 import numpy as np
 
+# MediaPipe Pose 랜드마크 수
+NUM_LANDMARKS = 33
+
+# 분류 모델 입력에 사용하는 21개 관절 인덱스 (얼굴 일부 + 상체 + 하체)
+POSE_JOINT_INDICES = np.array([0, 2, 6, 7, 8, 11, 12, 13, 14, 15, 16, *range(23, 33)], dtype=np.intp)
+
+# 21개 포인트 * 3차원(x, y, z) = 63
+POSE_INPUT_SIZE = len(POSE_JOINT_INDICES) * 3
+
+
+def new_pose_input_buffer() -> np.ndarray:
+    """세션별로 재사용할 (1, 63) float32 입력 버퍼 생성"""
+    return np.zeros((1, POSE_INPUT_SIZE), dtype=np.float32)
+
+
+# 리스트 페이로드에서 21개 관절 / 각 관절의 x, y, z를 C 수준에서 꺼내는 getter
+_JOINT_GETTER = itemgetter(*POSE_JOINT_INDICES.tolist())
+_XYZ_GETTER = itemgetter(0, 1, 2)
+
+
+def landmarks_to_array(keypoints) -> np.ndarray | None:
+    """랜드마크 페이로드(33x4 리스트 또는 배열)를 (N, C) float32 배열로 변환
+
+    이미 float32 배열이면 복사하지 않는다. 형태가 (33 이상, 3 이상)이 아니면 None을 반환한다.
+    """
+    if isinstance(keypoints, np.ndarray):
+        arr = keypoints if keypoints.dtype == np.float32 else keypoints.astype(np.float32)
+    else:
+        try:
+            arr = np.asarray(keypoints, dtype=np.float32)
+        except (TypeError, ValueError, IndexError, KeyError):
+            return None
+
+    if arr.ndim != 2 or arr.shape[0] < NUM_LANDMARKS or arr.shape[1] < 3:
+        return None
+
+    return arr
+
+
+@lru_cache(maxsize=8)
+def _flat_joint_indices(cols: int) -> np.ndarray:
+    """(N, cols) 배열을 1차원으로 폈을 때 21개 관절 x, y, z의 위치"""
+    return (POSE_JOINT_INDICES[:, None] * cols + np.arange(3)).ravel()
+
+
+def preprocess_landmarks(keypoints, out: np.ndarray | None = None) -> np.ndarray | None:
+    """21개 관절의 x, y, z를 (1, 63) 버퍼에 바로 채움
+
+    out에 new_pose_input_buffer()로 만든 버퍼를 넘기면 프레임마다 새 배열을 만들지 않는다.
+    - float32 배열(바이너리 프레임): 인덱스 한 번으로 벡터화 추출
+    - 리스트(JSON 프레임): 필요한 21개 관절만 C 수준 getter로 꺼내 한 번에 변환
+    랜드마크가 33개 미만이거나, 좌표가 3개 미만인 행 또는 숫자가 아닌 값이 있으면 (배열 경로와 같이)
+    프레임 전체를 잘못된 것으로 보고 None을 반환한다.
+    """
+    if out is None:
+        out = new_pose_input_buffer()
+
+    if isinstance(keypoints, np.ndarray):
+        arr = landmarks_to_array(keypoints)
+        if arr is None:
+            return None
+        # 인덱스는 형태 검증 후라 범위 안이 보장되므로 mode="clip"으로 중간 복사 없이 out에 직접 기록
+        np.take(arr.reshape(-1), _flat_joint_indices(arr.shape[1]), out=out[0], mode="clip")
+        return out
+
+    try:
+        if not keypoints or len(keypoints) < NUM_LANDMARKS:
+            return None
+    except TypeError:
+        return None
+
+    # 행 길이/값 형식 검증은 변환과 함께 한 번만 수행 (잘못된 관절을 0으로 채워 모델에 넘기지 않음)
+    try:
+        out[0] = np.fromiter(
+            chain.from_iterable(map(_XYZ_GETTER, _JOINT_GETTER(keypoints))), dtype=np.float32, count=POSE_INPUT_SIZE
+        )
+    except (TypeError, ValueError, IndexError, KeyError):
+        return None
+
+    return out
+
 
 def preprocess_pushup(keypoints):
     try:
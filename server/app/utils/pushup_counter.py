@@ -1,26 +1,20 @@
 # utils/counters/pushup_counter.py
 
-import queue
-import threading
-import time
 from datetime import datetime
 from typing import Any, Dict
 
 
-class PushupCounter(threading.Thread):
+class PushupCounter:
+    """푸쉬업 상태 머신
+
+    분석 결과가 나올 때마다 step()이 이벤트 루프에서 바로 호출된다.
+    별도 스레드나 큐 없이 상태 전환을 처리하고, 성공/실패 이벤트가 생기면 콜백으로 전달한다.
+    """
+
     def __init__(self, threshold=0.7, callback=None):
-        super().__init__()
-        self.daemon = True
         self.pushup_count = 0  # 성공한 푸쉬업 카운트
         self.failed_count = 0  # 실패한 푸쉬업 카운트
 
-        # 메인 스레드에서 (pos, prob_down, prob_up, prob_mid) 형태로
-        # 예측 결과를 큐에 넣어주면 여기서 소비(consume)함
-        self.position = queue.Queue()
-
-        # 스레드 종료를 제어하기 위한 이벤트
-        self._stop_event = threading.Event()
-
         # 신뢰도(확률) 임계값 → 이 값 이상일 때만 자세로 인정
         self.threshold = threshold
 
@@ -30,35 +24,19 @@ class PushupCounter(threading.Thread):
         # 메시지 콜백 함수 (웹소켓으로 메시지 전송용)
         self.message_callback = callback
 
-    def run(self):
+    def step(self, pos: int, prob_down: float, prob_up: float, prob_mid: float) -> Dict[str, Any] | None:
         """
-        별도의 스레드로 실행되며, 큐에 들어오는 (자세/확률) 정보를 기반으로
-        상태를 전환하고 push-up 개수를 세는 핵심 로직
+        프레임 하나의 예측 결과로 상태를 전환하고 push-up 개수를 세는 핵심 로직
+        pos: 예측된 현재 자세 (0=down, 1=up, 2=mid)
+        prob_down, prob_up, prob_mid: 각 자세의 신뢰도
         """
-        while not self._stop_event.is_set():
-            # 새로운 입력이 없으면 잠시 대기
-            if self.position.empty():
-                time.sleep(0.05)
-                continue
-
-            try:
-                # 메인에서 넣어준 값 꺼내오기
-                # pos: 예측된 현재 자세 (0=down, 1=up, 2=mid)
-                # prob_down, prob_up, prob_mid: 각 자세의 신뢰도
-                pos, prob_down, prob_up, prob_mid = self.position.get(timeout=1)
-
-                # 상태 전환 및 카운팅 로직 (콜백 포함)
-                message_data = self._process_state_transition(pos, prob_down, prob_up, prob_mid)
-
-                # 메시지가 있고 콜백이 설정되어 있으면 전송
-                if message_data and self.message_callback:
-                    print(f"📤 Sending callback to WebSocket: {message_data.get('type')}")
-                    self.message_callback(message_data)
-
-            except Exception as e:
-                # 큐에서 꺼내는 중 오류 발생 시 무시하고 루프 지속
-                print(f"PushupCounter error: {e}")
-                continue
+        message_data = self._process_state_transition(pos, prob_down, prob_up, prob_mid)
+
+        # 메시지가 있고 콜백이 설정되어 있으면 전송
+        if message_data and self.message_callback:
+            self.message_callback(message_data)
+
+        return message_data
 
     def _process_state_transition(
         self, pos: int, prob_down: float, prob_up: float, prob_mid: float
@@ -160,9 +138,3 @@ class PushupCounter(threading.Thread):
         self.pushup_count = 0
         self.failed_count = 0
         self.state = "up"
-
-    def stop(self):
-        """
-        외부에서 호출 시 스레드를 안전하게 종료할 수 있도록 플래그 설정
-        """
-        self._stop_event.set()
@@ -0,0 +1,106 @@
+# app/websockets/landmark_codec.py
+
+"""운동 WebSocket 바이너리 랜드마크 프레임 코덱
+
+연결 시 클라이언트가 Sec-WebSocket-Protocol로 LANDMARK_SUBPROTOCOL을 요청하면 서버가 이를 수락하고,
+이후 mediapipe_coordinates 프레임을 JSON 대신 바이너리 메시지로 보낼 수 있다.
+다른 메시지(heartbeat, 수동 반복, 일시정지 등)는 기존처럼 JSON 텍스트로 주고받는다.
+
+프레임 레이아웃 (little-endian)
+
+    offset  size  field
+    0       2     magic      b"WL"
+    2       1     version    1
+    3       1     dtype      0 = float32, 1 = int16 (양자화)
+    4       2     points     랜드마크 수 (33)
+    6       2     dims       랜드마크당 값 수 (x, y, z, visibility = 4)
+    8       4     seq        프레임 순번 (클라이언트 임의 값)
+    12      4     scale      int16일 때 복원 배율 (float32, value = q * scale)
+    16      ...   payload    points * dims 개의 값
+"""
+
+import struct
+
+import numpy as np
+
+from app.utils.processing import NUM_LANDMARKS
+
+LANDMARK_SUBPROTOCOL = "ww.landmarks.v1"
+
+FRAME_MAGIC = b"WL"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("<2sBBHHIf")
+
+DTYPE_FLOAT32 = 0
+DTYPE_INT16 = 1
+
+_PAYLOAD_DTYPES = {
+    DTYPE_FLOAT32: np.dtype("<f4"),
+    DTYPE_INT16: np.dtype("<i2"),
+}
+
+# int16 양자화 기본 배율 - 정규화 좌표(약 -4 ~ 4)를 1/8192 단위로 표현
+DEFAULT_INT16_SCALE = 1 / 8192
+
+
+class LandmarkFrameError(ValueError):
+    """잘못된 바이너리 랜드마크 프레임"""
+
+
+def decode_landmark_frame(payload: bytes, out: np.ndarray | None = None) -> tuple[int, np.ndarray]:
+    """바이너리 프레임을 (seq, (points, dims) float32 배열)로 디코딩
+
+    float32 프레임은 np.frombuffer로 수신 버퍼를 그대로 참조하는 읽기 전용 뷰를 반환한다 (복사 없음).
+    int16 프레임은 out이 주어지면 그 버퍼에 복원 결과를 기록한다.
+    """
+    if len(payload) < FRAME_HEADER.size:
+        raise LandmarkFrameError("Frame too short")
+
+    magic, version, dtype_code, points, dims, seq, scale = FRAME_HEADER.unpack_from(payload)
+
+    if magic != FRAME_MAGIC:
+        raise LandmarkFrameError("Invalid frame magic")
+    if version != FRAME_VERSION:
+        raise LandmarkFrameError(f"Unsupported frame version: {version}")
+
+    dtype = _PAYLOAD_DTYPES.get(dtype_code)
+    if dtype is None:
+        raise LandmarkFrameError(f"Unsupported frame dtype: {dtype_code}")
+
+    if points != NUM_LANDMARKS or dims < 3:
+        raise LandmarkFrameError(f"Unexpected landmark shape: ({points}, {dims})")
+
+    count = points * dims
+    if len(payload) != FRAME_HEADER.size + count * dtype.itemsize:
+        raise LandmarkFrameError("Frame size does not match header")
+
+    values = np.frombuffer(payload, dtype=dtype, count=count, offset=FRAME_HEADER.size).reshape(points, dims)
+
+    if dtype_code == DTYPE_FLOAT32:
+        return seq, values
+
+    if out is None or out.shape != values.shape:
+        out = np.empty(values.shape, dtype=np.float32)
+    np.multiply(values, np.float32(scale), out=out, dtype=np.float32)
+    return seq, out
+
+
+def encode_landmark_frame(
+    landmarks, seq: int = 0, dtype_code: int = DTYPE_FLOAT32, scale: float = DEFAULT_INT16_SCALE
+) -> bytes:
+    """랜드마크를 바이너리 프레임으로 인코딩 (클라이언트 구현 참고 및 벤치마크용)"""
+    values = np.asarray(landmarks, dtype=np.float32)
+    if values.ndim != 2:
+        raise LandmarkFrameError("Landmarks must be a 2D array")
+
+    if dtype_code == DTYPE_INT16:
+        payload = np.clip(np.rint(values / scale), -32768, 32767).astype("<i2")
+    elif dtype_code == DTYPE_FLOAT32:
+        payload = values.astype("<f4", copy=False)
+        scale = 1.0
+    else:
+        raise LandmarkFrameError(f"Unsupported frame dtype: {dtype_code}")
+
+    points, dims = values.shape
+    header = FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, dtype_code, points, dims, seq, scale)
+    return header + payload.tobytes()
@@ -1,14 +1,20 @@
 # app/websockets/workout_socket.py - 수정된 버전
 
+import asyncio
 import json
 from datetime import datetime
 from typing import Any, Dict
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from app.core.database import session_scope
+from app.services.heartbeat_tracker import heartbeat_tracker
+from app.services.live_session import LiveSessionState, session_progress_writer
+from app.services.model_registry import model_registry
 from app.services.pose_analyzer import PoseAnalyzer
 from app.services.socket_service import SocketService
 from app.services.workout_service import WorkoutService
+from app.websockets.landmark_codec import LANDMARK_SUBPROTOCOL, LandmarkFrameError, decode_landmark_frame
 
 router = APIRouter()
 
@@ -16,20 +22,55 @@ router = APIRouter()
 class WorkoutMessageHandler:
     """운동 WebSocket 메시지 처리 클래스"""
 
+    # 처리 전에 메모리의 반복 수를 DB에 저장해야 하는 메시지 타입
+    FLUSH_BEFORE = frozenset(
+        {
+            "manual_rep_add",
+            "manual_rep_subtract",
+            "get_session_status",
+            "workout_pause",
+            "workout_resume",
+            "workout_stop",
+        }
+    )
+
+    # 반복 이벤트와 같은 디스패처에서 순서대로 처리하는 메시지 타입
+    # (flush와 DB 조회 사이에 반영된 반복을 update_from이 덮어쓰지 않도록 함)
+    IN_ORDER = frozenset(
+        {
+            "manual_rep_add",
+            "manual_rep_subtract",
+            "get_session_status",
+            "workout_pause",
+            "workout_resume",
+        }
+    )
+
     def __init__(self, websocket: WebSocket, socket_session_id: str):
         self.websocket = websocket
         self.socket_session_id = socket_session_id
-        self.socket_service = SocketService()
-        self.workout_service = WorkoutService()
+        # DB 세션은 연결 동안 들고 있지 않고 메시지 처리 단위로 session_scope에서 체크아웃
         self.pose_analyzer = PoseAnalyzer()
-        self._session_id = None
-
-    async def _get_session_id(self) -> int:
-        """소켓 세션으로부터 운동 세션 ID 조회"""
-        if self._session_id is None:
-            socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
-            self._session_id = socket_session.session_id
-        return self._session_id
+        # 연결 시 한 번 로드하는 실시간 세션 상태
+        self.state: LiveSessionState | None = None
+        # int16 바이너리 프레임 복원용 버퍼
+        self._frame_buffer = None
+
+    async def load_state(self) -> bool:
+        """소켓 세션과 운동 세션을 한 번 조회해 실시간 세션 상태 구성"""
+        async with session_scope() as db:
+            socket_session = await SocketService(db).get_socket_session(self.socket_session_id)
+            if not socket_session:
+                return False
+
+            workout_session = await WorkoutService(db).get_workout_session(
+                socket_session.session_id, socket_session.user_id
+            )
+        if not workout_session:
+            return False
+
+        self.state = LiveSessionState(self.socket_session_id, workout_session)
+        return True
 
     async def handle_message(self, message: Dict[str, Any]):
         """메시지 타입에 따른 처리"""
@@ -47,37 +88,65 @@ class WorkoutMessageHandler:
             "workout_stop": self._handle_workout_stop,
         }
 
-        if message_type in handlers:
-            return await handlers[message_type](data)
+        if message_type not in handlers:
+            return None
 
-        return None
+        handler = handlers[message_type]
+        if message_type not in self.FLUSH_BEFORE:
+            return await handler(data)
+
+        async def flush_and_handle():
+            # 반복 수를 읽거나 바꾸는 메시지는 write-behind로 미뤄 둔 변경을 먼저 저장
+            await session_progress_writer.flush(self.state)
+            return await handler(data)
+
+        counter = self._session_counter()
+        if counter is not None and message_type in self.IN_ORDER:
+            return await counter.run_in_order(flush_and_handle)
+        return await flush_and_handle()
+
+    def _session_counter(self):
+        """이 연결의 세션 카운터 (WebSocket/실시간 상태가 연결되지 않았으면 연결) - 아직 없으면 None"""
+        counter = self.pose_analyzer.session_counters.get(self.state.session_id)
+        if counter is not None and counter.websocket is None:
+            counter.set_services(self.websocket, self.state)
+        return counter
 
     async def _handle_heartbeat(self, data: Dict[str, Any]):
-        """하트비트 처리"""
-        await self.socket_service.update_heartbeat(self.socket_session_id)
+        """하트비트 처리 - 메모리에만 기록하고 주기적으로 한 번에 저장"""
+        heartbeat_tracker.beat(self.socket_session_id)
         return {
             "type": "heartbeat_ack",
             "data": {"timestamp": data.get("timestamp", datetime.utcnow().isoformat())},
         }
 
+    async def handle_landmark_frame(self, payload: bytes):
+        """바이너리 랜드마크 프레임 처리 (JSON 파싱 없이 수신 버퍼를 배열 뷰로 사용)"""
+        try:
+            _, landmarks = decode_landmark_frame(payload, out=self._frame_buffer)
+        except LandmarkFrameError as e:
+            print(f"Invalid landmark frame: {e}")
+            return None
+
+        if landmarks.flags.writeable:
+            # int16 프레임 복원 버퍼는 다음 프레임에 재사용 (float32 프레임은 읽기 전용 뷰)
+            self._frame_buffer = landmarks
+
+        return await self._analyze_landmarks(landmarks)
+
     async def _handle_mediapipe_coordinates(self, data: Dict[str, Any]):
         """미디어파이프 좌표 실시간 분석 처리"""
-        landmarks = data.get("landmarks", [])
-        session_id = await self._get_session_id()
+        return await self._analyze_landmarks(data.get("landmarks", []))
 
-        socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
-        workout_session = await self.workout_service.get_workout_session(
-            socket_session.session_id, socket_session.user_id
-        )
+    async def _analyze_landmarks(self, landmarks):
+        """랜드마크(리스트 또는 배열) 포즈 분석 - 실시간 세션 상태만 참조하고 DB는 조회하지 않음"""
+        state = self.state
 
         # 서비스 객체들 설정
-        if session_id in self.pose_analyzer.session_counters:
-            counter = self.pose_analyzer.session_counters[session_id]
-            if counter.websocket is None:
-                counter.set_services(self.websocket, self.workout_service, self.socket_service, self.socket_session_id)
+        self._session_counter()
 
         await self.pose_analyzer.analyze_pose(
-            landmarks=landmarks, exercise_type=workout_session.exercise.name, session_id=session_id
+            landmarks=landmarks, exercise_type=state.exercise_name, session_id=state.session_id
         )
 
         return None
@@ -85,12 +154,11 @@ class WorkoutMessageHandler:
     async def _handle_manual_rep_add(self, data: Dict[str, Any]):
         """수동 반복 추가"""
         reps = data.get("reps", 1)
-        socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
-        await self.workout_service.manual_add_rep(socket_session.session_id, reps)
-
-        updated_session = await self.workout_service.get_workout_session(
-            socket_session.session_id, socket_session.user_id
-        )
+        async with session_scope() as db:
+            workout_service = WorkoutService(db)
+            await workout_service.manual_add_rep(self.state.session_id, reps)
+            updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
+        self.state.update_from(updated_session)
 
         return {
             "type": "rep_success",
@@ -107,12 +175,11 @@ class WorkoutMessageHandler:
     async def _handle_manual_rep_subtract(self, data: Dict[str, Any]):
         """수동 반복 차감"""
         reps = data.get("reps", 1)
-        socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
-        await self.workout_service.manual_subtract_rep(socket_session.session_id, reps)
-
-        updated_session = await self.workout_service.get_workout_session(
-            socket_session.session_id, socket_session.user_id
-        )
+        async with session_scope() as db:
+            workout_service = WorkoutService(db)
+            await workout_service.manual_subtract_rep(self.state.session_id, reps)
+            updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
+        self.state.update_from(updated_session)
 
         return {
             "type": "rep_success",
@@ -128,24 +195,23 @@ class WorkoutMessageHandler:
 
     async def _handle_get_session_status(self, data: Dict[str, Any]):
         """현재 세션 상태 조회"""
-        socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
-        status = await self.workout_service.get_session_status(socket_session.session_id)
+        async with session_scope() as db:
+            status = await WorkoutService(db).get_session_status(self.state.session_id)
         return {"type": "session_status", "data": status}
 
     async def _handle_workout_pause(self, data: Dict[str, Any]):
         """운동 일시정지"""
-        socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
-
-        try:
-            await self.workout_service.pause_workout(socket_session.session_id)
-            feedback_message = "운동 일시정지"
-        except ValueError as e:
-            feedback_message = "이미 일시정지 상태입니다"
-            print(f"Pause error: {e}")
-
-        updated_session = await self.workout_service.get_workout_session(
-            socket_session.session_id, socket_session.user_id
-        )
+        async with session_scope() as db:
+            workout_service = WorkoutService(db)
+            try:
+                await workout_service.pause_workout(self.state.session_id)
+                feedback_message = "운동 일시정지"
+            except ValueError as e:
+                feedback_message = "이미 일시정지 상태입니다"
+                print(f"Pause error: {e}")
+
+            updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
+        self.state.update_from(updated_session)
 
         return {
             "type": "rep_success",
@@ -161,18 +227,17 @@ class WorkoutMessageHandler:
 
     async def _handle_workout_resume(self, data: Dict[str, Any]):
         """운동 재개"""
-        socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
-
-        try:
-            await self.workout_service.resume_workout(socket_session.session_id)
-            feedback_message = "운동 재개"
-        except ValueError as e:
-            feedback_message = "이미 활성 상태입니다"
-            print(f"Resume error: {e}")
-
-        updated_session = await self.workout_service.get_workout_session(
-            socket_session.session_id, socket_session.user_id
-        )
+        async with session_scope() as db:
+            workout_service = WorkoutService(db)
+            try:
+                await workout_service.resume_workout(self.state.session_id)
+                feedback_message = "운동 재개"
+            except ValueError as e:
+                feedback_message = "이미 활성 상태입니다"
+                print(f"Resume error: {e}")
+
+            updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
+        self.state.update_from(updated_session)
 
         return {
             "type": "rep_success",
@@ -188,23 +253,24 @@ class WorkoutMessageHandler:
 
     async def _handle_workout_stop(self, data: Dict[str, Any]):
         """수동 운동 완료"""
-        socket_session = await self.socket_service.get_socket_session(self.socket_session_id)
+        # 세션 정리 (처리 중이던 반복 이벤트까지 반영 후 저장)
+        await self.pose_analyzer.cleanup_session(self.state.session_id)
+        await session_progress_writer.flush(self.state)
 
-        # 세션 정리
-        if self._session_id:
-            self.pose_analyzer.cleanup_session(self._session_id)
+        async with session_scope() as db:
+            workout_service = WorkoutService(db)
 
-        # 칼로리 계산 및 완료 처리
-        updated_session = await self.workout_service.get_workout_session(
-            socket_session.session_id, socket_session.user_id
-        )
+            # 칼로리 계산 및 완료 처리
+            updated_session = await workout_service.get_workout_session(self.state.session_id, self.state.user_id)
+            self.state.update_from(updated_session)
 
-        total_calories = updated_session.total_reps_completed * updated_session.exercise.calorie
-        await self.workout_service.update_total_calories(socket_session.session_id, total_calories)
+            total_calories = updated_session.total_reps_completed * updated_session.exercise.calorie
+            await workout_service.update_total_calories(self.state.session_id, total_calories)
 
-        # 운동 완료 처리
-        await self.workout_service.complete_workout(socket_session.session_id)
-        await self.socket_service.update_connection_status(self.socket_session_id, "disconnected")
+            # 운동 완료 처리
+            await workout_service.complete_workout(self.state.session_id)
+            self.state.status = "completed"
+            await SocketService(db).update_connection_status(self.socket_session_id, "disconnected")
 
         # 소켓 종료
         await self.websocket.close()
@@ -213,9 +279,13 @@ class WorkoutMessageHandler:
 
 @router.websocket("/workout/{socket_session_id}")
 async def workout_websocket_endpoint(websocket: WebSocket, socket_session_id: str):
-    """운동 WebSocket 엔드포인트"""
+    """운동 WebSocket 엔드포인트
 
-    await websocket.accept()
+    클라이언트가 LANDMARK_SUBPROTOCOL을 요청하면 바이너리 랜드마크 프레임도 받는다.
+    """
+
+    binary_frames = LANDMARK_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    await websocket.accept(subprotocol=LANDMARK_SUBPROTOCOL if binary_frames else None)
 
     await websocket.send_json(
         {
@@ -224,19 +294,38 @@ async def workout_websocket_endpoint(websocket: WebSocket, socket_session_id: st
                 "socket_session_id": socket_session_id,
                 "message": "연결 완료",
                 "server_time": datetime.utcnow().isoformat() + "Z",
+                "binary_landmarks": binary_frames,
             },
         }
     )
 
-    socket_service = SocketService()
-    await socket_service.update_connection_status(socket_session_id, "connected")
+    # 워밍업 전에 연결되면 포즈 모델을 스레드에서 로드 (이벤트 루프를 막지 않음)
+    if not model_registry.all_loaded:
+        await asyncio.to_thread(model_registry.load_all)
+
     handler = WorkoutMessageHandler(websocket, socket_session_id)
+    if not await handler.load_state():
+        await websocket.close(code=1008, reason="Unknown socket session")
+        return
+
+    async with session_scope() as db:
+        await SocketService(db).update_connection_status(socket_session_id, "connected")
+    session_progress_writer.register(handler.state)
 
     try:
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
-            response = await handler.handle_message(message)
+            received = await websocket.receive()
+            if received["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(received.get("code", 1000))
+
+            if received.get("bytes") is not None:
+                # 바이너리 프레임은 서브프로토콜을 협상한 연결에서만 처리
+                if not binary_frames:
+                    continue
+                response = await handler.handle_landmark_frame(received["bytes"])
+            else:
+                message = json.loads(received["text"])
+                response = await handler.handle_message(message)
 
             if response is not None:
                 await websocket.send_json(response)
@@ -244,6 +333,12 @@ async def workout_websocket_endpoint(websocket: WebSocket, socket_session_id: st
     except WebSocketDisconnect:
         pass
     finally:
-        await socket_service.update_connection_status(socket_session_id, "disconnected")
-        if handler._session_id:
-            handler.pose_analyzer.cleanup_session(handler._session_id)
+        heartbeat_tracker.forget(socket_session_id)
+        async with session_scope() as db:
+            await SocketService(db).update_connection_status(socket_session_id, "disconnected")
+        await handler.pose_analyzer.cleanup_session(handler.state.session_id)
+        # 남은 반복 수 저장 후 주기 flush 대상에서 제외
+        try:
+            await session_progress_writer.flush(handler.state)
+        finally:
+            session_progress_writer.unregister(handler.state)
@@ -0,0 +1,81 @@
+# scripts/benchmark_db_endpoints.py
+#
+# DB 조회 엔드포인트 동시 부하 벤치마크 (/v1/home, /v1/exercises)
+# 실행 중인 서버에 동시 요청을 보내 초당 처리량과 지연 시간 분포를 측정한다.
+# 동기 세션 버전과 async 세션 버전 서버를 각각 띄워 같은 옵션으로 실행하면 비교할 수 있다.
+#
+# 실행: uv run python -m scripts.benchmark_db_endpoints --token <JWT> [--base-url http://localhost:9000/v1]
+#       [--concurrency 50] [--requests 2000]
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = ["/home/", "/exercises/"]
+
+
+async def run_path(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict:
+    """한 경로에 total개의 요청을 concurrency개씩 동시에 보내고 결과 집계"""
+    latencies = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "max_ms": latencies[-1],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="DB 조회 엔드포인트 동시 부하 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:9000/v1", help="API 기본 URL")
+    parser.add_argument("--token", required=True, help="Bearer 토큰 (로그인 응답의 access_token)")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=2000, help="경로별 총 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--path", action="append", help="측정할 경로 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    paths = args.path or DEFAULT_PATHS
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    headers = {"Authorization": f"Bearer {args.token}"}
+
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=60) as client:
+        print(f"base url: {args.base_url}, concurrency: {args.concurrency}, requests per path: {args.requests}\n")
+
+        for path in paths:
+            await run_path(client, path, args.warmup, min(args.concurrency, args.warmup))
+            result = await run_path(client, path, args.requests, args.concurrency)
+            print(
+                f"{path:<16} {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.1f} ms  "
+                f"p95 {result['p95_ms']:7.1f} ms  max {result['max_ms']:7.1f} ms  errors {result['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+# scripts/benchmark_image_preprocessing.py
+#
+# 체형 분석 이미지 전처리 벤치마크 (기존 AutoImageProcessor 경로 vs 축소 디코딩 + 벡터화 경로)
+# 이미지 디렉터리를 주지 않으면 휴대폰 사진 크기의 합성 JPEG/PNG를 만들어 측정한다.
+#
+# 실행: uv run python -m scripts.benchmark_image_preprocessing [--images <디렉터리>] [--model-dir ./models/body_type]
+#       [--repeat 5] [--number 10]
+
+import argparse
+import io
+import timeit
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from app.utils import FastImagePreprocessor, open_image_checked
+
+# (이름, 크기, 형식)
+SYNTHETIC_IMAGES = [
+    ("phone 12MP jpeg", (4032, 3024), "JPEG"),
+    ("phone portrait 12MP jpeg", (3024, 4032), "JPEG"),
+    ("fhd portrait jpeg", (1080, 1920), "JPEG"),
+    ("fhd portrait png", (1080, 1920), "PNG"),
+]
+
+
+def make_image(size: tuple, image_format: str) -> bytes:
+    """그라디언트 + 노이즈 합성 이미지 (실제 사진과 비슷한 압축률이 나오도록)"""
+    width, height = size
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width)), (x + y) / 2], axis=-1)
+    pixels = np.clip(base + rng.normal(0, 12, base.shape), 0, 255).astype(np.uint8)
+
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format=image_format, quality=90)
+    return buffer.getvalue()
+
+
+def load_processor(model_dir: str):
+    """모델 디렉터리의 이미지 프로세서 (없으면 ResNet-50 기본 설정)"""
+    from transformers import AutoImageProcessor, ConvNextImageProcessor
+
+    if Path(model_dir, "preprocessor_config.json").exists():
+        return AutoImageProcessor.from_pretrained(model_dir, local_files_only=True, use_fast=False)
+    print(f"{model_dir} has no preprocessor_config.json, using ResNet-50 defaults\n")
+    return ConvNextImageProcessor(size={"shortest_edge": 224}, crop_pct=0.875, resample=3)
+
+
+def baseline(processor, image_bytes: bytes) -> np.ndarray:
+    """기존 경로: 원본 해상도 디코딩 -> RGB 변환 -> 이미지 프로세서"""
+    image = Image.open(io.BytesIO(image_bytes))
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return processor(image, return_tensors="np")["pixel_values"][0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="체형 분석 이미지 전처리 벤치마크")
+    parser.add_argument("--images", help="측정할 이미지 디렉터리 (없으면 합성 이미지)")
+    parser.add_argument("--model-dir", default="./models/body_type", help="이미지 프로세서 설정을 읽을 모델 디렉터리")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument("--number", type=int, default=10, help="측정 1회당 이미지 처리 횟수")
+    args = parser.parse_args()
+
+    processor = load_processor(args.model_dir)
+    fast = FastImagePreprocessor.from_processor(processor)
+    if fast is None:
+        raise SystemExit("This image processor configuration is not supported by FastImagePreprocessor")
+
+    if args.images:
+        paths = sorted(path for path in Path(args.images).iterdir() if path.is_file())
+        images = [(path.name, path.read_bytes()) for path in paths]
+    else:
+        images = [(name, make_image(size, image_format)) for name, size, image_format in SYNTHETIC_IMAGES]
+
+    out = np.empty((3, fast.size, fast.size), dtype=np.float32)
+    print(f"{'image':<28} {'size':>10} {'baseline':>12} {'fast':>12} {'speedup':>8} {'max |diff|':>11}")
+    for name, image_bytes in images:
+        # 결과 차이 (JPEG는 축소 디코딩 때문에 완전히 같지는 않음)
+        expected = baseline(processor, image_bytes)
+        actual = fast(open_image_checked(image_bytes, 10**9), out=out)
+        max_diff = float(np.abs(expected - actual).max())
+
+        base_ms = min(timeit.repeat(lambda: baseline(processor, image_bytes), number=args.number, repeat=args.repeat))
+        fast_ms = min(
+            timeit.repeat(
+                lambda: fast(open_image_checked(image_bytes, 10**9), out=out), number=args.number, repeat=args.repeat
+            )
+        )
+        base_ms, fast_ms = base_ms / args.number * 1000, fast_ms / args.number * 1000
+
+        size = "x".join(map(str, Image.open(io.BytesIO(image_bytes)).size))
+        print(
+            f"{name:<28} {size:>10} {base_ms:>9.2f} ms {fast_ms:>9.2f} ms {base_ms / fast_ms:>7.1f}x {max_diff:>11.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
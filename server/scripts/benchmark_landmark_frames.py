@@ -0,0 +1,73 @@
+# scripts/benchmark_landmark_frames.py
+#
+# 운동 WebSocket 랜드마크 프레임 벤치마크 (JSON 텍스트 vs 바이너리 float32 / int16)
+# 프레임 크기와 수신 → 모델 입력 (1, 63) 변환까지의 프레임당 CPU 시간을 비교한다.
+#
+# 실행: uv run python -m scripts.benchmark_landmark_frames [--frames 20000]
+
+import argparse
+import json
+import random
+import timeit
+
+import numpy as np
+
+from app.utils import new_pose_input_buffer, preprocess_landmarks
+from app.websockets.landmark_codec import DTYPE_FLOAT32, DTYPE_INT16, decode_landmark_frame, encode_landmark_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description="랜드마크 프레임 포맷 벤치마크")
+    parser.add_argument("--frames", type=int, default=20000, help="측정할 프레임 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    landmarks = [[random.random(), random.random(), random.uniform(-1, 1), random.random()] for _ in range(33)]
+
+    # 클라이언트가 현재 보내는 JSON 메시지
+    text_frame = json.dumps({"type": "mediapipe_coordinates", "data": {"landmarks": landmarks}})
+    float32_frame = encode_landmark_frame(landmarks, seq=1, dtype_code=DTYPE_FLOAT32)
+    int16_frame = encode_landmark_frame(landmarks, seq=1, dtype_code=DTYPE_INT16)
+
+    buffer = new_pose_input_buffer()
+    int16_buffer = np.empty((33, 4), dtype=np.float32)
+
+    def parse_json():
+        message = json.loads(text_frame)
+        return preprocess_landmarks(message["data"]["landmarks"], buffer)
+
+    def parse_float32():
+        _, values = decode_landmark_frame(float32_frame)
+        return preprocess_landmarks(values, buffer)
+
+    def parse_int16():
+        _, values = decode_landmark_frame(int16_frame, out=int16_buffer)
+        return preprocess_landmarks(values, buffer)
+
+    expected = parse_json().copy()
+    assert np.array_equal(expected, parse_float32())
+    max_error = float(np.abs(expected - parse_int16()).max())
+
+    cases = {
+        "json text": (len(text_frame.encode()), parse_json),
+        "binary float32": (len(float32_frame), parse_float32),
+        "binary int16": (len(int16_frame), parse_int16),
+    }
+
+    print(f"frames per run: {args.frames}, runs: {args.repeat}")
+    print(f"int16 max abs quantization error: {max_error:.6f}\n")
+
+    baseline = None
+    for name, (size, func) in cases.items():
+        best = min(timeit.repeat(func, number=args.frames, repeat=args.repeat))
+        per_frame_us = best / args.frames * 1_000_000
+        if baseline is None:
+            baseline = (size, per_frame_us)
+        print(
+            f"{name:<16} {size:6d} bytes (x{baseline[0] / size:.1f} smaller)  "
+            f"{per_frame_us:8.2f} us/frame (x{baseline[1] / per_frame_us:.1f} faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# scripts/benchmark_preprocessing.py
+#
+# 랜드마크 전처리 마이크로 벤치마크 (기존 파이썬 루프 vs 벡터화 경로)
+#
+# 실행: uv run python -m scripts.benchmark_preprocessing [--frames 20000]
+
+import argparse
+import random
+import timeit
+
+import numpy as np
+
+from app.utils import new_pose_input_buffer, preprocess_landmarks, preprocess_pushup, preprocess_squat
+
+
+def make_landmarks() -> list:
+    """클라이언트가 보내는 형태의 33x4 랜드마크 리스트 생성"""
+    return [[random.random(), random.random(), random.uniform(-1, 1), random.random()] for _ in range(33)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="랜드마크 전처리 벤치마크")
+    parser.add_argument("--frames", type=int, default=20000, help="측정할 프레임 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    landmarks = make_landmarks()
+    landmarks_array = np.asarray(landmarks, dtype=np.float32)
+    buffer = new_pose_input_buffer()
+
+    # 결과 동일성 확인
+    expected = preprocess_pushup(landmarks)
+    assert np.array_equal(expected, preprocess_squat(landmarks))
+    assert np.array_equal(expected, preprocess_landmarks(landmarks, buffer))
+    assert np.array_equal(expected, preprocess_landmarks(landmarks_array, buffer))
+
+    cases = {
+        "preprocess_pushup (list)": lambda: preprocess_pushup(landmarks),
+        "preprocess_squat (list)": lambda: preprocess_squat(landmarks),
+        "preprocess_landmarks (list, reused buffer)": lambda: preprocess_landmarks(landmarks, buffer),
+        "preprocess_landmarks (float32 array, reused buffer)": lambda: preprocess_landmarks(landmarks_array, buffer),
+    }
+
+    print(f"frames per run: {args.frames}, runs: {args.repeat}\n")
+    baseline = None
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=args.frames, repeat=args.repeat))
+        per_frame_us = best / args.frames * 1_000_000
+        if baseline is None:
+            baseline = per_frame_us
+        print(f"{name:<52} {per_frame_us:8.2f} us/frame  (x{baseline / per_frame_us:.2f})")
+
+
+if __name__ == "__main__":
+    main()
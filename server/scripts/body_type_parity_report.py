@@ -0,0 +1,172 @@
+# scripts/body_type_parity_report.py
+#
+# 체형 분석 추론 모드별 정확도 일치/지연 시간/메모리 비교 (fp32 기준)
+# 이미지 디렉터리의 하위 디렉터리 이름이 모델 라벨과 같으면 라벨 기준 정확도도 함께 계산한다.
+# 후보 모드의 top-1 일치율이 --min-agreement보다 낮거나 준비에 실패해 fp32로 대체되었으면 종료 코드 1을 반환한다.
+# int8 보정 이미지와 같은 이미지로는 비교하지 않는다 (보정 데이터로 채점하면 정확도가 부풀려짐).
+#
+# 실행: uv run python -m scripts.body_type_parity_report --images <디렉터리> [--modes channels_last,int8]
+#       [--batch-size 8] [--min-agreement 0.98] [--json report.json]
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.services.body_type_inference import INFERENCE_MODES, list_images
+from app.services.body_type_service import BodyTypeService
+
+settings = get_settings()
+
+
+def rss_mb() -> float:
+    """현재 프로세스 상주 메모리 (MB, Linux)"""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def calibration_overlap(paths: list) -> list:
+    """int8 보정에 쓰이는 이미지와 내용이 같은 비교 이미지 목록"""
+    calibration = list_images(settings.body_type_calibration_dir, settings.body_type_calibration_images)
+    calibration_hashes = {hashlib.sha256(path.read_bytes()).hexdigest() for path in calibration}
+    return [path for path in paths if hashlib.sha256(path.read_bytes()).hexdigest() in calibration_hashes]
+
+
+def run_mode(mode: str, pixel_values: list, batch_size: int) -> dict:
+    """모드 하나를 로드해 전체 이미지 확률, 지연 시간, 메모리 증가량 측정"""
+    import torch
+
+    gc.collect()
+    rss_before = rss_mb()
+    service = BodyTypeService(inference_mode=mode)
+    load_start = time.perf_counter()
+    service.ensure_loaded()
+    load_seconds = time.perf_counter() - load_start
+    rss_after = rss_mb()
+
+    probabilities = np.concatenate(
+        [
+            service.predict(torch.cat(pixel_values[start : start + batch_size]))
+            for start in range(0, len(pixel_values), batch_size)
+        ]
+    )
+
+    # 이미지 한 장 / batch_size 묶음 지연 시간 (워밍업 1회 후 중앙값)
+    single = [pixel_values[i % len(pixel_values)] for i in range(min(len(pixel_values), 20))]
+    service.predict(single[0])
+    single_ms = []
+    for tensor in single:
+        start = time.perf_counter()
+        service.predict(tensor)
+        single_ms.append((time.perf_counter() - start) * 1000)
+
+    batch = torch.cat([pixel_values[i % len(pixel_values)] for i in range(batch_size)])
+    batch_ms = []
+    for _ in range(5):
+        start = time.perf_counter()
+        service.predict(batch)
+        batch_ms.append((time.perf_counter() - start) * 1000)
+
+    result = {
+        "mode": mode,
+        # 준비에 실패해 fp32로 대체되었으면 fp32
+        "active_mode": service.active_inference_mode,
+        "load_seconds": round(load_seconds, 2),
+        "rss_increase_mb": round(rss_after - rss_before, 1),
+        "single_image_ms": round(float(np.median(single_ms)), 2),
+        "batch_ms": round(float(np.median(batch_ms)), 2),
+        "batch_per_image_ms": round(float(np.median(batch_ms)) / batch_size, 2),
+        "id2label": service.config.id2label,
+        "probabilities": probabilities,
+    }
+    del service
+    gc.collect()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="체형 분석 추론 모드 정확도/지연 시간 비교")
+    parser.add_argument("--images", required=True, help="비교할 이미지 디렉터리 (하위 디렉터리 이름 = 라벨, 선택)")
+    parser.add_argument("--modes", default="channels_last,int8", help="fp32와 비교할 모드 (쉼표 구분)")
+    parser.add_argument("--batch-size", type=int, default=settings.body_type_batch_max_size, help="배치 크기")
+    parser.add_argument("--min-agreement", type=float, default=0.98, help="허용하는 최소 top-1 일치율")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip() and mode.strip() != "fp32"]
+    unknown = [mode for mode in modes if mode not in INFERENCE_MODES]
+    if unknown:
+        raise SystemExit(f"Unknown modes: {', '.join(unknown)} (expected {', '.join(INFERENCE_MODES)})")
+
+    paths = list_images(args.images)
+    if not paths:
+        raise SystemExit(f"No images in {args.images}")
+
+    if "int8" in modes:
+        overlap = calibration_overlap(paths)
+        if overlap:
+            raise SystemExit(
+                f"{len(overlap)} images in {args.images} are also int8 calibration images "
+                f"({settings.body_type_calibration_dir}), e.g. {overlap[0]} - use a held-out image set"
+            )
+
+    # 전처리는 모드와 무관하므로 한 번만 수행
+    preprocessor = BodyTypeService(inference_mode="fp32")
+    preprocessor.ensure_loaded()
+    pixel_values = [preprocessor.preprocess(path.read_bytes())[0] for path in paths]
+    labels = [path.parent.relative_to(args.images).as_posix() for path in paths]
+    del preprocessor
+    gc.collect()
+
+    reference = run_mode("fp32", pixel_values, args.batch_size)
+    reference_probabilities = reference["probabilities"]
+    reference_top1 = reference_probabilities.argmax(axis=1)
+    label_names = set(reference["id2label"].values())
+    labeled = [i for i, label in enumerate(labels) if label in label_names]
+
+    rows = []
+    failed = False
+    for result in [reference] + [run_mode(mode, pixel_values, args.batch_size) for mode in modes]:
+        probabilities = result.pop("probabilities")
+        id2label = result.pop("id2label")
+        top1 = probabilities.argmax(axis=1)
+        result["images"] = len(paths)
+        result["top1_agreement"] = round(float((top1 == reference_top1).mean()), 4)
+        result["max_prob_diff"] = round(float(np.abs(probabilities - reference_probabilities).max()), 4)
+        result["mean_prob_diff"] = round(float(np.abs(probabilities - reference_probabilities).mean()), 5)
+        if labeled:
+            correct = sum(id2label[int(top1[i])] == labels[i] for i in labeled)
+            result["label_accuracy"] = round(correct / len(labeled), 4)
+        if result["top1_agreement"] < args.min_agreement:
+            failed = True
+        # 준비에 실패해 fp32로 대체된 모드는 fp32와 일치하므로 일치율만으로는 통과해 버림
+        if result["active_mode"] != result["mode"]:
+            failed = True
+        rows.append(result)
+
+    print(f"images: {len(paths)} (labeled: {len(labeled)}), batch size: {args.batch_size}\n")
+    columns = ["mode", "active_mode", "top1_agreement", "label_accuracy", "max_prob_diff"]
+    columns += ["single_image_ms", "batch_per_image_ms", "rss_increase_mb", "load_seconds"]
+    print(" ".join(f"{column:>18}" for column in columns))
+    for row in rows:
+        print(" ".join(f"{str(row.get(column, '-')):>18}" for column in columns))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+    if failed:
+        print(
+            f"\nTop-1 agreement below {args.min_agreement} or fell back to fp32 for at least one mode", file=sys.stderr
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
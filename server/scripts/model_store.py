@@ -0,0 +1,59 @@
+# scripts/model_store.py
+#
+# 모델 아티팩트 저장소 관리 CLI
+# 이미지 빌드 시 fetch로 미리 받아 두면 컨테이너 시작 시 네트워크 없이 로컬 아티팩트에서 모델을 로드한다.
+#
+# 실행: uv run python -m scripts.model_store fetch [body_type] [--revision <커밋>] [--force]
+#       uv run python -m scripts.model_store verify [body_type]
+#       uv run python -m scripts.model_store adopt body_type <기존 모델 디렉터리>
+#       uv run python -m scripts.model_store status
+
+import argparse
+import json
+import sys
+
+from app.services.model_store import MODEL_ARTIFACTS, ModelArtifactError, model_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 아티팩트 저장소 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="Hugging Face에서 내려받아 manifest 생성")
+    fetch_parser.add_argument("names", nargs="*", default=list(MODEL_ARTIFACTS), help="아티팩트 이름")
+    fetch_parser.add_argument("--revision", help="커밋 해시 (기본값: BODY_TYPE_MODEL_REVISION)")
+    fetch_parser.add_argument("--force", action="store_true", help="검증된 아티팩트가 있어도 다시 내려받기")
+
+    verify_parser = subparsers.add_parser("verify", help="manifest 기준 크기/sha256 검증")
+    verify_parser.add_argument("names", nargs="*", default=list(MODEL_ARTIFACTS), help="아티팩트 이름")
+
+    adopt_parser = subparsers.add_parser("adopt", help="기존 모델 디렉터리를 아티팩트로 등록")
+    adopt_parser.add_argument("name", help="아티팩트 이름")
+    adopt_parser.add_argument("source", help="모델 디렉터리")
+    adopt_parser.add_argument("--revision", default="local", help="manifest에 기록할 리비전")
+
+    subparsers.add_parser("status", help="아티팩트별 manifest 요약")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "fetch":
+            for name in args.names:
+                path = model_store.fetch(name, revision=args.revision, force=args.force)
+                print(f"{name}: {path}")
+        elif args.command == "verify":
+            for name in args.names:
+                manifest = model_store.verify(name, checksums=True)
+                print(f"{name}: OK ({len(manifest['files'])} files, revision {manifest['revision']})")
+        elif args.command == "adopt":
+            path = model_store.adopt(args.name, args.source, revision=args.revision)
+            print(f"{args.name}: {path}")
+        else:
+            print(json.dumps(model_store.get_stats(), indent=2))
+    except ModelArtifactError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
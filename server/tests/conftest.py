@@ -0,0 +1,58 @@
+# tests/conftest.py
+#
+# 설정은 import 시점에 읽으므로 app을 import하기 전에 테스트용 SQLite DB를 지정한다.
+
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="workout-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/test.db")
+os.environ.setdefault("GOOGLE_CLIENT_ID", "test-client-id")
+os.environ.setdefault("GOOGLE_CLIENT_SECRET", "test-client-secret")
+os.environ.setdefault("MODEL_WARMUP", "")
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.database import Base, engine
+from app.models.exercise import ExerciseModel
+from app.models.exercise_category import ExerciseCategoryModel
+from app.models.exercise_level import ExerciseLevelModel
+from app.models.socket_session import SocketSessionModel
+from app.models.user import UserModel
+from app.models.user_exercise import UserExerciseModel  # noqa: F401 - UserModel 관계 대상
+from app.models.workout_session import WorkoutSessionModel
+
+
+@pytest.fixture
+def workout_session():
+    """운동 중(active)인 세션 하나와 소켓 세션을 만든 새 DB - (session_id, user_id, socket_session_id) 반환"""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        db.add(UserModel(user_id=1, email="tester@example.com", name="tester"))
+        db.add(ExerciseCategoryModel(category_id=1, name="근력"))
+        db.add(ExerciseModel(exercise_id=1, name="푸쉬업", calorie=0.5, category_id=1))
+        db.add(ExerciseLevelModel(level_id=1, exercise_id=1, level=1, target_sets=3, target_reps=5))
+        db.flush()
+
+        session = WorkoutSessionModel(
+            session_id=1,
+            user_id=1,
+            exercise_id=1,
+            level_id=1,
+            status="active",
+            start_time=datetime.utcnow(),
+        )
+        session.socket_session = SocketSessionModel(
+            socket_session_id="socket-1", user_id=1, connection_status="connected"
+        )
+        db.add(session)
+        db.commit()
+
+    yield 1, 1, "socket-1"
+
+    Base.metadata.drop_all(engine)
@@ -0,0 +1,97 @@
+# tests/test_body_type_inference.py
+#
+# 체형 분석 추론 실행기 런타임 경로 (배치 구간 패딩, fp32 대비 일치) - torch가 없는 환경에서는 건너뜀
+
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from app.services.body_type_inference import EagerRunner, QuantizedRunner
+
+IMAGE_SHAPE = (3, 32, 32)
+NUM_LABELS = 4
+
+
+class TinyClassifier(torch.nn.Module):
+    """Hugging Face 이미지 분류 모델처럼 pixel_values를 받아 .logits를 반환하는 작은 CNN"""
+
+    def __init__(self):
+        super().__init__()
+        self.features = torch.nn.Sequential(
+            torch.nn.Conv2d(3, 8, 3, padding=1),
+            torch.nn.ReLU(),
+            torch.nn.Conv2d(8, 16, 3, padding=1),
+            torch.nn.ReLU(),
+            torch.nn.AdaptiveAvgPool2d(1),
+            torch.nn.Flatten(),
+        )
+        self.classifier = torch.nn.Linear(16, NUM_LABELS)
+
+    def forward(self, pixel_values):
+        return SimpleNamespace(logits=self.classifier(self.features(pixel_values)))
+
+
+@pytest.fixture(scope="module")
+def model():
+    torch.manual_seed(0)
+    return TinyClassifier().eval()
+
+
+@pytest.fixture(scope="module")
+def quantized(model):
+    import torch._inductor.config as inductor_config
+
+    freezing = inductor_config.freezing
+    calibration_inputs = [torch.randn(1, *IMAGE_SHAPE) for _ in range(16)]
+    runner = QuantizedRunner(model, calibration_inputs, batch_size=4)
+
+    # freezing은 실행기를 만드는 동안에만 켜짐
+    assert inductor_config.freezing == freezing
+    return runner
+
+
+def test_quantized_runner_buckets(quantized):
+    assert quantized.bucket_sizes == [1, 2, 4]
+    assert [quantized.bucket_for(rows) for rows in (1, 2, 3, 4)] == [1, 2, 4, 4]
+
+
+@pytest.mark.parametrize("rows", [1, 2, 3, 4, 5, 7, 9])
+def test_quantized_runner_padding_does_not_change_rows(quantized, rows):
+    """구간까지 0으로 채우고 나눠 실행해도 이미지별 결과는 한 장씩 실행한 결과와 같음"""
+    torch.manual_seed(rows)
+    pixel_values = torch.randn(rows, *IMAGE_SHAPE)
+
+    with torch.no_grad():
+        batched = quantized(pixel_values)
+        single = torch.cat([quantized(pixel_values[i : i + 1]) for i in range(rows)])
+
+    assert batched.shape == (rows, NUM_LABELS)
+    torch.testing.assert_close(batched, single, atol=1e-4, rtol=1e-4)
+
+
+def test_quantized_runner_parity_with_fp32(model, quantized):
+    """int8 결과가 fp32 결과와 크게 다르지 않음"""
+    torch.manual_seed(1)
+    pixel_values = torch.randn(8, *IMAGE_SHAPE)
+
+    with torch.no_grad():
+        reference = model(pixel_values).logits
+        logits = quantized(pixel_values)
+
+    assert (logits - reference).abs().max() <= 0.1 * reference.abs().max() + 1e-3
+
+
+def test_channels_last_runner_parity_with_fp32(model):
+    torch.manual_seed(2)
+    pixel_values = torch.randn(3, *IMAGE_SHAPE)
+    # channels_last 변환은 모델을 제자리에서 바꾸므로 복사본 사용
+    runner = EagerRunner(copy.deepcopy(model), channels_last=True)
+
+    with torch.no_grad():
+        reference = model(pixel_values).logits
+        logits = runner(pixel_values)
+
+    torch.testing.assert_close(logits, reference, atol=1e-5, rtol=1e-4)
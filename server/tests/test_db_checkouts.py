@@ -0,0 +1,69 @@
+# tests/test_db_checkouts.py
+#
+# 주요 REST 요청이 요청당 DB 커넥션 체크아웃 한도(X-DB-Checkouts)를 넘지 않는지 확인
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.auth import create_access_token
+from app.core.config import get_settings
+from app.core.database import Base, engine
+from app.main import app
+from app.models.exercise_level import ExerciseLevelModel
+from app.models.user import UserModel
+
+settings = get_settings()
+
+EMAIL = "checkouts@example.com"
+
+
+@pytest.fixture
+def api_client():
+    """시드 카탈로그가 적재된 새 DB와 로그인한 사용자의 TestClient - (client, exercise_id) 반환"""
+    Base.metadata.drop_all(engine)
+
+    # 앱 시작 단계에서 테이블 생성과 시드 데이터 적재
+    with TestClient(app) as client:
+        with Session(engine) as db:
+            db.add(UserModel(user_id=1, email=EMAIL, name="checkouts"))
+            db.commit()
+            exercise_id = db.scalars(
+                select(ExerciseLevelModel.exercise_id).where(ExerciseLevelModel.level == 1).limit(1)
+            ).one()
+
+        client.headers["Authorization"] = f"Bearer {create_access_token({'sub': EMAIL})}"
+        yield client, exercise_id
+
+    Base.metadata.drop_all(engine)
+
+
+def assert_checkouts_within_limit(response):
+    assert response.status_code == 200, response.text
+    assert int(response.headers["X-DB-Checkouts"]) <= settings.db_max_checkouts_per_request
+
+
+def test_start_workout_checkouts(api_client):
+    client, exercise_id = api_client
+
+    response = client.post("/v1/workouts/start", json={"exercise_id": exercise_id, "level": 1})
+    assert_checkouts_within_limit(response)
+    assert response.json()["socket_session_id"]
+
+    # 진행 중인 세션이 있을 때 같은 세션을 돌려주는 경로
+    retry = client.post("/v1/workouts/start", json={"exercise_id": exercise_id, "level": 1})
+    assert_checkouts_within_limit(retry)
+    assert retry.json()["session_id"] == response.json()["session_id"]
+
+
+def test_home_checkouts(api_client):
+    client, _ = api_client
+
+    assert_checkouts_within_limit(client.get("/v1/home/"))
+
+
+def test_exercise_detail_checkouts(api_client):
+    client, exercise_id = api_client
+
+    assert_checkouts_within_limit(client.get(f"/v1/exercises/{exercise_id}"))
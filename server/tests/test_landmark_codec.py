@@ -0,0 +1,81 @@
+# tests/test_landmark_codec.py
+
+import numpy as np
+import pytest
+
+from app.websockets.landmark_codec import (
+    DEFAULT_INT16_SCALE,
+    DTYPE_INT16,
+    FRAME_HEADER,
+    LandmarkFrameError,
+    decode_landmark_frame,
+    encode_landmark_frame,
+)
+
+
+@pytest.fixture
+def landmarks():
+    rng = np.random.default_rng(0)
+    return rng.uniform(-1, 1, size=(33, 4)).astype(np.float32)
+
+
+def test_float32_round_trip(landmarks):
+    seq, decoded = decode_landmark_frame(encode_landmark_frame(landmarks, seq=7))
+
+    assert seq == 7
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, landmarks)
+    # 수신 버퍼를 그대로 참조하는 읽기 전용 뷰
+    assert not decoded.flags.writeable
+
+
+def test_int16_round_trip(landmarks):
+    payload = encode_landmark_frame(landmarks, seq=8, dtype_code=DTYPE_INT16)
+    assert len(payload) == FRAME_HEADER.size + landmarks.size * 2
+
+    out = np.empty_like(landmarks)
+    seq, decoded = decode_landmark_frame(payload, out=out)
+
+    assert seq == 8
+    # 복원 결과는 주어진 버퍼에 기록
+    assert decoded is out
+    np.testing.assert_allclose(decoded, landmarks, atol=DEFAULT_INT16_SCALE / 2 + 1e-7)
+
+
+def replace_header(payload: bytes, **fields) -> bytes:
+    names = ("magic", "version", "dtype_code", "points", "dims", "seq", "scale")
+    values = dict(zip(names, FRAME_HEADER.unpack_from(payload)))
+    values.update(fields)
+    return FRAME_HEADER.pack(*(values[name] for name in names)) + payload[FRAME_HEADER.size :]
+
+
+@pytest.mark.parametrize(
+    ("fields", "message"),
+    [
+        ({"magic": b"XX"}, "magic"),
+        ({"version": 2}, "version"),
+        ({"dtype_code": 9}, "dtype"),
+    ],
+)
+def test_invalid_header_is_rejected(landmarks, fields, message):
+    with pytest.raises(LandmarkFrameError, match=message):
+        decode_landmark_frame(replace_header(encode_landmark_frame(landmarks), **fields))
+
+
+@pytest.mark.parametrize("size", [0, FRAME_HEADER.size - 1, FRAME_HEADER.size, FRAME_HEADER.size + 33 * 4 * 4 - 1])
+def test_truncated_frame_is_rejected(landmarks, size):
+    with pytest.raises(LandmarkFrameError):
+        decode_landmark_frame(encode_landmark_frame(landmarks)[:size])
+
+
+def test_trailing_bytes_are_rejected(landmarks):
+    with pytest.raises(LandmarkFrameError, match="size"):
+        decode_landmark_frame(encode_landmark_frame(landmarks) + b"\x00")
+
+
+@pytest.mark.parametrize("shape", [(32, 4), (34, 4), (33, 2)])
+def test_wrong_landmark_shape_is_rejected(shape):
+    payload = encode_landmark_frame(np.zeros(shape, dtype=np.float32))
+
+    with pytest.raises(LandmarkFrameError, match="shape"):
+        decode_landmark_frame(payload)
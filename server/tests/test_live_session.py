@@ -0,0 +1,121 @@
+# tests/test_live_session.py
+
+import asyncio
+
+from sqlalchemy import select, update
+
+from app.core.database import session_scope
+from app.models.workout_session import WorkoutSessionModel
+from app.services.live_session import session_progress_writer
+from app.services.pose_analyzer import SessionCounter
+from app.services.workout_service import WorkoutService
+from app.websockets import workout_socket
+
+REP_EVENT = {"type": "pushup_feedback", "data": {"rep_detected": True}}
+
+
+class FakeWebSocket:
+    """전송한 메시지만 기록하는 WebSocket"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def close(self, *args, **kwargs):
+        pass
+
+
+class FakePoseAnalyzer:
+    """TFLite 모델을 로드하지 않는 PoseAnalyzer (세션 카운터만 관리)"""
+
+    def __init__(self):
+        self.session_counters = {}
+
+    async def cleanup_session(self, session_id: int):
+        counter = self.session_counters.pop(session_id, None)
+        if counter is not None:
+            await counter.cleanup()
+
+
+async def load_row(session_id: int) -> WorkoutSessionModel:
+    async with session_scope() as db:
+        result = await db.execute(select(WorkoutSessionModel).where(WorkoutSessionModel.session_id == session_id))
+        return result.scalar_one()
+
+
+async def connect(monkeypatch, socket_session_id: str):
+    """실시간 상태를 로드하고 디스패처가 실행 중인 세션 카운터를 붙인 메시지 핸들러"""
+    monkeypatch.setattr(workout_socket, "PoseAnalyzer", FakePoseAnalyzer)
+    handler = workout_socket.WorkoutMessageHandler(FakeWebSocket(), socket_session_id)
+    assert await handler.load_state()
+
+    counter = SessionCounter(handler.state.session_id, "푸쉬업")
+    handler.pose_analyzer.session_counters[handler.state.session_id] = counter
+    counter.set_services(handler.websocket, handler.state)
+    return handler, counter
+
+
+def test_rep_between_flush_and_pause_is_kept(monkeypatch, workout_session):
+    """pause의 flush 뒤, DB 조회 전에 들어온 반복이 update_from에 덮어써지지 않음"""
+    session_id, _, socket_session_id = workout_session
+    pause_workout = WorkoutService.pause_workout
+
+    async def scenario():
+        handler, counter = await connect(monkeypatch, socket_session_id)
+
+        async def pause_with_rep_in_flight(self, session_id):
+            # flush가 끝난 뒤 일시정지가 DB에 반영되는 사이 반복 이벤트 도착
+            counter._handle_counter_message(REP_EVENT)
+            await asyncio.sleep(0.05)
+            return await pause_workout(self, session_id)
+
+        monkeypatch.setattr(WorkoutService, "pause_workout", pause_with_rep_in_flight)
+
+        response = await handler.handle_message({"type": "workout_pause", "data": {}})
+        assert response["data"]["feedback_message"] == "운동 일시정지"
+
+        await handler.pose_analyzer.cleanup_session(session_id)
+        await session_progress_writer.flush(handler.state)
+        return handler.state, await load_row(session_id)
+
+    state, row = asyncio.run(scenario())
+
+    assert state.status == "paused"
+    assert state.total_reps_completed == 1
+    assert row.status == "paused"
+    assert row.total_reps_completed == 1
+    assert row.current_set_reps == 1
+
+
+def test_flush_adds_deltas_to_concurrent_updates(monkeypatch, workout_session):
+    """write-behind flush가 다른 경로에서 먼저 반영된 증가분을 덮어쓰지 않음"""
+    session_id, _, socket_session_id = workout_session
+
+    async def scenario():
+        handler, counter = await connect(monkeypatch, socket_session_id)
+        handler.state.apply_rep(2)
+        handler.state.apply_failed_rep(1)
+
+        # flush 전에 다른 경로에서 원자적으로 반영된 증가분
+        async with session_scope() as db:
+            await db.execute(
+                update(WorkoutSessionModel)
+                .where(WorkoutSessionModel.session_id == session_id)
+                .values(total_reps_completed=WorkoutSessionModel.total_reps_completed + 1)
+            )
+            await db.commit()
+
+        await session_progress_writer.flush(handler.state)
+        # 변경이 없으면 다시 더하지 않음
+        await session_progress_writer.flush(handler.state)
+        await counter.cleanup()
+        return handler.state, await load_row(session_id)
+
+    state, row = asyncio.run(scenario())
+
+    assert not state.dirty
+    assert row.total_reps_completed == 3
+    assert row.current_set_reps == 2
+    assert row.total_reps_failed == 1
@@ -0,0 +1,143 @@
+# tests/test_workout_service.py
+#
+# 반복/통계 카운터를 원자적 UPDATE로 갱신하는 WorkoutService 경로
+
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from app.core.database import session_scope
+from app.models.exercise_popularity import ExercisePopularityModel
+from app.models.user_exercise import UserExerciseModel
+from app.models.workout_session import WorkoutSessionModel
+from app.services.workout_service import WorkoutService
+
+
+async def set_session(session_id: int, **values):
+    async with session_scope() as db:
+        await db.execute(
+            update(WorkoutSessionModel).where(WorkoutSessionModel.session_id == session_id).values(**values)
+        )
+        await db.commit()
+
+
+def counters(session: WorkoutSessionModel):
+    # RETURNING 결과는 같은 세션의 identity map 객체를 갱신하므로 호출 시점 값으로 복사
+    return session.current_set, session.current_set_reps, session.total_reps_completed
+
+
+async def load_one(model, *criteria):
+    async with session_scope() as db:
+        result = await db.execute(select(model).where(*criteria))
+        return result.scalar_one()
+
+
+def test_complete_rep_rolls_over_at_target_reps(workout_session):
+    """목표 반복수(5)에 도달하면 다음 세트로 넘어가고 현재 세트 반복수는 0으로 초기화"""
+    session_id, _, _ = workout_session
+
+    async def scenario():
+        await set_session(session_id, current_set_reps=3, total_reps_completed=3)
+        async with session_scope() as db:
+            service = WorkoutService(db)
+            before = counters(await service.complete_rep(session_id))
+            rolled = counters(await service.complete_rep(session_id))
+        return before, rolled
+
+    before, rolled = asyncio.run(scenario())
+
+    assert before == (1, 4, 4)
+    assert rolled == (2, 0, 5)
+
+
+def test_complete_rep_on_last_set_completes_workout(workout_session):
+    """마지막 세트의 목표 반복수를 채우면 세트 수가 목표를 넘고 운동 완료 처리가 가능"""
+    session_id, user_id, _ = workout_session
+
+    async def scenario():
+        start_time = datetime.utcnow() - timedelta(seconds=60)
+        await set_session(session_id, start_time=start_time, current_set=3, current_set_reps=4, total_reps_completed=14)
+        async with session_scope() as db:
+            service = WorkoutService(db)
+            session = await service.complete_rep(session_id)
+            progress = counters(session) + (session.duration_seconds,)
+            result = await service.complete_workout(session_id)
+        return (
+            progress,
+            result,
+            await load_one(WorkoutSessionModel, WorkoutSessionModel.session_id == session_id),
+            await load_one(UserExerciseModel, UserExerciseModel.user_id == user_id),
+        )
+
+    (current_set, current_set_reps, total_reps, duration_seconds), result, row, stats = asyncio.run(scenario())
+
+    # 3세트 목표 달성 - current_set이 target_sets(3)를 넘음
+    assert (current_set, current_set_reps, total_reps) == (4, 0, 15)
+    # 운동 시간은 UPDATE 안의 SQL 식으로 계산
+    assert 55 <= duration_seconds <= 120
+
+    assert result["total_reps_completed"] == 15
+    assert row.status == "completed"
+    assert row.end_time is not None
+    assert stats.total_sessions == 1
+    assert stats.total_reps_completed == 15
+
+
+def test_manual_subtract_rep_stops_at_zero(workout_session):
+    session_id, _, _ = workout_session
+
+    async def scenario():
+        await set_session(session_id, current_set_reps=1, total_reps_completed=1)
+        async with session_scope() as db:
+            service = WorkoutService(db)
+            first = counters(await service.manual_subtract_rep(session_id))
+            second = counters(await service.manual_subtract_rep(session_id))
+            third = counters(await service.manual_subtract_rep(session_id, reps=3))
+        return first, second, third
+
+    assert asyncio.run(scenario()) == ((1, 0, 0), (1, 0, 0), (1, 0, 0))
+
+
+def test_update_user_exercise_stats_inserts_then_updates(workout_session):
+    """처음 완료하면 통계 행을 추가하고, 이후 완료는 같은 행에 누적 (레벨업 규칙 포함)"""
+    _, user_id, _ = workout_session
+    exercise_id = 1
+
+    async def record(completed_level: int, total_reps: int, duration_seconds: float, experience_points: int):
+        async with session_scope() as db:
+            await WorkoutService(db)._update_user_exercise_stats(
+                user_id, exercise_id, completed_level, total_reps, duration_seconds, experience_points
+            )
+            await db.commit()
+        return await load_one(
+            UserExerciseModel, UserExerciseModel.user_id == user_id, UserExerciseModel.exercise_id == exercise_id
+        )
+
+    async def scenario():
+        inserted = await record(1, 10, 30.5, 5)
+        inserted = (inserted.user_exercise_id, inserted.total_sessions, inserted.current_level)
+        # 같은 레벨 재완료 - 레벨은 그대로
+        repeated = await record(1, 5, 20.0, 5)
+        repeated = (repeated.user_exercise_id, repeated.total_sessions, repeated.current_level)
+        leveled_up = await record(2, 8, 40.0, 10)
+        popularity = await load_one(ExercisePopularityModel, ExercisePopularityModel.exercise_id == exercise_id)
+        return inserted, repeated, leveled_up, popularity
+
+    inserted, repeated, leveled_up, popularity = asyncio.run(scenario())
+
+    user_exercise_id = inserted[0]
+    assert inserted == (user_exercise_id, 1, 2)
+    assert repeated == (user_exercise_id, 2, 2)
+
+    assert leveled_up.user_exercise_id == user_exercise_id
+    assert leveled_up.total_sessions == 3
+    assert leveled_up.total_reps_completed == 23
+    assert leveled_up.total_time_exercised == 30 + 20 + 40
+    assert leveled_up.total_experience_points == 20
+    assert leveled_up.highest_completed_level == 2
+    assert leveled_up.current_level == 3
+
+    # 새 사용자는 처음 한 번만 집계
+    assert popularity.user_count == 1
+    assert popularity.session_count == 3